@@ -0,0 +1,143 @@
+"""Per-course depth, height and slack over the prerequisite graph.
+
+* The depth of a course is the earliest semester it can be taken in,
+  counting the AP/Transfer column as semester 0. A course with no
+  prerequisites has depth 0.
+* The height of a course is the number of courses in the longest chain
+  of courses that depend on it.
+* The slack of a course against a target semester is how many
+  semesters it can be delayed without pushing its dependents past the
+  target. Courses with zero slack are on the critical path.
+
+Everything is computed once per catalog, in one topological sweep of a
+CatalogIndex, and reused for every query.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+
+class CourseAnalysis:
+    """Depth and height of every course in a catalog.
+
+    Attributes:
+        index (CatalogIndex): The index the analysis was built from.
+        order (list): The integer ids of all courses in topological order.
+        depth (list): The depth of each course, by integer id.
+        height (list): The height of each course, by integer id.
+        by_depth (list): The integer ids sorted by depth.
+        depth_ends (list): by_depth[:depth_ends[s]] holds the courses with
+            depth at most s. Semesters past the deepest course use the
+            last entry.
+    """
+
+    def __init__(self, index):
+        """Analyze a compiled catalog.
+
+        Args:
+            index (CatalogIndex): The integer-indexed catalog.
+
+        Raises:
+            ValueError: If the prerequisites contain a cycle.
+        """
+        self.index = index
+        num_courses = len(index)
+        waiting = [len(reqs) for reqs in index.prerequisites]
+        order = [i for i in range(num_courses) if waiting[i] == 0]
+        depth = [0] * num_courses
+
+        # Kahn's algorithm; depths are final when a course is reached
+        for i in order:
+            for dependent in index.dependents[i]:
+                depth[dependent] = max(depth[dependent], depth[i] + 1)
+                waiting[dependent] -= 1
+                if waiting[dependent] == 0:
+                    order.append(dependent)
+        if len(order) != num_courses:
+            raise ValueError("The prerequisites contain a cycle")
+
+        height = [0] * num_courses
+        for i in reversed(order):
+            for req in index.prerequisites[i]:
+                height[req] = max(height[req], height[i] + 1)
+
+        self.order = order
+        self.depth = depth
+        self.height = height
+        self.by_depth = sorted(range(num_courses), key=depth.__getitem__)
+        self.depth_ends = []
+        for i, course_id in enumerate(self.by_depth):
+            while len(self.depth_ends) < depth[course_id]:
+                self.depth_ends.append(i)
+        self.depth_ends.append(num_courses)
+
+    def candidates(self, semester):
+        """Get the courses deep enough to be taken in a semester.
+
+        Args:
+            semester (int): The semester.
+
+        Returns:
+            list: The integer ids of the courses with depth <= semester.
+        """
+        if semester < 0:
+            return []
+        return self.by_depth[:self.depth_ends[min(semester, len(self.depth_ends) - 1)]]
+
+    def slack(self, course, target_semester):
+        """Get how many semesters a course can slip before the target.
+
+        Args:
+            course (str): The course id.
+            target_semester (int): The last semester of the plan.
+
+        Returns:
+            int: The slack; negative if the target cannot be met.
+        """
+        course_id = self.index.ids[course]
+        return target_semester - self.depth[course_id] - self.height[course_id]
+
+    def critical_courses(self, target_semester):
+        """Get the courses with no slack against a target semester.
+
+        Args:
+            target_semester (int): The last semester of the plan.
+
+        Returns:
+            set: The ids of the courses with slack <= 0.
+        """
+        return {
+            self.index.courses[i] for i in range(len(self.index))
+            if target_semester - self.depth[i] - self.height[i] <= 0
+        }
+
+    def critical_path(self, course):
+        """Get the longest chain of courses passing through a course.
+
+        Ties are broken by course id so the result is stable.
+
+        Args:
+            course (str): The course id.
+
+        Returns:
+            list: The course ids along the chain, first to last.
+        """
+        index = self.index
+        course_id = index.ids[course]
+
+        before = []
+        current = course_id
+        while index.prerequisites[current]:
+            current = max(index.prerequisites[current],
+                          key=lambda i: (self.depth[i], -i))
+            before.append(current)
+
+        after = []
+        current = course_id
+        while self.height[current]:
+            current = min(i for i in index.dependents[current]
+                          if self.height[i] == self.height[current] - 1)
+            after.append(current)
+
+        return [index.courses[i] for i in reversed(before)] + [course] + \
+            [index.courses[i] for i in after]
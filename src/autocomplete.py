@@ -0,0 +1,81 @@
+"""Prefix completion of course ids.
+
+Course ids are kept in a sorted list so the ids starting with a prefix
+form one contiguous run that bisect can find. Matching ignores case and
+spaces, so "cs2" completes to "CS 240".
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import bisect
+
+
+def normalize(text):
+    """Return the form of a course id or prefix used for matching.
+
+    Args:
+        text (str): A course id or the start of one.
+
+    Returns:
+        str: The text in lowercase with spaces removed.
+    """
+    return text.replace(" ", "").lower()
+
+
+class CourseCompleter:
+    """Finds the course ids that start with a typed prefix.
+
+    Attributes:
+        keys (list): The normalized ids, sorted.
+        courses (list): The course id for each entry of keys.
+    """
+
+    def __init__(self, course_ids):
+        """Build the sorted list of ids.
+
+        Args:
+            course_ids (iterable): The course ids to complete.
+        """
+        pairs = sorted((normalize(course), course) for course in course_ids)
+        self.keys = [key for key, _ in pairs]
+        self.courses = [course for _, course in pairs]
+
+    def _range(self, prefix):
+        """Return the slice of keys that start with a normalized prefix."""
+        start = bisect.bisect_left(self.keys, prefix)
+        end = bisect.bisect_left(self.keys, prefix + "\uffff")
+        return start, end
+
+    def complete(self, prefix, limit=20, allowed=None):
+        """Get the first course ids that start with a prefix.
+
+        Args:
+            prefix (str): The text typed so far.
+            limit (int, optional): The most ids to return. Defaults to 20.
+            allowed (collection, optional): If given, only ids in this
+                collection are returned.
+
+        Returns:
+            list: Up to limit matching course ids, in sorted order.
+        """
+        prefix = normalize(prefix)
+        start, end = self._range(prefix)
+        if allowed is None:
+            return self.courses[start:min(end, start + limit)]
+
+        # Walk whichever is smaller: the matching run or the allowed ids
+        if len(allowed) < end - start:
+            matches = sorted(
+                (normalize(course), course) for course in allowed
+                if normalize(course).startswith(prefix)
+            )
+            return [course for _, course in matches[:limit]]
+
+        result = []
+        for i in range(start, end):
+            if self.courses[i] in allowed:
+                result.append(self.courses[i])
+                if len(result) == limit:
+                    break
+        return result
@@ -0,0 +1,203 @@
+"""Incremental tracking of which courses are available in each semester.
+
+available_classes looks at the whole catalog every time it is called.
+When a schedule is being edited one course at a time, almost all of
+that work is repeated. The AvailabilityEngine keeps its answer up to
+date instead: placing, removing or moving a course only revisits the
+courses that list it as a prerequisite.
+
+A course is available in a semester when it is not in the schedule and
+all of its prerequisites are scheduled in some earlier semester, which
+is the same rule used by catalog_utils.available_classes.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import catalog_utils
+
+
+class AvailabilityEngine:
+    """Keeps course availability current as a schedule is edited.
+
+    For every course the engine records the first semester it is
+    scheduled in and the earliest semester its prerequisites allow it
+    to be taken (its "ready" semester). Unscheduled courses are kept in
+    one set per ready semester, so the available courses for semester s
+    are the union of the sets for semesters 0 through s.
+
+    Courses that are not in the catalog are ignored, so unlike
+    available_classes, a course that requires one is never available.
+    """
+
+    def __init__(self, catalog, schedule=None):
+        """Create an engine for a catalog.
+
+        Args:
+            catalog (dict): The dictionary containing course information.
+            schedule (list, optional): The starting schedule. Defaults to
+                an empty schedule.
+        """
+        self.index = catalog_utils.get_index(catalog)
+        self.set_schedule(schedule or [])
+
+    def set_schedule(self, schedule):
+        """Replace the tracked schedule, rebuilding all state.
+
+        Args:
+            schedule (list): The course schedule.
+        """
+        index = self.index
+        self.first = index.placements(schedule)
+        self.placements = {}
+        for sem_num, semester in enumerate(schedule):
+            for course in semester:
+                course_id = index.ids.get(course)
+                if course_id is not None:
+                    self.placements.setdefault(course_id, []).append(sem_num)
+
+        self.ready = [self._compute_ready(i) for i in range(len(index))]
+        self.unlocked = {}
+        for i, ready in enumerate(self.ready):
+            if ready is not None and self.first[i] == -1:
+                self.unlocked.setdefault(ready, set()).add(i)
+
+    def _compute_ready(self, course_id):
+        """Return the earliest semester a course could be taken in.
+
+        Returns None if a prerequisite is missing from the schedule.
+        """
+        if course_id in self.index.blocked:
+            return None
+        ready = 0
+        for req in self.index.prerequisites[course_id]:
+            req_sem = self.first[req]
+            if req_sem == -1:
+                return None
+            ready = max(ready, req_sem + 1)
+        return ready
+
+    def _discard(self, course_id):
+        """Take a course out of the unlocked sets."""
+        ready = self.ready[course_id]
+        if ready is not None:
+            bucket = self.unlocked.get(ready)
+            if bucket is not None:
+                bucket.discard(course_id)
+
+    def _insert(self, course_id):
+        """Put an unscheduled course into its unlocked set."""
+        ready = self.ready[course_id]
+        if ready is not None and self.first[course_id] == -1:
+            self.unlocked.setdefault(ready, set()).add(course_id)
+
+    def _set_first(self, course_id, first):
+        """Record a course's new first semester and update its dependents."""
+        if first == self.first[course_id]:
+            return
+        self._discard(course_id)
+        self.first[course_id] = first
+        self._insert(course_id)
+
+        # Only the courses that require this one can change
+        for dependent in self.index.dependents[course_id]:
+            self._discard(dependent)
+            self.ready[dependent] = self._compute_ready(dependent)
+            self._insert(dependent)
+
+    def add(self, course, semester):
+        """Record that a course has been placed in a semester.
+
+        Args:
+            course (str): The course id.
+            semester (int): The semester the course was placed in.
+        """
+        course_id = self.index.ids.get(course)
+        if course_id is None:
+            return
+        sems = self.placements.setdefault(course_id, [])
+        sems.append(semester)
+        self._set_first(course_id, min(sems))
+
+    def remove(self, course, semester):
+        """Record that a course has been removed from a semester.
+
+        Args:
+            course (str): The course id.
+            semester (int): The semester the course was removed from.
+        """
+        course_id = self.index.ids.get(course)
+        if course_id is None:
+            return
+        sems = self.placements.get(course_id)
+        if not sems or semester not in sems:
+            return
+        sems.remove(semester)
+        if not sems:
+            del self.placements[course_id]
+        self._set_first(course_id, min(sems) if sems else -1)
+
+    def move(self, course, old_semester, new_semester):
+        """Record that a course has moved from one semester to another.
+
+        Args:
+            course (str): The course id.
+            old_semester (int): The semester the course was in.
+            new_semester (int): The semester the course is now in.
+        """
+        self.remove(course, old_semester)
+        self.add(course, new_semester)
+
+    def reindex(self, index, courses):
+        """Switch to a rebuilt index after some courses were edited.
+
+        The new index must number the courses the same way, i.e. no
+        courses were added or removed. Only the edited courses are
+        rechecked.
+
+        Args:
+            index (CatalogIndex): The rebuilt index.
+            courses (iterable): The ids of the edited courses.
+        """
+        self.index = index
+        for course in courses:
+            course_id = index.ids[course]
+            self._discard(course_id)
+            self.ready[course_id] = self._compute_ready(course_id)
+            self._insert(course_id)
+
+    def available_by_semester(self, num_semesters):
+        """Get the available courses for several semesters at once.
+
+        Args:
+            num_semesters (int): The number of semesters to report.
+
+        Returns:
+            list: One set of available course ids per semester.
+        """
+        courses = self.index.courses
+        by_semester = []
+        classes = set()
+        for ready in range(num_semesters):
+            bucket = self.unlocked.get(ready)
+            if bucket:
+                classes.update(courses[i] for i in bucket)
+            by_semester.append(set(classes))
+        return by_semester
+
+    def available(self, semester):
+        """Get the courses available in a semester.
+
+        Args:
+            semester (int): The semester to check.
+
+        Returns:
+            set: The ids of the available courses.
+        """
+        courses = self.index.courses
+        classes = set()
+        for ready in range(semester + 1):
+            bucket = self.unlocked.get(ready)
+            if bucket:
+                classes.update(courses[i] for i in bucket)
+        return classes
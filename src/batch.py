@@ -0,0 +1,112 @@
+"""Validate many schedules at once across a pool of processes.
+
+Each schedule is checked the same way as the GUI's "Check Schedule"
+button: for duplicate courses (schedule_utils.get_duplicates) and for
+courses with unmet prerequisites (catalog_utils.check_prerequisites).
+
+The catalog is handed to each worker process once, when the worker
+starts, rather than with every schedule. When the catalog is given as
+a filename, the workers load it from the compiled catalog cache.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import multiprocessing
+import os
+
+import catalog_cache
+import catalog_utils
+import schedule_utils
+
+# The catalog used by this worker process
+_worker_catalog = None
+
+
+def check_schedule(schedule, catalog):
+    """Check a single schedule for problems.
+
+    Args:
+        schedule (list): The course schedule.
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        dict: The sorted "duplicates" and "unmet" course lists, and
+            whether the schedule is "valid".
+    """
+    dups = schedule_utils.get_duplicates(schedule)
+    unmet = catalog_utils.check_prerequisites(schedule, catalog)
+    return {
+        "duplicates": sorted(dups),
+        "unmet": sorted(unmet),
+        "valid": len(dups) == 0 and len(unmet) == 0,
+    }
+
+
+def _check_item(position, item, catalog):
+    """Load (if needed) and check one schedule, capturing any error."""
+    source = os.fspath(item) if isinstance(item, (str, os.PathLike)) else None
+    result = {"index": position, "source": source}
+    try:
+        schedule = schedule_utils.load_schedule(source) if source is not None else item
+        result.update(check_schedule(schedule, catalog))
+    except (OSError, ValueError, KeyError, TypeError) as error:
+        result["error"] = f"{type(error).__name__}: {error}"
+    return result
+
+
+def _load_catalog(catalog):
+    """Accept either a catalog or the filename of one."""
+    if isinstance(catalog, (str, os.PathLike)):
+        return catalog_cache.load_compiled_catalog(os.fspath(catalog))
+    return catalog
+
+
+def _init_worker(catalog):
+    global _worker_catalog
+    _worker_catalog = _load_catalog(catalog)
+
+
+def _check_task(task):
+    position, item = task
+    return _check_item(position, item, _worker_catalog)
+
+
+def validate_schedules(schedules, catalog, processes=None, chunksize=8):
+    """Validate schedules in parallel, yielding results as they finish.
+
+    Results arrive in completion order, not input order; use the
+    "index" of each result to match it to its input. A schedule that
+    cannot be loaded or refers to an unknown course produces a result
+    with an "error" message instead of the check fields.
+
+    Args:
+        schedules (iterable): Schedule filenames and/or schedules
+            (lists of sets).
+        catalog (dict or str): The catalog, or the filename of a catalog
+            JSON file.
+        processes (int, optional): The number of worker processes.
+            Defaults to the number of CPUs. With 1, schedules are
+            checked in this process.
+        chunksize (int, optional): The number of schedules sent to a
+            worker at a time. Defaults to 8.
+
+    Yields:
+        dict: The "index" and "source" filename (or None) of a schedule,
+            plus either the fields from check_schedule or an "error".
+    """
+    if processes is None:
+        processes = os.cpu_count() or 1
+
+    if processes == 1:
+        catalog = _load_catalog(catalog)
+        for position, item in enumerate(schedules):
+            yield _check_item(position, item, catalog)
+        return
+
+    if isinstance(catalog, (str, os.PathLike)):
+        # Compile once up front so every worker gets a warm cache hit
+        catalog_cache.load_compiled_catalog(os.fspath(catalog))
+
+    with multiprocessing.Pool(processes, _init_worker, (catalog,)) as pool:
+        yield from pool.imap_unordered(_check_task, enumerate(schedules), chunksize)
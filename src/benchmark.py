@@ -0,0 +1,333 @@
+"""Benchmarks of the catalog and schedule functions on synthetic catalogs.
+
+Each benchmark is run on generated catalogs of several sizes and the
+best of a few runs is recorded. Benchmarks of functions that cache
+results on the Catalog come in two variants: the plain name clears the
+caches before every run (cold), and the _warm variant builds the index
+and fills the caches with an untimed run first, so it only measures
+cache hits. Results can be saved as a JSON baseline and later runs
+compared against it to catch slowdowns.
+
+Examples:
+    python3 src/benchmark.py run --sizes 100 1000 10000 --output base.json
+    python3 src/benchmark.py run --compare base.json
+    python3 src/benchmark.py compare base.json new.json --threshold 1.5
+    python3 src/benchmark.py generate 5000 big_catalog.json
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import argparse
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+
+import catalog_utils
+import schedule_utils
+import synthetic
+
+DEFAULT_SIZES = (100, 1000, 10000, 100000)
+
+# How many courses format_course_info is run on
+FORMAT_SAMPLE = 100
+
+
+def bench_load_catalog(ctx):
+    return lambda: catalog_utils.load_catalog(ctx["filename"])
+
+
+def bench_get_dependencies(ctx):
+    return lambda: catalog_utils.get_dependencies(ctx["deepest"], ctx["catalog"])
+
+
+def bench_format_course_info(ctx):
+    catalog = ctx["catalog"]
+    courses = ctx["sample"]
+
+    def run():
+        for course in courses:
+            catalog_utils.format_course_info(course, catalog)
+    return run
+
+
+def bench_available_classes(ctx):
+    schedule = ctx["schedule"]
+    return lambda: catalog_utils.available_classes(
+        schedule, len(schedule) - 1, ctx["catalog"]
+    )
+
+
+def bench_check_prerequisites(ctx):
+    return lambda: catalog_utils.check_prerequisites(ctx["schedule"], ctx["catalog"])
+
+
+def bench_total_credits(ctx):
+    return lambda: catalog_utils.total_credits(ctx["schedule"], ctx["catalog"])
+
+
+def bench_get_duplicates(ctx):
+    return lambda: schedule_utils.get_duplicates(ctx["schedule"])
+
+
+COLD = "cold"
+WARM = "warm"
+
+# Each entry builds the function to time from the shared context, and
+# says whether the catalog's caches are cleared before every run (COLD),
+# filled by an untimed run first (WARM), or not used (None)
+BENCHMARKS = {
+    "load_catalog": (bench_load_catalog, None),
+    "get_dependencies": (bench_get_dependencies, COLD),
+    "format_course_info": (bench_format_course_info, COLD),
+    "format_course_info_warm": (bench_format_course_info, WARM),
+    "available_classes": (bench_available_classes, COLD),
+    "available_classes_warm": (bench_available_classes, WARM),
+    "check_prerequisites": (bench_check_prerequisites, COLD),
+    "check_prerequisites_warm": (bench_check_prerequisites, WARM),
+    "total_credits": (bench_total_credits, COLD),
+    "total_credits_warm": (bench_total_credits, WARM),
+    "get_duplicates": (bench_get_duplicates, None),
+}
+
+
+def best_time(func, repeat, setup=None):
+    """Return the shortest of several timed calls, in seconds.
+
+    Args:
+        func (function): The function to time.
+        repeat (int): The number of calls.
+        setup (function, optional): Called before each call, untimed.
+
+    Returns:
+        float: The shortest call.
+    """
+    best = float("inf")
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def time_benchmark(name, ctx, repeat):
+    """Time one benchmark, preparing the catalog's caches for its variant.
+
+    Args:
+        name (str): A key of BENCHMARKS.
+        ctx (dict): The result of build_context.
+        repeat (int): Runs; the best is kept.
+
+    Returns:
+        float: The best time, in seconds.
+    """
+    builder, variant = BENCHMARKS[name]
+    func = builder(ctx)
+    setup = None
+    if variant == COLD:
+        setup = ctx["catalog"].invalidate
+    elif variant == WARM:
+        # total_credits only uses an index that already exists
+        catalog_utils.get_index(ctx["catalog"])
+        func()
+    return best_time(func, repeat, setup)
+
+
+def build_context(filename, seed=0):
+    """Load a generated catalog and pick the inputs the benchmarks use.
+
+    Args:
+        filename (str): The catalog file.
+        seed (int, optional): The seed for the schedule.
+
+    Returns:
+        dict: The "filename", "catalog", "schedule", "deepest" course
+            (the one with the greatest depth) and a "sample" of courses
+            for format_course_info.
+    """
+    catalog = catalog_utils.load_catalog(filename)
+    courses = sorted(catalog)
+    index = catalog_utils.get_index(catalog)
+    depth = catalog_utils.get_analysis(catalog).depth
+    return {
+        "filename": filename,
+        "catalog": catalog,
+        "schedule": synthetic.generate_schedule(catalog, seed=seed),
+        "deepest": index.courses[max(range(len(index)), key=depth.__getitem__)],
+        "sample": courses[::max(1, len(courses) // FORMAT_SAMPLE)],
+    }
+
+
+def run_benchmarks(sizes=DEFAULT_SIZES, depth=8, fan_in=3, seed=0, repeat=3,
+                   names=None, progress=None):
+    """Time every benchmark on a generated catalog of each size.
+
+    Args:
+        sizes (iterable, optional): Catalog sizes to run.
+        depth (int, optional): Passed to synthetic.generate_catalog.
+        fan_in (int, optional): Passed to synthetic.generate_catalog.
+        seed (int, optional): The seed for the catalogs and schedules.
+        repeat (int, optional): Runs per benchmark; the best is kept.
+        names (iterable, optional): The benchmarks to run. Defaults to
+            all of them.
+        progress (function, optional): Called with (size, name,
+            seconds) after each benchmark.
+
+    Returns:
+        dict: The results, with "meta" describing the run and
+            "results" mapping each size (as a string) to the seconds
+            taken by each benchmark.
+    """
+    names = list(names or BENCHMARKS)
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in sizes:
+            raw = synthetic.generate_catalog(size, depth, fan_in, seed)
+            filename = os.path.join(tmp, f"catalog_{size}.json")
+            synthetic.write_catalog(raw, filename)
+            ctx = build_context(filename, seed)
+
+            timings = {}
+            for name in names:
+                timings[name] = time_benchmark(name, ctx, repeat)
+                if progress is not None:
+                    progress(size, name, timings[name])
+            results[str(size)] = timings
+
+    meta = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "depth": depth,
+        "fan_in": fan_in,
+        "seed": seed,
+        "repeat": repeat,
+    }
+    return {"meta": meta, "results": results}
+
+
+def compare_results(baseline, current, threshold=1.25, min_seconds=0.001):
+    """Find benchmarks that got slower than a baseline.
+
+    Only benchmarks present in both runs are compared. Timings below
+    min_seconds in both runs are too noisy to judge and are skipped.
+
+    Args:
+        baseline (dict): Results from run_benchmarks.
+        current (dict): Results from run_benchmarks.
+        threshold (float, optional): The slowdown ratio that counts as
+            a regression. Defaults to 1.25.
+        min_seconds (float, optional): Defaults to 0.001.
+
+    Returns:
+        list: One dict per regression with "size", "benchmark",
+            "baseline", "current" and "ratio".
+    """
+    regressions = []
+    for size, timings in current["results"].items():
+        old_timings = baseline["results"].get(size, {})
+        for name, seconds in timings.items():
+            old = old_timings.get(name)
+            if old is None or max(old, seconds) < min_seconds:
+                continue
+            ratio = seconds / old if old > 0 else float("inf")
+            if ratio > threshold:
+                regressions.append({
+                    "size": int(size),
+                    "benchmark": name,
+                    "baseline": old,
+                    "current": seconds,
+                    "ratio": ratio,
+                })
+    return regressions
+
+
+def print_progress(size, name, seconds):
+    print(f"{size:>8} {name:<22} {seconds * 1000:12.3f} ms", flush=True)
+
+
+def report_regressions(regressions, out):
+    """Print the regressions and return the exit status."""
+    for item in regressions:
+        out.write(
+            f"REGRESSION {item['size']:>8} {item['benchmark']:<22} "
+            f"{item['baseline'] * 1000:.3f} ms -> {item['current'] * 1000:.3f} ms "
+            f"(x{item['ratio']:.2f})\n"
+        )
+    return 1 if regressions else 0
+
+
+def load_results(filename):
+    with open(filename) as file:
+        return json.load(file)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        description="Benchmark the catalog functions on synthetic catalogs."
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run = commands.add_parser("run", help="run the benchmarks")
+    run.add_argument("--sizes", type=int, nargs="+", default=list(DEFAULT_SIZES))
+    run.add_argument("--depth", type=int, default=8)
+    run.add_argument("--fan-in", type=int, default=3)
+    run.add_argument("--seed", type=int, default=0)
+    run.add_argument("--repeat", type=int, default=3)
+    run.add_argument("--only", nargs="+", choices=sorted(BENCHMARKS),
+                     help="run only these benchmarks")
+    run.add_argument("-o", "--output", help="save the results as JSON")
+    run.add_argument("--compare", metavar="BASELINE",
+                     help="compare against a saved baseline")
+    run.add_argument("--threshold", type=float, default=1.25)
+
+    compare = commands.add_parser("compare", help="compare two saved runs")
+    compare.add_argument("baseline")
+    compare.add_argument("current")
+    compare.add_argument("--threshold", type=float, default=1.25)
+
+    generate = commands.add_parser("generate", help="write a synthetic catalog")
+    generate.add_argument("size", type=int)
+    generate.add_argument("output")
+    generate.add_argument("--depth", type=int, default=8)
+    generate.add_argument("--fan-in", type=int, default=3)
+    generate.add_argument("--seed", type=int, default=0)
+
+    return parser
+
+
+def main(argv=None, out=sys.stdout):
+    args = build_parser().parse_args(argv)
+
+    if args.command == "generate":
+        raw = synthetic.generate_catalog(args.size, args.depth, args.fan_in, args.seed)
+        synthetic.write_catalog(raw, args.output)
+        return 0
+
+    if args.command == "compare":
+        regressions = compare_results(
+            load_results(args.baseline), load_results(args.current), args.threshold
+        )
+        return report_regressions(regressions, out)
+
+    results = run_benchmarks(
+        args.sizes, args.depth, args.fan_in, args.seed, args.repeat,
+        names=args.only, progress=print_progress,
+    )
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(results, file, indent=4)
+    if args.compare:
+        regressions = compare_results(
+            load_results(args.compare), results, args.threshold
+        )
+        return report_regressions(regressions, out)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
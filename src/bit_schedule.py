@@ -0,0 +1,222 @@
+"""A compact, hashable schedule representation.
+
+A schedule is normally a list of sets of course id strings. A
+BitSchedule stores the same information as one int per semester, where
+bit i is set when the course with integer id i (from a CatalogIndex)
+is taken that semester. Unions, intersections and duplicate checks are
+then a few bitwise operations per semester, and since a BitSchedule is
+immutable it can be hashed and used as a dictionary key.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+
+def _bits(mask):
+    """Yield the positions of the set bits of a mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class BitSchedule:
+    """An immutable course schedule stored as one bitmask per semester.
+
+    Two BitSchedules are only comparable if they were built from the
+    same CatalogIndex.
+
+    Attributes:
+        index (CatalogIndex): The index the bits are numbered by.
+        masks (tuple): The courses taken each semester, as int bitmasks.
+    """
+
+    __slots__ = ("index", "masks")
+
+    def __init__(self, index, masks):
+        """Create a schedule from its bitmasks.
+
+        Args:
+            index (CatalogIndex): The index the bits are numbered by.
+            masks (iterable): One int bitmask per semester.
+        """
+        self.index = index
+        self.masks = tuple(masks)
+
+    @classmethod
+    def from_schedule(cls, schedule, index):
+        """Convert a list of sets to a BitSchedule.
+
+        Args:
+            schedule (list): The course schedule.
+            index (CatalogIndex): The index to number the courses by.
+
+        Returns:
+            BitSchedule: The converted schedule.
+
+        Raises:
+            KeyError: If a course is not in the index.
+        """
+        ids = index.ids
+        masks = []
+        for semester in schedule:
+            mask = 0
+            for course in semester:
+                mask |= 1 << ids[course]
+            masks.append(mask)
+        return cls(index, masks)
+
+    @classmethod
+    def from_json(cls, schedule_list, index):
+        """Convert a schedule in the format used by schedule_to_json.
+
+        Args:
+            schedule_list (list): A list of lists of course ids.
+            index (CatalogIndex): The index to number the courses by.
+
+        Returns:
+            BitSchedule: The converted schedule.
+
+        Raises:
+            KeyError: If a course is not in the index.
+        """
+        return cls.from_schedule(schedule_list, index)
+
+    def semester(self, sem_num):
+        """Get the courses taken in one semester.
+
+        Args:
+            sem_num (int): The semester.
+
+        Returns:
+            set: The course ids.
+        """
+        courses = self.index.courses
+        return {courses[i] for i in _bits(self.masks[sem_num])}
+
+    def to_schedule(self):
+        """Convert back to a list of sets.
+
+        Returns:
+            list: The course schedule.
+        """
+        return [self.semester(sem_num) for sem_num in range(len(self.masks))]
+
+    def to_json(self):
+        """Convert to the format returned by schedule_to_json.
+
+        Returns:
+            list: A list of lists with each semester in alphabetical
+                order.
+        """
+        courses = self.index.courses
+        # Integer ids follow the sorted order of the course ids
+        return [[courses[i] for i in _bits(mask)] for mask in self.masks]
+
+    def courses(self):
+        """Get a mask of every course taken in any semester.
+
+        Returns:
+            int: The union of the semester masks.
+        """
+        combined = 0
+        for mask in self.masks:
+            combined |= mask
+        return combined
+
+    def duplicate_mask(self):
+        """Get a mask of the courses taken in more than one semester.
+
+        Returns:
+            int: The duplicated courses as a bitmask.
+        """
+        seen = 0
+        dups = 0
+        for mask in self.masks:
+            dups |= seen & mask
+            seen |= mask
+        return dups
+
+    def duplicates(self):
+        """Get duplicate courses, like schedule_utils.get_duplicates.
+
+        Returns:
+            set: A set of duplicate courses.
+        """
+        courses = self.index.courses
+        return {courses[i] for i in _bits(self.duplicate_mask())}
+
+    def count(self):
+        """Get the number of course placements in the schedule.
+
+        Returns:
+            int: The number of set bits over all semesters.
+        """
+        return sum(mask.bit_count() for mask in self.masks)
+
+    def with_course(self, course, sem_num):
+        """Get a copy of the schedule with a course added to a semester.
+
+        Args:
+            course (str): The course id.
+            sem_num (int): The semester. The schedule is extended with
+                empty semesters if needed.
+
+        Returns:
+            BitSchedule: The new schedule.
+        """
+        masks = list(self.masks)
+        if sem_num >= len(masks):
+            masks.extend([0] * (sem_num + 1 - len(masks)))
+        masks[sem_num] |= 1 << self.index.ids[course]
+        return BitSchedule(self.index, masks)
+
+    def without_course(self, course, sem_num):
+        """Get a copy of the schedule with a course removed from a semester.
+
+        Args:
+            course (str): The course id.
+            sem_num (int): The semester.
+
+        Returns:
+            BitSchedule: The new schedule.
+        """
+        masks = list(self.masks)
+        masks[sem_num] &= ~(1 << self.index.ids[course])
+        return BitSchedule(self.index, masks)
+
+    def _combine(self, other, op):
+        """Apply op semester by semester, padding the shorter schedule."""
+        if not isinstance(other, BitSchedule) or other.index is not self.index:
+            return NotImplemented
+        size = max(len(self.masks), len(other.masks))
+        ours = self.masks + (0,) * (size - len(self.masks))
+        theirs = other.masks + (0,) * (size - len(other.masks))
+        return BitSchedule(self.index, map(op, ours, theirs))
+
+    def __or__(self, other):
+        return self._combine(other, int.__or__)
+
+    def __and__(self, other):
+        return self._combine(other, int.__and__)
+
+    def __sub__(self, other):
+        return self._combine(other, lambda a, b: a & ~b)
+
+    def __contains__(self, course):
+        course_id = self.index.ids.get(course)
+        return course_id is not None and (self.courses() >> course_id) & 1 == 1
+
+    def __len__(self):
+        return len(self.masks)
+
+    def __eq__(self, other):
+        if not isinstance(other, BitSchedule):
+            return NotImplemented
+        return self.index is other.index and self.masks == other.masks
+
+    def __hash__(self):
+        return hash(self.masks)
+
+    def __repr__(self):
+        return f"BitSchedule({self.to_json()!r})"
@@ -4,14 +4,47 @@ Author: CS149 Faculty
 Version: 11/15/2023
 """
 
+import contextlib
+import os
 import tkinter as tk
+from concurrent.futures import ThreadPoolExecutor
 from tkinter import ttk
 from tkinter import filedialog
+from tkinter import messagebox
 import schedule_utils
 import catalog_utils
+import catalog_cache
+import catalog_reload
+import availability
+import autocomplete
+import planner
+import profiling
+import render
+import search
+import sharded_catalog
+import validator
 
 OPTIONS = [""]
 
+# How many matches a course box lists at a time
+MAX_CHOICES = 15
+
+# How often (in ms) to check on work running in the background
+POLL_MS = 25
+
+# How often (in ms) to check whether the catalog file has changed
+CATALOG_POLL_MS = 2000
+
+# Columns of the Performance window: (heading, report field, scale)
+PERF_COLUMNS = (
+    ("Calls", "count", 1),
+    ("Total ms", "total", 1000),
+    ("Mean ms", "mean", 1000),
+    ("p99 ms", "p99", 1000),
+    ("Mean size", "mean_size", 1),
+    ("Max size", "max_size", 1),
+)
+
 
 class App(tk.Tk):
 
@@ -32,6 +65,16 @@ class App(tk.Tk):
         )
         filemenu.add_command(label="Exit", command=self.quit)
         menubar.add_cascade(label="File", menu=filemenu)
+
+        toolsmenu = tk.Menu(menubar, tearoff=0)
+        self.profile_var = tk.BooleanVar(value=profiling.default_profiler.enabled)
+        toolsmenu.add_checkbutton(
+            label="Record Performance",
+            variable=self.profile_var,
+            command=self.toggle_profiling,
+        )
+        toolsmenu.add_command(label="Performance...", command=self.show_performance)
+        menubar.add_cascade(label="Tools", menu=toolsmenu)
         self.config(menu=menubar)
 
         main_frame = ttk.Frame(self)
@@ -44,14 +87,34 @@ class App(tk.Tk):
         )
         self.option_variables = dict()
         self.option_menus = dict()
+        # The last value seen for each schedule cell, and the engine tracking them
+        self.cell_values = dict()
+        self.catalog = None
+        self.engine = None
+        # Nothing can be scheduled until a catalog is loaded
+        self.checker = validator.ScheduleValidator({})
+        # Called once the engine being built on the worker thread is ready
+        self.engine_waiters = []
+        # The courses each box accepts, and the completer used to list them
+        self.allowed = dict()
+        self.completer = None
+        # Recomputing is deferred while suspended and coalesced via after_idle
+        self.suspend_count = 0
+        self.refresh_needed = False
+        self.refresh_scheduled = False
+        # Slow work runs on one worker thread; only the newest task per key counts
+        self.executor = ThreadPoolExecutor(max_workers=1)
+        self.tasks = dict()
+        self.progress_count = 0
+        # The catalog file is reloaded in place when its mtime changes
+        self.catalog_file = None
+        self.catalog_mtime = None
+        self.after(CATALOG_POLL_MS, self.poll_catalog)
 
         variable = tk.StringVar(course_info_frame, name="var_info")
         variable.set("")  # default value
         self.option_variables["var_info"] = variable
-        self.option_menus["var_info"] = tk.OptionMenu(
-            course_info_frame, variable, *OPTIONS
-        )
-        self.option_menus["var_info"].config(width=6)
+        self.option_menus["var_info"] = self.make_course_box(course_info_frame, "var_info")
         self.option_menus["var_info"].pack(side=tk.LEFT, padx=5)
         self.option_variables["var_info"].trace("w", self.info_option_selected)
         self.get_info_button = ttk.Button(
@@ -62,6 +125,20 @@ class App(tk.Tk):
         )
         self.get_info_button.pack(side=tk.LEFT, padx=5)
 
+        self.search_var = tk.StringVar()
+        self.search_entry = ttk.Entry(
+            course_info_frame, textvariable=self.search_var, width=30, state=tk.DISABLED
+        )
+        self.search_entry.pack(side=tk.LEFT, padx=5)
+        self.search_entry.bind("<Return>", lambda event: self.search_courses())
+        self.search_button = ttk.Button(
+            course_info_frame,
+            text="Search",
+            command=self.search_courses,
+            state=tk.DISABLED,
+        )
+        self.search_button.pack(side=tk.LEFT, padx=5)
+
         # add a separator between frames
         ttk.Separator(main_frame, orient=tk.HORIZONTAL).grid(
             row=1, column=0, columnspan=8, sticky="ew"
@@ -76,12 +153,12 @@ class App(tk.Tk):
             variable.set("")  # default value
             self.option_variables[name] = variable
 
-            self.option_menus[name] = tk.OptionMenu(main_frame, variable, *OPTIONS)
+            self.option_menus[name] = self.make_course_box(main_frame, name)
             w = self.option_menus[name]
-            w.config(width=6)
             w.grid(row=row + 3, column=0, sticky=tk.W, pady=2)
-            # create a callback for when the user changes the dropdown
-            variable.trace("w", self.course_option_selected)
+            # create a callback for when the user changes the dropdown; the
+            # method is looked up on each call so profiling can still wrap it
+            variable.trace("w", lambda *args: self.course_option_selected(*args))
 
         for sem in range(8):
             l1 = tk.Label(main_frame, text="S" + str(sem + 1))
@@ -93,12 +170,11 @@ class App(tk.Tk):
                 variable.set("")  # default value
                 self.option_variables[name] = variable
 
-                self.option_menus[name] = tk.OptionMenu(main_frame, variable, *OPTIONS)
+                self.option_menus[name] = self.make_course_box(main_frame, name)
                 w = self.option_menus[name]
-                w.config(width=6)
                 w.grid(row=i + 3, column=sem + 1, sticky=tk.W, pady=2)
                 # create a callback for when the user changes the dropdown
-                variable.trace("w", self.course_option_selected)
+                variable.trace("w", lambda *args: self.course_option_selected(*args))
 
         # Add a separate frame for the labels and fields
         total_credits_frame = ttk.Frame(main_frame)
@@ -111,6 +187,14 @@ class App(tk.Tk):
         )
         self.check_schedule_button.pack(side=tk.LEFT, padx=5)
 
+        self.plan_button = ttk.Button(
+            total_credits_frame,
+            text="Plan for me",
+            command=self.plan_schedule,
+            state=tk.DISABLED,
+        )
+        self.plan_button.pack(side=tk.LEFT, padx=5)
+
         # Add Total Credits label and associated variable to the new frame
         self.total_credits_var = tk.StringVar(value="0")  # Set default value to "0"
         total_credits_label = ttk.Label(total_credits_frame, text="     Total Credits:")
@@ -130,6 +214,11 @@ class App(tk.Tk):
         )
         prereq_checkbox.pack(side=tk.LEFT, padx=5)
 
+        # Shown only while a catalog or schedule is loading
+        self.progress = ttk.Progressbar(
+            total_credits_frame, mode="indeterminate", length=100
+        )
+
         self.set_state_pulldowns(tk.DISABLED)
 
     def get_current_schedule(self):
@@ -153,23 +242,58 @@ class App(tk.Tk):
             self.total_credits_var.set(f"{credit_tuple[0]}-{credit_tuple[1]}")
 
     def set_current_schedule(self, schedule):
-        #  First clear all entries...
-        for sem in range(9):
-            for i in range(5):
-                name = "var_" + str(sem) + "_" + str(i)
-                val = self.option_variables[name].set("")
-
-        #  First clear all entries...
-        for sem in range(9):
-            for i, course in enumerate(schedule[sem]):
-                name = "var_" + str(sem) + "_" + str(i)
-                val = self.option_variables[name].set(course)
+        with self.suspend_updates():
+            #  First clear all entries...
+            for sem in range(9):
+                for i in range(5):
+                    name = "var_" + str(sem) + "_" + str(i)
+                    self.option_variables[name].set("")
 
+            #  Then fill in the new schedule
+            for sem in range(9):
+                for i, course in enumerate(schedule[sem]):
+                    name = "var_" + str(sem) + "_" + str(i)
+                    self.option_variables[name].set(course)
+
+    @contextlib.contextmanager
+    def suspend_updates(self):
+        """Hold back recomputation during a bulk edit.
+
+        Cell changes are still recorded, but availability and the credit
+        total are recomputed once, after the outermost suspension ends.
+        """
+        self.suspend_count += 1
+        try:
+            yield
+        finally:
+            self.suspend_count -= 1
+            if self.suspend_count == 0 and self.refresh_needed:
+                self.request_refresh()
+
+    def request_refresh(self):
+        """Ask for one recomputation once Tk is idle.
+
+        Any number of requests made before then share that recomputation.
+        """
+        self.refresh_needed = True
+        if self.suspend_count > 0 or self.refresh_scheduled:
+            return
+        self.refresh_scheduled = True
+        self.after_idle(self.refresh)
+
+    def refresh(self):
+        """Recompute availability and the credit total."""
+        self.refresh_scheduled = False
+        if not self.refresh_needed or self.suspend_count > 0:
+            return
+        self.refresh_needed = False
+        if self.prereq_var.get() == 1:
+            self.update_available()
         self.update_credit_total()
 
     def show_course_info(self):
         course_id = self.option_variables["var_info"].get()
-        info = catalog_utils.format_course_info(course_id, self.catalog)
+        info = render.render_course_info(course_id, self.catalog, critical_path=True)
         info_window = tk.Toplevel(self)
         info_window.title(course_id)
         info_window.geometry("400x300")
@@ -187,26 +311,233 @@ class App(tk.Tk):
         text.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=text.yview)
 
-    def update_options(self, name, options):
-        menu = self.option_menus[name]["menu"]
-        menu.delete(0, "end")
-        menu.add_command(
-            label="", command=lambda value="": self.option_variables[name].set(value)
+    def search_courses(self):
+        """Show the courses matching the search box in a results window."""
+        query = self.search_var.get()
+        results = search.search_courses(query, self.catalog, limit=50)
+
+        results_window = tk.Toplevel(self)
+        results_window.title("Search: " + query)
+        results_window.geometry("400x300")
+        results_window.resizable(True, True)
+
+        listbox = tk.Listbox(results_window)
+        for course_id in results:
+            listbox.insert(tk.END, course_id + " - " + self.catalog[course_id]["name"])
+        if not results:
+            listbox.insert(tk.END, "No matching courses")
+        listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        scrollbar = tk.Scrollbar(results_window)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        listbox.config(yscrollcommand=scrollbar.set)
+        scrollbar.config(command=listbox.yview)
+
+        # Double-clicking a result shows its course information
+        def open_result(event):
+            selection = listbox.curselection()
+            if selection and results:
+                self.option_variables["var_info"].set(results[selection[0]])
+                self.show_course_info()
+
+        listbox.bind("<Double-Button-1>", open_result)
+
+    def make_course_box(self, parent, name):
+        """Create a type-ahead box for picking a course.
+
+        The box only lists the first MAX_CHOICES courses that start with
+        what has been typed, and only fills that list in when it is
+        opened. The typed text is copied into the box's variable once it
+        names a course the box accepts.
+        """
+        box = ttk.Combobox(
+            parent, width=8, postcommand=lambda: self.fill_choices(name)
         )
-        for option in sorted(list(options)):
-            menu.add_command(
-                label=option,
-                command=lambda value=option: self.option_variables[name].set(value),
+        box.bind("<KeyRelease>", lambda event: self.fill_choices(name))
+        box.bind("<<ComboboxSelected>>", lambda event: self.commit_choice(name))
+        box.bind("<Return>", lambda event: self.commit_choice(name))
+        box.bind("<FocusOut>", lambda event: self.commit_choice(name))
+        return box
+
+    def fill_choices(self, name):
+        box = self.option_menus[name]
+        if self.completer is None:
+            box["values"] = OPTIONS
+            return
+        matches = self.completer.complete(
+            box.get(), MAX_CHOICES, self.allowed.get(name)
+        )
+        box["values"] = OPTIONS + matches
+
+    def commit_choice(self, name):
+        """Accept the typed course, complete it, or put back the old value."""
+        box = self.option_menus[name]
+        variable = self.option_variables[name]
+        text = box.get().strip()
+        allowed = self.allowed.get(name, ())
+        if text == "" or text in allowed:
+            value = text
+        else:
+            matches = (
+                self.completer.complete(text, 2, allowed) if self.completer else []
             )
+            value = matches[0] if len(matches) == 1 else variable.get()
+        if value != variable.get():
+            variable.set(value)
+        box.set(value)
+
+    def show_value(self, name):
+        """Make a course box display the value of its variable."""
+        self.option_menus[name].set(self.option_variables[name].get())
+
+    def update_options(self, name, options):
+        self.allowed[name] = options
+
+    def run_in_background(self, key, func, args, on_done, show_progress=False):
+        """Run func(*args) on the worker thread and hand the result to on_done.
+
+        on_done is called on the Tk main thread. Only the newest task for
+        each key is delivered: an older one is cancelled if it has not
+        started yet and its result is ignored if it has. If the task
+        raises an exception it is shown in an error dialog instead.
+        """
+        old = self.tasks.get(key)
+        if old is not None:
+            old.cancel()
+        future = self.executor.submit(func, *args)
+        self.tasks[key] = future
+        if show_progress:
+            self.start_progress()
+        self.after(POLL_MS, self.check_task, key, future, on_done, show_progress)
+
+    def check_task(self, key, future, on_done, show_progress):
+        if not future.done():
+            self.after(POLL_MS, self.check_task, key, future, on_done, show_progress)
+            return
+        if show_progress:
+            self.stop_progress()
+        if self.tasks.get(key) is not future or future.cancelled():
+            return
+        del self.tasks[key]
+        error = future.exception()
+        if error is not None:
+            messagebox.showerror("Advising Buddy", str(error))
+            return
+        on_done(future.result())
+
+    def start_progress(self):
+        if self.progress_count == 0:
+            self.progress.pack(side=tk.LEFT, padx=5)
+            self.progress.start(10)
+        self.progress_count += 1
+
+    def stop_progress(self):
+        self.progress_count -= 1
+        if self.progress_count == 0:
+            self.progress.stop()
+            self.progress.pack_forget()
+
+    def ensure_engine(self, then):
+        """Call then() once the availability engine and validator exist.
+
+        Both need the whole catalog, so for a sharded catalog this is the
+        point where every shard is read. The first time, they are built
+        on the worker thread and then() runs when they are installed.
+        Nothing is called if no catalog is loaded.
+        """
+        if self.catalog is None:
+            return
+        if self.engine is not None:
+            then()
+            return
+        if "engine" not in self.tasks:
+            self.engine_waiters = []
+            catalog = self.catalog
+            version = catalog.version
+            schedule = self.get_current_schedule()
+            self.run_in_background(
+                "engine",
+                self.prepare_engine,
+                (catalog, schedule),
+                lambda result: self.engine_ready(catalog, version, schedule, result),
+                show_progress=True,
+            )
+        self.engine_waiters.append(then)
+
+    @staticmethod
+    def prepare_engine(catalog, schedule):
+        """Build the engine and validator (runs on the worker thread).
+
+        They are built from a private copy of the catalog, so the live
+        one is never changed off the Tk thread. For a sharded catalog the
+        unread shards are read into the copy and returned as well, for
+        engine_ready to merge in.
+        """
+        shards = {}
+        if isinstance(catalog, sharded_catalog.ShardedCatalog):
+            shards = catalog.read_shards(sorted(catalog.pending))
+        courses = dict.copy(catalog)
+        for shard in shards.values():
+            courses.update(shard)
+        copy = catalog_utils.Catalog(courses)
+        index = catalog.cache.get("index")
+        if index is not None:
+            copy.cache["index"] = index
+        engine = availability.AvailabilityEngine(copy, schedule)
+        checker = validator.ScheduleValidator(copy, schedule)
+        return shards, engine, checker
+
+    def engine_ready(self, catalog, version, schedule, result):
+        shards, engine, checker = result
+        waiters, self.engine_waiters = self.engine_waiters, []
+        if catalog is not self.catalog or catalog.version != version:
+            # The catalog was replaced or patched meanwhile, so start again
+            for then in waiters:
+                self.ensure_engine(then)
+            return
+        if shards:
+            catalog.merge_shards(shards)
+        # The copy has the same contents, so its index fits this version
+        catalog.cache.setdefault("index", engine.index)
+        checker.catalog = catalog
+        current = self.get_current_schedule()
+        if current != schedule:
+            # Cells edited while the engine was built were not tracked
+            engine.set_schedule(current)
+            checker.set_schedule(current)
+        self.engine = engine
+        self.checker = checker
+        for then in waiters:
+            then()
 
     def update_available(self):
-        schedule = self.get_current_schedule()
+        if self.engine is None:
+            self.ensure_engine(self.update_available)
+            return
+        # The engine answers from its unlock table, so this stays on the Tk thread
+        by_semester = self.engine.available_by_semester(9)
         for sem in range(9):
+            available = by_semester[sem]
             for i in range(5):
                 name = "var_" + str(sem) + "_" + str(i)
-                self.update_options(
-                    name, catalog_utils.available_classes(schedule, sem, self.catalog)
-                )
+                self.update_options(name, available)
+
+    def track_cell_change(self, name):
+        """Pass a single schedule cell edit on to the availability engine."""
+        new = self.option_variables[name].get()
+        old = self.cell_values.get(name, "")
+        if new == old:
+            return
+        self.cell_values[name] = new
+        if self.engine is None:
+            return
+        sem = int(name.split("_")[1])
+        if old != "":
+            self.engine.remove(old, sem)
+            self.checker.remove(old, sem)
+        if new != "":
+            self.engine.add(new, sem)
+            self.checker.add(new, sem)
 
     def set_state_pulldowns(self, state):
         for sem in range(9):
@@ -216,16 +547,17 @@ class App(tk.Tk):
         self.option_menus["var_info"].config(state=state)
 
     def info_option_selected(self, *args):
+        self.show_value("var_info")
         course = self.option_variables["var_info"].get()
         if course == "":
             self.get_info_button.config(state=tk.DISABLED)
         else:
             self.get_info_button.config(state=tk.NORMAL)
 
-    def course_option_selected(self, *args):
-        if self.prereq_var.get() == 1:
-            self.update_available()
-        self.update_credit_total()
+    def course_option_selected(self, name, *args):
+        self.show_value(name)
+        self.track_cell_change(name)
+        self.request_refresh()
 
     def open_catalog(self):
         """Open the catalog JSON file and parse it into a tree"""
@@ -235,17 +567,115 @@ class App(tk.Tk):
             filetypes=(("JSON files", "*.json"), ("all files", "*.*")),
         )
         if filename:
-            self.catalog = catalog_utils.load_catalog(filename)
-            ids = self.catalog.keys()
+            self.run_in_background(
+                "catalog",
+                self.prepare_catalog,
+                (filename,),
+                self.catalog_loaded,
+                show_progress=True,
+            )
 
-            self.update_options("var_info", ids)
-            for sem in range(9):
-                for i in range(5):
-                    name = "var_" + str(sem) + "_" + str(i)
-                    self.update_options(name, ids)
-            self.set_state_pulldowns(tk.NORMAL)
-            self.filemenu.entryconfig("Load Schedule JSON...", state=tk.NORMAL)
-            self.filemenu.entryconfig("Save Schedule JSON...", state=tk.NORMAL)
+    @staticmethod
+    def prepare_catalog(filename):
+        """Load a catalog and build its completer (runs on the worker thread)."""
+        # Taken first, so a change made while loading is still noticed
+        mtime = os.stat(filename).st_mtime_ns
+        if sharded_catalog.is_manifest(filename):
+            catalog = sharded_catalog.load_manifest(filename)
+        else:
+            catalog = catalog_cache.load_compiled_catalog(filename)
+        return filename, mtime, catalog, autocomplete.CourseCompleter(catalog.keys())
+
+    def catalog_loaded(self, result):
+        filename, mtime, self.catalog, self.completer = result
+        # Only single-file catalogs are reloaded when they change
+        self.catalog_file = None if sharded_catalog.is_manifest(filename) else filename
+        self.catalog_mtime = mtime
+        # Built by ensure_engine once availability or a check is needed
+        self.engine = None
+        self.set_course_options(self.catalog.keys())
+        self.set_state_pulldowns(tk.NORMAL)
+        self.plan_button.config(state=tk.NORMAL)
+        self.search_entry.config(state=tk.NORMAL)
+        self.search_button.config(state=tk.NORMAL)
+        self.filemenu.entryconfig("Load Schedule JSON...", state=tk.NORMAL)
+        self.filemenu.entryconfig("Save Schedule JSON...", state=tk.NORMAL)
+
+    def set_course_options(self, ids):
+        self.update_options("var_info", ids)
+        for sem in range(9):
+            for i in range(5):
+                name = "var_" + str(sem) + "_" + str(i)
+                self.update_options(name, ids)
+
+    def poll_catalog(self):
+        """Start a reload if the catalog file has changed since it was read."""
+        self.after(CATALOG_POLL_MS, self.poll_catalog)
+        if self.catalog_file is None or "catalog" in self.tasks:
+            return
+        try:
+            mtime = os.stat(self.catalog_file).st_mtime_ns
+        except OSError:
+            return
+        if mtime == self.catalog_mtime:
+            return
+        self.catalog_mtime = mtime
+        catalog = self.catalog
+        self.run_in_background(
+            "catalog",
+            catalog_reload.read_changes,
+            (self.catalog_file, catalog),
+            lambda result: self.catalog_reloaded(catalog, result),
+        )
+
+    def catalog_reloaded(self, catalog, result):
+        """Patch the changed courses in and revalidate the schedule."""
+        if catalog is not self.catalog:
+            return
+        new, diff = result
+        if not (diff["added"] or diff["removed"] or diff["changed"]):
+            return
+        if self.engine is None:
+            # Compare against the schedule's problems under the old catalog
+            self.ensure_engine(lambda: self.catalog_reloaded(catalog, result))
+            return
+        unmet_before = self.checker.unmet
+
+        # Courses that no longer exist are taken out of the schedule
+        dropped = []
+        with self.suspend_updates():
+            for name, course in list(self.cell_values.items()):
+                if course in diff["removed"]:
+                    self.option_variables[name].set("")
+                    dropped.append(course)
+
+        catalog_reload.apply_diff(catalog, new, diff)
+        if diff["added"] or diff["removed"]:
+            # The course numbering changed, so start the engine over
+            self.engine = None
+            self.completer = autocomplete.CourseCompleter(catalog.keys())
+            self.set_course_options(catalog.keys())
+        elif self.engine is not None:
+            index = catalog_utils.get_index(catalog)
+            self.engine.reindex(index, diff["changed"])
+            self.checker.reindex(index, diff["changed"])
+
+        self.request_refresh()
+        self.ensure_engine(lambda: self.report_reload(catalog, dropped, unmet_before))
+
+    def report_reload(self, catalog, dropped, unmet_before):
+        """Warn about courses a catalog reload removed or left with unmet prerequisites."""
+        if catalog is not self.catalog:
+            return
+        newly_unmet = self.checker.unmet - unmet_before
+        if dropped or newly_unmet:
+            feedback = "The catalog file changed and was reloaded.\n\n"
+            if dropped:
+                feedback += "Removed from the schedule: " + ", ".join(sorted(dropped)) + "\n\n"
+            for course in sorted(newly_unmet):
+                for violation in self.checker.violations[course]:
+                    feedback += validator.describe_violation(violation) + "\n"
+            messagebox.showwarning("Catalog Reloaded", feedback.strip())
 
     def load_schedule(self):
         filename = filedialog.askopenfilename(
@@ -253,7 +683,34 @@ class App(tk.Tk):
             title="Select Schedule JSON",
             filetypes=(("JSON files", "*.json"), ("all files", "*.*")),
         )
-        self.set_current_schedule(schedule_utils.load_schedule(filename))
+        if filename:
+            self.run_in_background(
+                "schedule",
+                self.prepare_schedule,
+                (filename, self.catalog),
+                self.schedule_loaded,
+                show_progress=True,
+            )
+
+    @staticmethod
+    def prepare_schedule(filename, catalog):
+        """Load a schedule (runs on the worker thread).
+
+        For a sharded catalog the shards of the scheduled courses are
+        read here too, rather than on the Tk thread. They are only
+        merged into the catalog by schedule_loaded, on the Tk thread.
+        """
+        schedule = schedule_utils.load_schedule(filename)
+        shards = {}
+        if isinstance(catalog, sharded_catalog.ShardedCatalog):
+            shards = catalog.read_shards(catalog.shards_for(set().union(*schedule)))
+        return schedule, catalog, shards
+
+    def schedule_loaded(self, result):
+        schedule, catalog, shards = result
+        if shards:
+            catalog.merge_shards(shards)
+        self.set_current_schedule(schedule)
 
     def save_schedule(self):
         filename = filedialog.asksaveasfilename(
@@ -265,9 +722,12 @@ class App(tk.Tk):
         schedule_utils.save_schedule(self.get_current_schedule(), filename)
 
     def check_schedule(self):
-        sched = self.get_current_schedule()
-        dups = schedule_utils.get_duplicates(sched)
-        unmet = catalog_utils.check_prerequisites(sched, self.catalog)
+        if self.engine is None and self.catalog is not None:
+            self.ensure_engine(self.check_schedule)
+            return
+        # The validator is kept current by track_cell_change
+        dups = self.checker.duplicates
+        unmet = self.checker.unmet
 
         feedback = ""
         if len(dups) == 0 and len(unmet) == 0:
@@ -276,7 +736,8 @@ class App(tk.Tk):
             if len(dups) > 0:
                 feedback += "Duplicate courses: " + ", ".join(list(sorted(dups))) + "\n\n"
             if len(unmet) > 0:
-                feedback += "Courses with unmet prereqs: " + ", ".join(list(sorted(unmet))) + "\n"
+                feedback += "Courses with unmet prereqs: " + ", ".join(list(sorted(unmet))) + "\n\n"
+                feedback += "\n".join(self.checker.reasons()) + "\n"
 
         info_window = tk.Toplevel(self)
         info_window.title("Schedule Evaluation")
@@ -295,6 +756,96 @@ class App(tk.Tk):
         text.config(yscrollcommand=scrollbar.set)
         scrollbar.config(command=text.yview)
 
+    def plan_schedule(self):
+        """Rearrange the chosen courses (plus prerequisites) into a valid plan.
+
+        The AP/Transfer column is kept as completed courses and every
+        other selected course is treated as a target.
+        """
+        sched = self.get_current_schedule()
+        targets = set().union(*sched[1:])
+        try:
+            plan = planner.plan_schedule(targets, self.catalog, completed=sched[0])
+        except (KeyError, ValueError) as error:
+            messagebox.showerror("Plan for me", f"Could not build a plan: {error}")
+            return
+        self.set_current_schedule(plan)
+
+    def toggle_profiling(self):
+        if self.profile_var.get():
+            profiling.default_profiler.enable()
+        else:
+            profiling.default_profiler.disable()
+
+    def show_performance(self):
+        """Show the recorded timings in a table that can be exported."""
+        perf_window = tk.Toplevel(self)
+        perf_window.title("Performance")
+        perf_window.geometry("700x300")
+        perf_window.resizable(True, True)
+
+        button_frame = ttk.Frame(perf_window)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X)
+
+        columns = [field for _, field, _ in PERF_COLUMNS]
+        tree = ttk.Treeview(perf_window, columns=columns)
+        tree.heading("#0", text="Function")
+        tree.column("#0", width=220)
+        for heading, field, _ in PERF_COLUMNS:
+            tree.heading(field, text=heading)
+            tree.column(field, width=75, anchor=tk.E)
+        tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        scrollbar = tk.Scrollbar(perf_window)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        tree.config(yscrollcommand=scrollbar.set)
+        scrollbar.config(command=tree.yview)
+
+        def fill():
+            tree.delete(*tree.get_children())
+            for row in profiling.default_profiler.report():
+                values = []
+                for _, field, scale in PERF_COLUMNS:
+                    value = row[field] * scale
+                    values.append(f"{value:.3f}" if scale != 1 else f"{value:.0f}")
+                tree.insert("", tk.END, text=row["name"], values=values)
+
+        def reset():
+            profiling.default_profiler.reset()
+            fill()
+
+        ttk.Button(button_frame, text="Refresh", command=fill).pack(side=tk.LEFT, padx=5)
+        ttk.Button(button_frame, text="Reset", command=reset).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame, text="Export JSON...", command=self.export_performance_json
+        ).pack(side=tk.LEFT, padx=5)
+        ttk.Button(
+            button_frame, text="Export Stats...", command=self.export_performance_stats
+        ).pack(side=tk.LEFT, padx=5)
+        fill()
+
+    def export_performance_json(self):
+        filename = filedialog.asksaveasfilename(
+            title="Export Performance JSON",
+            defaultextension=".json",
+            filetypes=(("JSON files", "*.json"), ("all files", "*.*")),
+        )
+        if filename:
+            profiling.default_profiler.export_json(filename)
+
+    def export_performance_stats(self):
+        filename = filedialog.asksaveasfilename(
+            title="Export Profile Stats",
+            defaultextension=".prof",
+            filetypes=(("Profile stats", "*.prof"), ("all files", "*.*")),
+        )
+        if not filename:
+            return
+        try:
+            profiling.default_profiler.export_pstats(filename)
+        except ValueError as error:
+            messagebox.showerror("Export Profile Stats", str(error))
+
     def prereq_selected(self):
         if self.prereq_var.get() == 1:
             self.update_available()
@@ -306,6 +857,17 @@ class App(tk.Tk):
                     self.update_options(name, ids)
 
 
+# The callbacks that run on every edit, timed when profiling is on
+profiling.default_profiler.register(
+    App,
+    ["course_option_selected", "set_current_schedule", "refresh",
+     "update_available", "schedule_loaded"],
+    prefix="App.",
+)
+
+
 if __name__ == "__main__":
+    profiling.enable_from_env()
     app = App()
     app.mainloop()
+    app.executor.shutdown(wait=False, cancel_futures=True)
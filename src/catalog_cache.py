@@ -0,0 +1,226 @@
+"""A persistent cache of compiled catalogs.
+
+Loading a catalog from JSON means parsing the file, converting every
+entry and rebuilding the prerequisite index and closures. The result
+only depends on the contents of the file, so it is saved in a cache
+directory, keyed by a hash of those contents. Later loads of the same
+file read the courses and their derived data back without validating,
+converting or recomputing anything.
+
+Compiled catalogs are written with marshal, which only holds plain data
+(strings, numbers, tuples, lists, dicts and sets), so reading one
+cannot run code. A file is also ignored unless it is owned by the
+current user and not writable by anyone else.
+
+The cache directory defaults to ~/.cache/course-scheduler and can be
+changed with the COURSE_SCHEDULER_CACHE environment variable.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import hashlib
+import json
+import marshal
+import os
+import stat
+import tempfile
+
+import analysis
+import catalog_index
+import catalog_utils
+import search
+
+CACHE_ENV = "COURSE_SCHEDULER_CACHE"
+
+# Bump this whenever the layout of a compiled catalog changes, or when
+# compile_catalog starts rejecting catalogs it used to accept
+FORMAT_VERSION = 4
+
+# Start of every compiled catalog, followed by the format versions
+MAGIC = b"course-scheduler catalog"
+
+
+def default_cache_dir():
+    """Return the directory compiled catalogs are stored in.
+
+    Returns:
+        str: The cache directory path.
+    """
+    path = os.environ.get(CACHE_ENV)
+    if path:
+        return path
+    return os.path.join(os.path.expanduser("~"), ".cache", "course-scheduler")
+
+
+def cache_path(filename, digest, cache_dir=None):
+    """Return the path of the compiled form of a catalog file.
+
+    The name combines a hash of the source path with the hash of its
+    contents, so older compiled versions of the same file can be found
+    and removed.
+
+    Args:
+        filename (str): The filename of the source JSON file.
+        digest (str): The hex digest of the source contents.
+        cache_dir (str, optional): The cache directory. Defaults to
+            default_cache_dir().
+
+    Returns:
+        str: The path of the compiled catalog.
+    """
+    if cache_dir is None:
+        cache_dir = default_cache_dir()
+    source_key = hashlib.sha256(os.path.abspath(filename).encode()).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{source_key}-{digest}.catalog")
+
+
+def compile_catalog(data):
+    """Build a catalog from JSON text and compute its derived data.
+
+    Args:
+        data (bytes): The contents of a catalog JSON file.
+
+    Returns:
+        Catalog: The catalog, with its index, analysis, closures and
+            search index cached.
+
+    Raises:
+        CatalogError: If the catalog fails validation.
+    """
+    json_dict = json.loads(data)
+    catalog_utils.ensure_valid(json_dict)
+    catalog = catalog_utils.json_to_catalog(json_dict)
+    catalog_utils.get_index(catalog)
+    catalog_utils.get_analysis(catalog)
+    catalog_utils.all_dependencies(catalog)
+    search.get_search_index(catalog)
+    return catalog
+
+
+def _to_data(catalog):
+    """Convert a compiled catalog into plain data for marshal."""
+    courses = [
+        (course, entry.name, entry.credits, entry.description, entry.prerequisites,
+         entry.extra)
+        for course, entry in catalog.items()
+    ]
+    cache = catalog.cache
+    analysis_state = dict(vars(cache["analysis"]))
+    del analysis_state["index"]
+    return {
+        "courses": courses,
+        "index": vars(cache["index"]),
+        "analysis": analysis_state,
+        "closures": cache.get("closures", {}),
+        "sorted_closures": cache.get("sorted_closures", {}),
+        "search": vars(cache["search"]),
+    }
+
+
+def _restore(cls, state):
+    """Recreate an object from its attributes without recomputing them."""
+    obj = cls.__new__(cls)
+    obj.__dict__.update(state)
+    return obj
+
+
+def _from_data(data):
+    """Rebuild a compiled catalog from the result of _to_data."""
+    catalog = catalog_utils.Catalog(
+        (course, catalog_utils.Course(*fields)) for course, *fields in data["courses"]
+    )
+    index = _restore(catalog_index.CatalogIndex, data["index"])
+    course_analysis = _restore(analysis.CourseAnalysis, data["analysis"])
+    course_analysis.index = index
+    catalog.cache = {
+        "index": index,
+        "analysis": course_analysis,
+        "closures": data["closures"],
+        "sorted_closures": data["sorted_closures"],
+        "search": _restore(search.SearchIndex, data["search"]),
+    }
+    return catalog
+
+
+def _header():
+    return MAGIC + f" {FORMAT_VERSION} {marshal.version}\n".encode()
+
+
+def _trusted(file):
+    """Check that an open cache file is ours and only we can change it."""
+    info = os.fstat(file.fileno())
+    if hasattr(os, "geteuid") and info.st_uid != os.geteuid():
+        return False
+    return not info.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _read_compiled(path):
+    """Load a compiled catalog, or return None if it is missing, stale or untrusted."""
+    header = _header()
+    try:
+        with open(path, "rb") as file:
+            if not _trusted(file) or file.read(len(header)) != header:
+                return None
+            # Reading it all first is much faster than marshal.load(file)
+            data = marshal.loads(file.read())
+        return _from_data(data)
+    except (OSError, ValueError, TypeError, EOFError, KeyError):
+        return None
+
+
+def _write_compiled(path, catalog):
+    """Save a compiled catalog and remove older versions of the same source."""
+    cache_dir = os.path.dirname(path)
+    os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+
+    # Write to a temporary file first so readers never see a partial file
+    fd, temp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(_header())
+            marshal.dump(_to_data(catalog), file)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+    source_key = os.path.basename(path).split("-")[0]
+    for name in os.listdir(cache_dir):
+        if name.startswith(source_key + "-") and name != os.path.basename(path):
+            try:
+                os.unlink(os.path.join(cache_dir, name))
+            except OSError:
+                pass
+
+
+def load_compiled_catalog(filename, cache_dir=None):
+    """Load a catalog, using the compiled cache when possible.
+
+    The result is equal to load_catalog(filename), but its prerequisite
+    index and dependency closures are already filled in. If the cache
+    cannot be written the catalog is still returned.
+
+    Args:
+        filename (str): The filename of the JSON file.
+        cache_dir (str, optional): The cache directory. Defaults to
+            default_cache_dir().
+
+    Returns:
+        Catalog: A dictionary containing course information.
+
+    Raises:
+        CatalogError: If the catalog fails validation.
+    """
+    with open(filename, "rb") as file:
+        data = file.read()
+    path = cache_path(filename, hashlib.sha256(data).hexdigest(), cache_dir)
+
+    catalog = _read_compiled(path)
+    if catalog is None:
+        catalog = compile_catalog(data)
+        try:
+            _write_compiled(path, catalog)
+        except OSError:
+            pass
+    return catalog
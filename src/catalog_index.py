@@ -0,0 +1,249 @@
+"""A compiled, integer-indexed form of a course catalog.
+
+Looking courses up by their string ids is the main cost of checking a
+large catalog. A CatalogIndex numbers the courses once and stores the
+prerequisite graph and credit ranges in flat lists, so the checks in
+catalog_utils can work with small integers instead.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+
+class CatalogIndex:
+    """Integer-indexed prerequisite and credit information for a catalog.
+
+    Courses are numbered 0..n-1 in sorted order of their ids.
+
+    Attributes:
+        courses (list): The course id for each integer id.
+        ids (dict): Maps each course id to its integer id.
+        prerequisites (list): A tuple of prerequisite integer ids for
+            each course.
+        dependents (list): A tuple of the integer ids of the courses
+            that list each course as a prerequisite.
+        min_credits (list): The minimum credits of each course.
+        max_credits (list): The maximum credits of each course.
+        blocked (frozenset): Integer ids of courses with a prerequisite
+            that is not in the catalog.
+        missing (dict): Maps the integer id of each blocked course to a
+            tuple of its prerequisites that are not in the catalog.
+
+    Like the string-keyed functions in catalog_utils, the checks here
+    count a prerequisite that is not in the catalog as met once a
+    course with that id is scheduled in an earlier semester.
+    """
+
+    def __init__(self, catalog):
+        """Compile a catalog in the format returned by load_catalog.
+
+        Args:
+            catalog (dict): The dictionary containing course information.
+        """
+        self.courses = sorted(catalog)
+        self.ids = {course: i for i, course in enumerate(self.courses)}
+        self.prerequisites = []
+        self.min_credits = []
+        self.max_credits = []
+        dependents = [[] for _ in self.courses]
+        missing = {}
+
+        for i, course in enumerate(self.courses):
+            entry = catalog[course]
+            reqs = []
+            for req in entry["prerequisites"]:
+                req_id = self.ids.get(req)
+                if req_id is None:
+                    missing.setdefault(i, []).append(req)
+                    continue
+                reqs.append(req_id)
+                dependents[req_id].append(i)
+            self.prerequisites.append(tuple(sorted(reqs)))
+
+            creds = entry["credits"]
+            self.min_credits.append(creds[0])
+            self.max_credits.append(creds[-1])
+
+        self.dependents = [tuple(deps) for deps in dependents]
+        self.missing = {i: tuple(sorted(reqs)) for i, reqs in missing.items()}
+        self.blocked = frozenset(missing)
+
+    def __len__(self):
+        return len(self.courses)
+
+    def placements(self, schedule):
+        """Find the first semester each catalog course is scheduled in.
+
+        Courses in the schedule that are not in the catalog are ignored.
+
+        Args:
+            schedule (list): The course schedule.
+
+        Returns:
+            list: The semester index for each integer id, or -1 if the
+                course is not in the schedule.
+        """
+        placed = [-1] * len(self.courses)
+        ids = self.ids
+        for sem_num in range(len(schedule) - 1, -1, -1):
+            for course in schedule[sem_num]:
+                course_id = ids.get(course)
+                if course_id is not None:
+                    placed[course_id] = sem_num
+        return placed
+
+    def missing_ready(self, schedule):
+        """Find when the prerequisites outside the catalog are met.
+
+        Args:
+            schedule (list): The course schedule.
+
+        Returns:
+            dict: Maps the integer id of each blocked course whose missing
+                prerequisites are all scheduled to the first semester
+                after them.
+        """
+        if not self.missing:
+            return {}
+        first = {}
+        ids = self.ids
+        for sem_num in range(len(schedule) - 1, -1, -1):
+            for course in schedule[sem_num]:
+                if course not in ids:
+                    first[course] = sem_num
+        ready = {}
+        for i, reqs in self.missing.items():
+            if all(req in first for req in reqs):
+                ready[i] = max(first[req] for req in reqs) + 1
+        return ready
+
+    def in_order(self, schedule, placed):
+        """Check that every scheduled course follows its prerequisites.
+
+        Courses that are not in the catalog are ignored.
+
+        Args:
+            schedule (list): The course schedule.
+            placed (list): The result of placements(schedule).
+
+        Returns:
+            bool: True if no scheduled course has unmet prerequisites.
+        """
+        for sem_num, semester in enumerate(schedule):
+            for course in semester:
+                course_id = self.ids.get(course)
+                if course_id is None:
+                    continue
+                if course_id in self.blocked:
+                    return False
+                for req in self.prerequisites[course_id]:
+                    if not 0 <= placed[req] < sem_num:
+                        return False
+        return True
+
+    def available_classes(self, schedule, semester, analysis=None):
+        """Index-backed version of catalog_utils.available_classes.
+
+        A prerequisite scheduled in more than one semester is met by its
+        first placement. The counting loop catalog_utils uses for plain
+        dictionaries counts it once per placement instead, so there a
+        course with a duplicated prerequisite is never available.
+
+        If the schedule respects all prerequisites, no course deeper than
+        the semester can be available, so with an analysis those courses
+        are skipped without looking at their prerequisites.
+
+        Args:
+            schedule (list): The current course schedule.
+            semester (int): The semester for which to find available classes.
+            analysis (CourseAnalysis, optional): The depth analysis of
+                this catalog.
+
+        Returns:
+            set: A set of available classes for the specified semester.
+        """
+        placed = self.placements(schedule)
+        blocked = self.blocked
+        missing_ready = self.missing_ready(schedule)
+        prerequisites = self.prerequisites
+        if analysis is not None and self.in_order(schedule, placed):
+            candidates = analysis.candidates(semester)
+        else:
+            candidates = range(len(self.courses))
+        classes = set()
+        for i in candidates:
+            if placed[i] != -1:
+                continue
+            if i in blocked and missing_ready.get(i, semester + 1) > semester:
+                continue
+            for req in prerequisites[i]:
+                if not 0 <= placed[req] < semester:
+                    break
+            else:
+                classes.add(self.courses[i])
+        return classes
+
+    def available_by_semester(self, schedule):
+        """Index-backed version of catalog_utils.available_by_semester.
+
+        Like available_classes, a duplicated prerequisite is met by its
+        first placement.
+        """
+        placed = self.placements(schedule)
+        num_semesters = len(schedule)
+        missing_ready = self.missing_ready(schedule)
+
+        # Bucket each unscheduled course by the first semester it can be taken
+        unlocked = [[] for _ in range(num_semesters)]
+        for i, reqs in enumerate(self.prerequisites):
+            if placed[i] != -1:
+                continue
+            if i in self.blocked and i not in missing_ready:
+                continue
+            ready = missing_ready.get(i, 0)
+            for req in reqs:
+                req_sem = placed[req]
+                if req_sem == -1:
+                    break
+                if req_sem >= ready:
+                    ready = req_sem + 1
+            else:
+                if ready < num_semesters:
+                    unlocked[ready].append(i)
+
+        by_semester = []
+        classes = set()
+        for bucket in unlocked:
+            classes.update(self.courses[i] for i in bucket)
+            by_semester.append(set(classes))
+        return by_semester
+
+    def check_prerequisites(self, schedule):
+        """Index-backed version of catalog_utils.check_prerequisites."""
+        placed = self.placements(schedule)
+        missing_ready = self.missing_ready(schedule)
+        invalid_classes = set()
+        for sem_num, semester in enumerate(schedule):
+            for course in semester:
+                # Unknown courses raise a KeyError, just like a catalog lookup
+                course_id = self.ids[course]
+                if course_id in self.blocked and \
+                        missing_ready.get(course_id, sem_num + 1) > sem_num:
+                    invalid_classes.add(course)
+                    continue
+                for req in self.prerequisites[course_id]:
+                    if not 0 <= placed[req] < sem_num:
+                        invalid_classes.add(course)
+                        break
+        return invalid_classes
+
+    def total_credits(self, schedule):
+        """Index-backed version of catalog_utils.total_credits."""
+        num_min = 0
+        num_max = 0
+        for semester in schedule:
+            for course in semester:
+                course_id = self.ids[course]
+                num_min += self.min_credits[course_id]
+                num_max += self.max_credits[course_id]
+        return (num_min, num_max)
@@ -0,0 +1,144 @@
+"""Reloading a catalog file in place when it changes.
+
+Loading a changed catalog from scratch throws away every dependency
+closure and everything built on them. reload_catalog instead compares
+the new file with the loaded Catalog, patches in only the courses that
+changed, and keeps the cached closures of every course that neither
+changed nor depends on a course that did.
+
+The CatalogIndex and the structures built from it are rebuilt on next
+use, since that only takes a linear pass. Objects that track a
+schedule against the index (AvailabilityEngine, ScheduleValidator) can
+be moved onto the new index with their reindex methods as long as no
+courses were added or removed.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import catalog_utils
+
+
+def diff_catalogs(old, new):
+    """Compare two catalogs.
+
+    Args:
+        old (dict): The loaded catalog.
+        new (dict): The catalog to change to.
+
+    Returns:
+        dict: Sets of course ids under "added", "removed" and "changed"
+            (in both, with different contents).
+    """
+    return {
+        "added": {course for course in new if course not in old},
+        "removed": {course for course in old if course not in new},
+        "changed": {
+            course for course, entry in new.items()
+            if course in old and old[course] != entry
+        },
+    }
+
+
+def affected_courses(catalog, courses):
+    """Find every course whose dependencies may involve some courses.
+
+    Args:
+        catalog (dict): The dictionary containing course information.
+        courses (iterable): The starting course ids.
+
+    Returns:
+        set: The courses and everything that requires them, directly or
+            indirectly.
+    """
+    dependents = {}
+    for course, entry in catalog.items():
+        for req in entry["prerequisites"]:
+            dependents.setdefault(req, []).append(course)
+
+    affected = set(courses)
+    stack = list(affected)
+    while stack:
+        for dependent in dependents.get(stack.pop(), ()):
+            if dependent not in affected:
+                affected.add(dependent)
+                stack.append(dependent)
+    return affected
+
+
+def apply_diff(catalog, new, diff):
+    """Patch a Catalog to match another, keeping unaffected closures.
+
+    The catalog gets a new version, so caches keyed by version (such
+    as the render cache) will not return stale results.
+
+    Args:
+        catalog (Catalog): The catalog to patch in place.
+        new (dict): The catalog to change to.
+        diff (dict): The result of diff_catalogs(catalog, new).
+
+    Returns:
+        set: The courses whose dependency closures were dropped.
+    """
+    if not (diff["added"] or diff["removed"] or diff["changed"]):
+        return set()
+
+    closures = catalog.cache.get("closures", {})
+    sorted_closures = catalog.cache.get("sorted_closures", {})
+
+    # Patch the entries directly, then start one new version
+    for course in diff["removed"]:
+        dict.__delitem__(catalog, course)
+    for course in diff["added"] | diff["changed"]:
+        dict.__setitem__(catalog, course, new[course])
+    catalog.invalidate()
+
+    # A removed course was only required by courses that have changed
+    affected = affected_courses(catalog, diff["added"] | diff["changed"])
+    affected |= diff["removed"]
+    catalog.cache["closures"] = {
+        course: closure for course, closure in closures.items() if course not in affected
+    }
+    catalog.cache["sorted_closures"] = {
+        course: closure for course, closure in sorted_closures.items() if course not in affected
+    }
+    return affected
+
+
+def read_changes(filename, catalog):
+    """Load a catalog file and compare it with a loaded catalog.
+
+    This does not change the loaded catalog, so it can run on a worker
+    thread while the catalog is still in use.
+
+    Args:
+        filename (str): The filename of the JSON file.
+        catalog (dict): The loaded catalog.
+
+    Returns:
+        tuple: The new Catalog and the result of diff_catalogs.
+
+    Raises:
+        CatalogError: If the new catalog fails validation.
+    """
+    new = catalog_utils.load_catalog(filename)
+    return new, diff_catalogs(catalog, new)
+
+
+def reload_catalog(catalog, filename):
+    """Bring a loaded Catalog up to date with its file.
+
+    Args:
+        catalog (Catalog): The catalog to patch in place.
+        filename (str): The filename of the JSON file.
+
+    Returns:
+        dict: The diff, plus the dropped closures under "affected".
+
+    Raises:
+        CatalogError: If the new catalog fails validation. The loaded
+            catalog is left unchanged.
+    """
+    new, diff = read_changes(filename, catalog)
+    diff["affected"] = apply_diff(catalog, new, diff)
+    return diff
@@ -4,14 +4,182 @@ Author: Aiden Aquino
 Date:  12/6/23
 """
 
+import functools
+import itertools
 import json
+import sys
 import textwrap
-from copy import deepcopy
+from collections.abc import Mapping
 
+import analysis
+import catalog_index
 
+# Every catalog state gets a number that is never reused
+_versions = itertools.count(1)
+
+
+class Catalog(dict):
+    """A catalog dictionary that remembers values derived from it.
+
+    A Catalog behaves exactly like the dictionary returned by earlier
+    versions of json_to_catalog, but also carries a cache of derived
+    data (such as dependency closures) so that it only has to be
+    computed once. Adding, replacing or removing a course gives the
+    catalog a new version number and empties the cache.
+
+    Course entries should be replaced rather than edited in place. If
+    an entry is edited in place, call invalidate() afterwards.
+
+    Attributes:
+        version (int): Identifies the current contents of the catalog.
+        cache (dict): Derived values, keyed by name.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = next(_versions)
+        self.cache = {}
+
+    def invalidate(self):
+        """Throw away all derived data and start a new version."""
+        self.version = next(_versions)
+        self.cache = {}
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.invalidate()
+
+    def __delitem__(self, key):
+        super().__delitem__(key)
+        self.invalidate()
+
+    def __ior__(self, other):
+        super().update(other)
+        self.invalidate()
+        return self
+
+    def clear(self):
+        super().clear()
+        self.invalidate()
+
+    def pop(self, *args):
+        value = super().pop(*args)
+        self.invalidate()
+        return value
+
+    def popitem(self):
+        item = super().popitem()
+        self.invalidate()
+        return item
+
+    def setdefault(self, key, default=None):
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.invalidate()
+
+    def __reduce__(self):
+        return (self.__class__, (dict(self),), self.cache)
+
+    def __setstate__(self, state):
+        # The version was freshly assigned by __init__
+        self.cache = state
+
+
+def _describe_field_problem(item):
+    """Describe one "malformed_fields" record from validate_catalog."""
+    if item["field"] is None:
+        return f"{item['course']} is not an object"
+    if item["problem"] == "missing":
+        return f"{item['course']} has no {item['field']}"
+    return f"{item['course']} has {item['field']} of the wrong type"
+
+
+class CatalogError(ValueError):
+    """Raised when a catalog fails validation.
+
+    Attributes:
+        report (dict): The report from validate_catalog.
+    """
+
+    def __init__(self, report):
+        problems = []
+        if report["malformed_fields"]:
+            problems.append("malformed fields: " + "; ".join(
+                _describe_field_problem(item) for item in report["malformed_fields"]))
+        if report["cycles"]:
+            problems.append("prerequisite cycles: " + "; ".join(
+                ", ".join(cycle) for cycle in report["cycles"]))
+        if report["dangling"]:
+            problems.append("unknown prerequisites: " + "; ".join(
+                f"{item['course']} requires {item['prerequisite']}"
+                for item in report["dangling"]))
+        if report["malformed_credits"]:
+            problems.append("malformed credits: " + "; ".join(
+                f"{item['course']} has {item['credits']!r}"
+                for item in report["malformed_credits"]))
+        super().__init__("Invalid catalog: " + " / ".join(problems))
+        self.report = report
+
+
+class Course(Mapping):
+    """A compact, read-only record of a single catalog entry.
+
+    Courses support the same dictionary-style access as the entries
+    read from JSON (course["credits"], course.get("name"), iteration
+    over keys) and compare equal to a dict with the same contents.
+
+    Attributes:
+        name (str): The course name.
+        credits (tuple): The possible credit values.
+        description (str): The course description.
+        prerequisites (frozenset): The ids of the prerequisite courses.
+        extra (dict): Any other fields from the JSON entry, or None.
+    """
+
+    __slots__ = ("name", "credits", "description", "prerequisites", "extra")
+
+    FIELDS = ("name", "credits", "description", "prerequisites")
+
+    def __init__(self, name, credits, description, prerequisites, extra=None):
+        self.name = name
+        self.credits = credits
+        self.description = description
+        self.prerequisites = prerequisites
+        self.extra = extra
+
+    def __getitem__(self, key):
+        if key in Course.FIELDS:
+            return getattr(self, key)
+        if self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def __iter__(self):
+        yield from Course.FIELDS
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self):
+        return len(Course.FIELDS) + (len(self.extra) if self.extra is not None else 0)
+
+    def __repr__(self):
+        return f"Course({dict(self)!r})"
+
+    def __reduce__(self):
+        return (Course, (self.name, self.credits, self.description,
+                         self.prerequisites, self.extra))
+
+
+@functools.lru_cache(maxsize=None)
 def parse_credits(credits):
     """Return a tuple of ints representing the possible credit values.
 
+    Results are cached, so equal credit strings share a single tuple.
+
     Examples:
     >>> parse_credits("3")
     (3,)
@@ -38,87 +206,413 @@ def parse_credits(credits):
         return (int(split_string[0]), )
 
 
+def _json_to_course(entry):
+    """Convert a single JSON catalog entry into a Course."""
+    extra = {key: value for key, value in entry.items() if key not in Course.FIELDS}
+    return Course(
+        entry.get("name", ""),
+        parse_credits(entry["credits"]),
+        entry.get("description", ""),
+        frozenset(sys.intern(req) for req in entry["prerequisites"]),
+        extra or None,
+    )
+
+
 def json_to_catalog(json_dict):
     """Convert from the json catalog format to the correct internal format.
 
-    This will return an exact copy of the provided dictionary except for the
-    following:
+    Each entry becomes a Course record holding the same fields as the
+    provided dictionary, except for the following:
 
     * The lists of prerequisite course ids will be converted to sets.
     * The credit strings will be converted to integer tuples (using
     the parse_credits function)
 
+    Course ids are interned and the provided dictionary is not modified.
+
     Args:
         json_dict (dict): A catalog dictionary as ready by the json module.
 
     Returns:
-        dict: A catalog dictionary in the correct internal format.
+        Catalog: A catalog dictionary in the correct internal format.
+
+    """
+    return Catalog(
+        (sys.intern(course), _json_to_course(entry))
+        for course, entry in json_dict.items()
+    )
+
+
+def _valid_credits(credits):
+    """Check a credits value in either the JSON or internal format."""
+    if isinstance(credits, tuple):
+        return len(credits) > 0 and all(isinstance(num, int) for num in credits)
+    if not isinstance(credits, str):
+        return False
+    try:
+        parsed = parse_credits(credits)
+    except ValueError:
+        return False
+    return bool(parsed)
 
+
+def _find_cycles(graph):
+    """Find the prerequisite cycles in a graph using Tarjan's algorithm.
+
+    The search uses an explicit stack, so deep catalogs cannot hit the
+    recursion limit.
+
+    Args:
+        graph (dict): Maps each course to a list of its prerequisites,
+            all of which are keys of the graph.
+
+    Returns:
+        list: The sorted course ids of each strongly connected component
+            that contains a cycle.
     """
-    placeholder_dict = deepcopy(json_dict)
-    # for every course in the dict
-    for course in placeholder_dict:
-        placeholder_dict[course] = placeholder_dict[course]
+    order = {}
+    low = {}
+    stack = []
+    on_stack = set()
+    cycles = []
+
+    for root in graph:
+        if root in order:
+            continue
+        order[root] = low[root] = len(order)
+        stack.append(root)
+        on_stack.add(root)
+        work = [(root, iter(graph[root]))]
+
+        while work:
+            course, edges = work[-1]
+            descended = False
+            for req in edges:
+                if req not in order:
+                    order[req] = low[req] = len(order)
+                    stack.append(req)
+                    on_stack.add(req)
+                    work.append((req, iter(graph[req])))
+                    descended = True
+                    break
+                if req in on_stack:
+                    low[course] = min(low[course], order[req])
+            if descended:
+                continue
+
+            work.pop()
+            if work:
+                parent = work[-1][0]
+                low[parent] = min(low[parent], low[course])
+            if low[course] == order[course]:
+                component = []
+                while True:
+                    member = stack.pop()
+                    on_stack.discard(member)
+                    component.append(member)
+                    if member == course:
+                        break
+                if len(component) > 1 or course in graph[course]:
+                    cycles.append(sorted(component))
 
-        # update the credit strings
-        placeholder_dict[course]["credits"] = parse_credits(placeholder_dict[course]["credits"])
+    return sorted(cycles)
 
-        # Update the pre-reqs
-        reqs_set = set()
-        for pre_req in placeholder_dict[course]["prerequisites"]:
-            reqs_set.add(pre_req)
 
-        placeholder_dict[course]["prerequisites"] = reqs_set
+def _field_problems(entry):
+    """Find the missing and wrongly typed fields of one catalog entry.
 
-    # Return
-    return placeholder_dict
+    Credits are only checked for presence; _valid_credits checks the rest.
+
+    Returns:
+        list: (field, problem) pairs, where problem is "missing" or
+            "wrong type".
+    """
+    problems = []
+    for field in Course.FIELDS:
+        if field not in entry:
+            problems.append((field, "missing"))
+    name = entry.get("name", "")
+    if not isinstance(name, str):
+        problems.append(("name", "wrong type"))
+    description = entry.get("description")
+    if description is not None and not isinstance(description, str):
+        problems.append(("description", "wrong type"))
+    reqs = entry.get("prerequisites", ())
+    if not isinstance(reqs, (list, tuple, set, frozenset)) or \
+            not all(isinstance(req, str) for req in reqs):
+        problems.append(("prerequisites", "wrong type"))
+    return problems
+
+
+def validate_catalog(catalog):
+    """Check a catalog for problems that would break later processing.
+
+    This finds entries with missing or wrongly typed fields, prerequisite
+    cycles, prerequisites that are not in the catalog, and credits that
+    parse_credits cannot turn into a non-empty tuple. It accepts either
+    the JSON format or the internal format, runs in time linear in the
+    size of the catalog, and does not use recursion.
+
+    Args:
+        catalog (dict): A catalog dictionary in either format.
+
+    Returns:
+        dict: A report with four lists: "malformed_fields" ({"course",
+            "field", "problem"} records, where problem is "missing" or
+            "wrong type"), "cycles" (sorted course ids of each cycle),
+            "dangling" ({"course", "prerequisite"} pairs) and
+            "malformed_credits" ({"course", "credits"} pairs). All four
+            are empty for a valid catalog.
+    """
+    graph = {}
+    fields = []
+    dangling = []
+    malformed = []
+    for course, entry in catalog.items():
+        if not isinstance(entry, Mapping):
+            fields.append({"course": course, "field": None, "problem": "wrong type"})
+            graph[course] = []
+            continue
+        problems = _field_problems(entry)
+        fields.extend({"course": course, "field": field, "problem": problem}
+                      for field, problem in problems)
+        bad_fields = {field for field, _ in problems}
+
+        reqs = []
+        if "prerequisites" not in bad_fields:
+            for req in sorted(entry["prerequisites"]):
+                if req in catalog:
+                    reqs.append(req)
+                else:
+                    dangling.append({"course": course, "prerequisite": req})
+        graph[course] = reqs
+
+        if "credits" not in bad_fields and not _valid_credits(entry["credits"]):
+            malformed.append({"course": course, "credits": entry["credits"]})
+
+    return {
+        "malformed_fields": fields,
+        "cycles": _find_cycles(graph),
+        "dangling": dangling,
+        "malformed_credits": malformed,
+    }
+
+
+def ensure_valid(catalog):
+    """Raise a CatalogError if validate_catalog finds any problems.
+
+    Args:
+        catalog (dict): A catalog dictionary in either format.
+
+    Raises:
+        CatalogError: If the catalog has missing or wrongly typed
+            fields, cycles, unknown prerequisites or malformed credits.
+    """
+    report = validate_catalog(catalog)
+    if any(report.values()):
+        raise CatalogError(report)
 
 
 def load_catalog(filename):
     """Read course information from an JSON file and return a dictionary.
 
+    The catalog is validated before it is converted, so the result is
+    guaranteed to be acyclic with well-formed credits and prerequisites.
+
     Args:
         filename (str): The filename of the JSON file.
 
     Returns:
-        dict: A dictionary containing course information.
+        Catalog: A dictionary containing course information.
+
+    Raises:
+        CatalogError: If the catalog fails validation.
     """
     with open(filename) as file:
         json_loaded_dict = json.load(file)
+        ensure_valid(json_loaded_dict)
         final_dict = json_to_catalog(json_loaded_dict)
         return final_dict
 
 
+def _closure_table(catalog):
+    """Return the table of known dependency closures for a catalog.
+
+    Catalog objects keep their table between calls. Plain dictionaries
+    get a fresh table, so work is only shared within a single call.
+    """
+    if isinstance(catalog, Catalog):
+        return catalog.cache.setdefault("closures", {})
+    return {}
+
+
+def _fill_closures(course_ids, catalog, closures):
+    """Compute the dependency closure of each course that needs one.
+
+    The prerequisite graph is walked depth first without recursion, so
+    every course's closure is built exactly once, after the closures of
+    all of its prerequisites (i.e. in topological order). Prerequisites
+    that are not in the catalog are treated as having no prerequisites.
+
+    Args:
+        course_ids (iterable): The courses whose closures are needed.
+        catalog (dict): The dictionary containing course information.
+        closures (dict): Known closures, updated in place.
+
+    Raises:
+        ValueError: If the prerequisites contain a cycle.
+    """
+    in_progress = set()
+    for start in course_ids:
+        if start in closures:
+            continue
+        stack = [(start, False)]
+        while stack:
+            course, expanded = stack.pop()
+            if course in closures:
+                continue
+            entry = catalog.get(course)
+            pre_reqs = entry["prerequisites"] if entry is not None else ()
+
+            if expanded:
+                # All prerequisites are done, so combine their closures
+                dependencies = set(pre_reqs)
+                for req in pre_reqs:
+                    dependencies |= closures[req]
+                closures[course] = frozenset(dependencies)
+                in_progress.discard(course)
+            elif course in in_progress:
+                raise ValueError(f"Prerequisite cycle involving {course}")
+            else:
+                in_progress.add(course)
+                stack.append((course, True))
+                for req in pre_reqs:
+                    if req not in closures:
+                        stack.append((req, False))
+
+
 def get_dependencies(course_id, catalog):
     """Get the all dependencies for a course.
 
     This function will return the prerequisites for the course, plus
     all prerequisites for those prerequisites, and so on.
 
+    Closures are cached on Catalog objects, so repeated lookups do not
+    walk the prerequisite graph again until the catalog changes. Because
+    the cached value is shared, it is returned as a frozenset (earlier
+    versions returned a new set); copy it with set() to modify it.
+
     Args:
         course_id (str): The ID of the course.
         catalog (dict): The dictionary containing course information.
 
     Returns:
-        set: A set of course dependencies.
+        frozenset: A set of course dependencies.
+
+    Raises:
+        KeyError: If the course is not in the catalog.
+        ValueError: If the prerequisites contain a cycle.
+    """
+    # The table also holds prerequisites that are missing from the catalog
+    if course_id not in catalog:
+        raise KeyError(course_id)
+    closures = _closure_table(catalog)
+    if course_id not in closures:
+        _fill_closures((course_id,), catalog, closures)
+    return closures[course_id]
+
+
+def all_dependencies(catalog):
+    """Get the dependencies of every course in a catalog.
+
+    Every closure is computed once, in topological order, so the total
+    work is linear in the size of the prerequisite graph. For Catalog
+    objects the result also warms the cache used by get_dependencies.
+
+    Args:
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        dict: Maps each course id to a frozenset of its dependencies.
+
+    Raises:
+        ValueError: If the prerequisites contain a cycle.
+    """
+    closures = _closure_table(catalog)
+    _fill_closures(catalog, catalog, closures)
+    return {course: closures[course] for course in catalog}
+
+
+def sorted_dependencies(course_id, catalog):
+    """Get the dependencies of a course in sorted order.
+
+    Sorted tuples are cached on Catalog objects alongside the closures.
+
+    Args:
+        course_id (str): The ID of the course.
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        tuple: The course's dependencies, sorted.
+    """
+    if not isinstance(catalog, Catalog):
+        return tuple(sorted(get_dependencies(course_id, catalog)))
+
+    table = catalog.cache.setdefault("sorted_closures", {})
+    result = table.get(course_id)
+    if result is None:
+        result = tuple(sorted(get_dependencies(course_id, catalog)))
+        table[course_id] = result
+    return result
+
+
+def get_index(catalog):
+    """Get the compiled CatalogIndex for a catalog.
+
+    The index is built once per Catalog version and then reused. Plain
+    dictionaries get a new index on every call.
+
+    Args:
+        catalog (dict): The dictionary containing course information.
 
+    Returns:
+        CatalogIndex: The integer-indexed form of the catalog.
     """
-    pre_reqs = catalog[course_id]["prerequisites"]
-    if pre_reqs == {} or pre_reqs == set():
-        return set()
+    if not isinstance(catalog, Catalog):
+        return catalog_index.CatalogIndex(catalog)
+
+    index = catalog.cache.get("index")
+    if index is None:
+        index = catalog_index.CatalogIndex(catalog)
+        catalog.cache["index"] = index
+    return index
+
+
+def get_analysis(catalog):
+    """Get the depth and height analysis of a catalog.
+
+    Like get_index, the analysis is built once per Catalog version.
+
+    Args:
+        catalog (dict): The dictionary containing course information.
 
-    dependencies = set()
-    # Add the pre_req and it's dependencies
-    for req in pre_reqs:
-        dependencies.add(req)
+    Returns:
+        CourseAnalysis: The analysis of the prerequisite graph.
 
-        for sub_reqs in get_dependencies(req, catalog):
-            dependencies.add(sub_reqs)
+    Raises:
+        ValueError: If the prerequisites contain a cycle.
+    """
+    if not isinstance(catalog, Catalog):
+        return analysis.CourseAnalysis(get_index(catalog))
 
-    return dependencies
+    result = catalog.cache.get("analysis")
+    if result is None:
+        result = analysis.CourseAnalysis(get_index(catalog))
+        catalog.cache["analysis"] = result
+    return result
 
 
-def format_course_info(course_id, catalog, width=40):
+def format_course_info(course_id, catalog, width=40, critical_path=False):
     """Format course information for display.
 
     The resulting string will have five fields: Name, Description,
@@ -130,71 +624,54 @@ def format_course_info(course_id, catalog, width=40):
         course_id (str): The ID of the course.
         catalog (dict): The dictionary containing course information.
         width (int, optional): The width for text wrapping. Defaults to 40.
+        critical_path (bool, optional): Add a sixth field, Critical Path,
+            listing the longest chain of courses through this one.
+            Defaults to False.
 
     Returns:
         str: Formatted course information.
 
     """
-    final_str = ""
     course = catalog[course_id]
+    # Collect the pieces and join them once at the end
+    pieces = []
 
-    # Add Name
-    name_str = "Name: " + course["name"]
-    for line in textwrap.wrap(name_str, width):
-        final_str += line + "\n"
-    final_str += "\n"
+    def add_field(text):
+        for line in textwrap.wrap(text, width):
+            pieces.append(line)
+            pieces.append("\n")
 
-    # Add Description
-    desc_str = "Description: " + course["description"]
+    # Add Name
+    add_field("Name: " + course["name"])
+    pieces.append("\n")
 
-    for line in textwrap.wrap(desc_str, width):
-        final_str += line + "\n"
-    final_str += "\n"
+    # Add Description (some catalogs use null for a missing description)
+    add_field("Description: " + (course["description"] or ""))
+    pieces.append("\n")
 
     # Add Credits
     creds = course["credits"]
     creds_str = ""
     if len(creds) > 1:
-        creds_str += "Credits: " + f"{creds[0]}-{creds[-1]}"
+        creds_str = f"Credits: {creds[0]}-{creds[-1]}"
     elif len(creds) == 1:
-        creds_str += "Credits: " + f"{creds[0]}"
-
-    for line in textwrap.wrap(creds_str, width):
-        final_str += line + "\n"
-    final_str += "\n"
+        creds_str = f"Credits: {creds[0]}"
+    add_field(creds_str)
+    pieces.append("\n")
 
     # Add Prerequisites
-    reqs_str = "Prerequisites: "
-
-    iterations = 0
-    for pre_req in course["prerequisites"]:
-        if iterations != len(course["prerequisites"]) - 1:
-            reqs_str += pre_req + ", "
-        else:
-            reqs_str += pre_req
-        iterations += 1
-
-    for line in textwrap.wrap(reqs_str, width):
-        final_str += line + "\n"
-    final_str += "\n"
+    add_field("Prerequisites: " + ", ".join(course["prerequisites"]))
+    pieces.append("\n")
 
     # Add Dependencies
-    depnds_str = "Dependencies: "
-    course_depnds = list(sorted(get_dependencies(course_id, catalog)))
+    add_field("Dependencies: " + ", ".join(sorted_dependencies(course_id, catalog)))
 
-    iterations = 0
-    for depnd in course_depnds:
-        if iterations != len(course_depnds) - 1:
-            depnds_str += depnd + ", "
-        else:
-            depnds_str += depnd
-
-        iterations += 1
-
-    for line in textwrap.wrap(depnds_str, width):
-        final_str += line + "\n"
+    # Add Critical Path
+    if critical_path:
+        pieces.append("\n")
+        add_field("Critical Path: " + ", ".join(get_analysis(catalog).critical_path(course_id)))
 
-    return final_str.strip()
+    return "".join(pieces).strip()
 
 
 def total_credits(schedule, catalog):
@@ -209,6 +686,12 @@ def total_credits(schedule, catalog):
             total credits for the schedule and the second is the maximum total
             credits.
     """
+    # Only use an index that already exists: building one reads the whole
+    # catalog, which costs more than looking up a schedule's courses
+    index = catalog.cache.get("index") if isinstance(catalog, Catalog) else None
+    if index is not None:
+        return index.total_credits(schedule)
+
     # Save Max and Min
     num_max = 0
     num_min = 0
@@ -239,6 +722,11 @@ def available_classes(schedule, semester, catalog):
     already present somewhere in the schedule, and all of the
     prerequisites have been fulfilled in some previous semester.
 
+    For a Catalog, a prerequisite scheduled in more than one semester is
+    met by its first placement. Plain dictionaries count each placement,
+    so a duplicated prerequisite leaves the course unavailable there.
+    get_duplicates reports the duplicate itself either way.
+
     Args:
         schedule (list): The current course schedule.
         semester (int): The semester for which to find available classes.
@@ -248,6 +736,9 @@ def available_classes(schedule, semester, catalog):
         set: A set of available classes for the specified semester.
 
     """
+    if isinstance(catalog, Catalog):
+        return get_index(catalog).available_classes(schedule, semester, get_analysis(catalog))
+
     classes = set()
     for course in catalog:
         course_reqs = catalog[course]["prerequisites"]
@@ -265,6 +756,24 @@ def available_classes(schedule, semester, catalog):
     return classes
 
 
+def available_by_semester(schedule, catalog):
+    """Get the available classes for every semester in a schedule.
+
+    This gives the same answer as calling available_classes once for
+    each semester, but makes a single pass over the catalog: each
+    course is placed in the first semester its prerequisites allow,
+    and the results are accumulated forward from there.
+
+    Args:
+        schedule (list): The current course schedule.
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        list: One set of available classes for each semester.
+    """
+    return get_index(catalog).available_by_semester(schedule)
+
+
 def check_semester(course, schedule):
     """Checks each semester to see if the course is in the semester.
 
@@ -294,6 +803,9 @@ def check_prerequisites(schedule, catalog):
     Returns:
         set: A set of courses with unmet prerequisites.
     """
+    if isinstance(catalog, Catalog):
+        return get_index(catalog).check_prerequisites(schedule)
+
     invalid_classes = set()
 
     current_semester = 0
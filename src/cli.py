@@ -0,0 +1,258 @@
+"""Command-line interface to the Advising Buddy tools.
+
+This runs the same checks as the GUI without needing a display, and
+writes one JSON object per line (JSON Lines) as each result is ready,
+so it can be used in shell pipelines. It never imports tkinter.
+
+Schedules can be given as JSON files, as directories (every *.json file
+inside is used), or on standard input with one JSON schedule per line.
+The catalog can also be a *.manifest.json file listing catalog shards
+(see sharded_catalog).
+
+Examples:
+    python3 src/cli.py --catalog cs_catalog.json check schedules/
+    python3 src/cli.py --catalog cs_catalog.json credits plan.json
+    python3 src/cli.py --catalog cs_catalog.json info "CS 240" "CS 261"
+    cat plans.jsonl | python3 src/cli.py --catalog cs_catalog.json available
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import catalog_cache
+import catalog_utils
+import schedule_utils
+import sharded_catalog
+
+
+def write_record(record, out):
+    """Write a single JSON Lines record and flush it."""
+    out.write(json.dumps(record) + "\n")
+    out.flush()
+
+
+def expand_paths(paths):
+    """Expand directories into the JSON files they contain.
+
+    Args:
+        paths (list): File and directory names.
+
+    Yields:
+        str: The filename of each schedule.
+    """
+    for path in paths:
+        if os.path.isdir(path):
+            for name in sorted(os.listdir(path)):
+                if name.endswith(".json"):
+                    yield os.path.join(path, name)
+        else:
+            yield path
+
+
+def iter_schedules(paths, stdin, on_error):
+    """Find the schedules named on the command line or given on stdin.
+
+    Files are not read here, so callers can hand the filenames to other
+    processes. Lines from stdin are parsed immediately; any that are
+    not valid schedules are passed to on_error and skipped.
+
+    Args:
+        paths (list): File and directory names. Empty or ["-"] means
+            read JSON Lines from stdin.
+        stdin (file): The standard input stream.
+        on_error (function): Called with (source, message) for each
+            stdin line that cannot be parsed.
+
+    Yields:
+        tuple: The source name and either a filename or a schedule.
+    """
+    if paths and paths != ["-"]:
+        for path in expand_paths(paths):
+            yield path, path
+        return
+
+    for line_num, line in enumerate(stdin, 1):
+        line = line.strip()
+        if not line:
+            continue
+        source = f"<stdin>:{line_num}"
+        try:
+            yield source, schedule_utils.json_to_schedule(json.loads(line))
+        except (ValueError, TypeError) as error:
+            on_error(source, f"{type(error).__name__}: {error}")
+
+
+def load_item(item):
+    """Return the schedule for an item from iter_schedules."""
+    if isinstance(item, str):
+        return schedule_utils.load_schedule(item)
+    return item
+
+
+def run_check(args, catalog, out, stdin):
+    import batch
+
+    problems = []
+
+    def report_error(source, message):
+        problems.append(source)
+        write_record({"source": source, "error": message}, out)
+
+    sources = []
+
+    def items():
+        for source, item in iter_schedules(args.schedules, stdin, report_error):
+            sources.append(source)
+            yield item
+
+    # Hand the workers the filename so they load the compiled catalog themselves
+    use_file = args.jobs != 1 and not args.no_cache and not sharded_catalog.is_manifest(args.catalog)
+    catalog_arg = args.catalog if use_file else catalog
+    for result in batch.validate_schedules(items(), catalog_arg, processes=args.jobs):
+        result["source"] = sources[result.pop("index")]
+        if "error" in result or not result["valid"]:
+            problems.append(result["source"])
+        write_record(result, out)
+    return 1 if problems else 0
+
+
+def run_per_schedule(args, catalog, out, stdin, compute):
+    """Apply compute(schedule) to each schedule and write the results."""
+    status = 0
+
+    def report_error(source, message):
+        nonlocal status
+        status = 1
+        write_record({"source": source, "error": message}, out)
+
+    for source, item in iter_schedules(args.schedules, stdin, report_error):
+        record = {"source": source}
+        try:
+            record.update(compute(load_item(item)))
+        except (OSError, ValueError, KeyError, TypeError) as error:
+            status = 1
+            record["error"] = f"{type(error).__name__}: {error}"
+        write_record(record, out)
+    return status
+
+
+def run_credits(args, catalog, out, stdin):
+    def compute(schedule):
+        num_min, num_max = catalog_utils.total_credits(schedule, catalog)
+        return {"min": num_min, "max": num_max}
+
+    return run_per_schedule(args, catalog, out, stdin, compute)
+
+
+def run_available(args, catalog, out, stdin):
+    def compute(schedule):
+        if args.semester is not None and not 0 <= args.semester < len(schedule):
+            raise ValueError(f"semester {args.semester} is not in a {len(schedule)} semester schedule")
+        by_semester = catalog_utils.available_by_semester(schedule, catalog)
+        if args.semester is not None:
+            return {"semester": args.semester, "available": sorted(by_semester[args.semester])}
+        return {"available": [sorted(classes) for classes in by_semester]}
+
+    return run_per_schedule(args, catalog, out, stdin, compute)
+
+
+def run_info(args, catalog, out, stdin):
+    course_ids = args.courses
+    if not course_ids:
+        course_ids = (line.strip() for line in stdin if line.strip())
+
+    status = 0
+    for course_id in course_ids:
+        record = {"course": course_id}
+        if course_id in catalog:
+            record["info"] = catalog_utils.format_course_info(course_id, catalog, args.width)
+        else:
+            status = 1
+            record["error"] = "Unknown course"
+        write_record(record, out)
+    return status
+
+
+def build_parser():
+    """Create the argument parser for the command-line interface."""
+    parser = argparse.ArgumentParser(
+        prog="cli.py", description="Headless Advising Buddy tools (JSON Lines output)."
+    )
+    parser.add_argument("--catalog", required=True, help="catalog JSON file")
+    parser.add_argument(
+        "--no-cache", action="store_true", help="do not use the compiled catalog cache"
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    schedules_help = "schedule JSON files or directories (default: JSON Lines on stdin)"
+
+    check = commands.add_parser("check", help="report duplicates and unmet prerequisites")
+    check.add_argument("schedules", nargs="*", help=schedules_help)
+    check.add_argument(
+        "-j", "--jobs", type=int, default=1, help="worker processes (0 = one per CPU)"
+    )
+    check.set_defaults(run=run_check)
+
+    credits = commands.add_parser("credits", help="report the total credit range")
+    credits.add_argument("schedules", nargs="*", help=schedules_help)
+    credits.set_defaults(run=run_credits)
+
+    available = commands.add_parser("available", help="report the available courses")
+    available.add_argument("schedules", nargs="*", help=schedules_help)
+    available.add_argument("-s", "--semester", type=int, help="only report this semester")
+    available.set_defaults(run=run_available)
+
+    info = commands.add_parser("info", help="show course information")
+    info.add_argument("courses", nargs="*", help="course ids (default: one per line on stdin)")
+    info.add_argument("-w", "--width", type=int, default=40, help="wrap width")
+    info.set_defaults(run=run_info)
+
+    return parser
+
+
+def main(argv=None, out=None, stdin=None):
+    """Run the command-line interface.
+
+    Args:
+        argv (list, optional): The arguments. Defaults to sys.argv[1:].
+        out (file, optional): Where to write results. Defaults to stdout.
+        stdin (file, optional): Where to read input. Defaults to stdin.
+
+    Returns:
+        int: The exit status; 1 if any schedule had problems, 2 if the
+            catalog is missing, unreadable or invalid.
+    """
+    args = build_parser().parse_args(argv)
+    out = out or sys.stdout
+    stdin = stdin or sys.stdin
+    if getattr(args, "jobs", 1) == 0:
+        args.jobs = None
+
+    try:
+        if sharded_catalog.is_manifest(args.catalog):
+            catalog = sharded_catalog.load_manifest(args.catalog)
+        elif args.no_cache:
+            catalog = catalog_utils.load_catalog(args.catalog)
+        else:
+            catalog = catalog_cache.load_compiled_catalog(args.catalog)
+    except catalog_utils.CatalogError as error:
+        write_record({"source": args.catalog, "error": str(error), "report": error.report}, out)
+        return 2
+    except (OSError, ValueError) as error:
+        write_record({"source": args.catalog, "error": f"{type(error).__name__}: {error}"}, out)
+        return 2
+    return args.run(args, catalog, out, stdin)
+
+
+if __name__ == "__main__":
+    try:
+        sys.exit(main())
+    except BrokenPipeError:
+        # The reader went away (e.g. piped into head); stop quietly
+        sys.stderr.close()
+        sys.exit(0)
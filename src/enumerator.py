@@ -0,0 +1,258 @@
+"""Count and list every valid ordering of a set of courses.
+
+For curriculum review it is useful to know how many different ways a
+set of required courses can be spread over a number of semesters. A
+ScheduleSpace answers that with dynamic programming over bitmasks: the
+set of courses finished so far is an int with one bit per course, and
+the number of ways to finish from each (semester, finished) state is
+computed once and remembered.
+
+The rules are the same ones the rest of the application checks: every
+course is taken exactly once (no duplicates, as in get_duplicates) and
+only after all of its prerequisites are done in an earlier semester
+(as in check_prerequisites).
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import multiprocessing
+
+
+class ScheduleSpace:
+    """The valid schedules of a set of courses over a number of semesters.
+
+    Schedules are lists with one set of course ids per semester. Empty
+    semesters are allowed.
+
+    Attributes:
+        courses (list): The course ids, in bit order.
+        num_semesters (int): The number of semesters in each schedule.
+    """
+
+    def __init__(self, courses, catalog, num_semesters, completed=(), max_courses=None,
+                 max_credits=None, pinned=None):
+        """Describe the schedules to count or enumerate.
+
+        Args:
+            courses (iterable): The course ids that must be scheduled.
+            catalog (dict): The dictionary containing course information.
+            num_semesters (int): The number of semesters to fill.
+            completed (iterable, optional): Ids of courses already done,
+                which satisfy prerequisites without being scheduled.
+            max_courses (int, optional): The most courses per semester.
+            max_credits (int, optional): The most credits per semester,
+                counting each course at its maximum credits.
+            pinned (dict, optional): Maps course ids to the semester
+                (0-based) they must be taken in.
+
+        Raises:
+            KeyError: If a course is not in the catalog.
+            ValueError: If a course has a prerequisite that is neither
+                being scheduled nor completed, or a pin is out of range.
+        """
+        self.courses = sorted(set(courses))
+        self.num_semesters = num_semesters
+        self.max_courses = max_courses
+        self.max_credits = max_credits
+        bits = {course: i for i, course in enumerate(self.courses)}
+        completed = set(completed)
+
+        self.prereq_masks = []
+        self.credits = []
+        for course in self.courses:
+            mask = 0
+            for req in catalog[course]["prerequisites"]:
+                if req in bits:
+                    mask |= 1 << bits[req]
+                elif req not in completed:
+                    raise ValueError(f"{course} requires {req}, which is not included")
+            self.prereq_masks.append(mask)
+            self.credits.append(catalog[course]["credits"][-1])
+        self.full = (1 << len(self.courses)) - 1
+
+        # Courses that must be (or must not be) taken in each semester
+        self.pinned_at = [0] * num_semesters
+        self.pinned_mask = 0
+        for course, semester in (pinned or {}).items():
+            if not 0 <= semester < num_semesters:
+                raise ValueError(f"{course} is pinned outside the schedule")
+            self.pinned_at[semester] |= 1 << bits[course]
+            self.pinned_mask |= 1 << bits[course]
+
+        # needs_more[k] holds the courses whose chain of dependents needs
+        # more than k semesters, starting with the course itself
+        chain = self._chain_lengths()
+        self.needs_more = [
+            sum(1 << i for i, length in enumerate(chain) if length > k)
+            for k in range(num_semesters + 1)
+        ]
+        self._memo = {}
+
+    def _chain_lengths(self):
+        """Return the longest chain of courses starting at each course."""
+        chain = [None] * len(self.courses)
+        dependents = [[] for _ in self.courses]
+        for i, mask in enumerate(self.prereq_masks):
+            for j in range(len(self.courses)):
+                if mask >> j & 1:
+                    dependents[j].append(i)
+
+        def length(i, seen):
+            if chain[i] is None:
+                if i in seen:
+                    raise ValueError("The prerequisites contain a cycle")
+                seen.add(i)
+                chain[i] = 1 + max((length(d, seen) for d in dependents[i]), default=0)
+            return chain[i]
+
+        for i in range(len(self.courses)):
+            length(i, set())
+        return chain
+
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        state["_memo"] = {}
+        return state
+
+    def _fits(self, chosen):
+        """Check a semester's courses against the per-semester limits."""
+        if self.max_courses is not None and chosen.bit_count() > self.max_courses:
+            return False
+        if self.max_credits is not None:
+            total = 0
+            bit = 0
+            while chosen >> bit:
+                if chosen >> bit & 1:
+                    total += self.credits[bit]
+                bit += 1
+            if total > self.max_credits:
+                return False
+        return True
+
+    def _choices(self, semester, done):
+        """Yield every allowed set of courses (as a mask) for a semester."""
+        forced = self.pinned_at[semester]
+        if forced & ~done & self.full != forced:
+            return
+        free = 0
+        for i, mask in enumerate(self.prereq_masks):
+            bit = 1 << i
+            if not done & bit and mask & done == mask and not self.pinned_mask & bit:
+                free |= bit
+        if forced:
+            # Pinned courses still need their own prerequisites
+            for i, mask in enumerate(self.prereq_masks):
+                if forced >> i & 1 and mask & done != mask:
+                    return
+
+        sub = free
+        while True:
+            chosen = forced | sub
+            if self._fits(chosen):
+                yield chosen
+            if sub == 0:
+                break
+            sub = (sub - 1) & free
+
+    def _count(self, semester, done):
+        """Count the ways to finish from a (semester, done) state."""
+        key = (semester, done)
+        if key in self._memo:
+            return self._memo[key]
+
+        left = self.num_semesters - semester
+        remaining = self.full & ~done
+        if remaining & self.needs_more[left]:
+            ways = 0
+        elif self.max_courses is not None and remaining.bit_count() > left * self.max_courses:
+            ways = 0
+        elif semester == self.num_semesters:
+            ways = 1 if remaining == 0 else 0
+        else:
+            ways = sum(self._count(semester + 1, done | chosen)
+                       for chosen in self._choices(semester, done))
+        self._memo[key] = ways
+        return ways
+
+    def _to_set(self, mask):
+        return {course for i, course in enumerate(self.courses) if mask >> i & 1}
+
+    def first_choices(self):
+        """List the possible first semesters, for splitting up the work.
+
+        Returns:
+            list: The allowed first-semester course sets, as frozensets.
+        """
+        return [frozenset(self._to_set(chosen)) for chosen in self._choices(0, 0)
+                if self._count(1, chosen) > 0]
+
+    def _first_mask(self, first):
+        bits = {course: i for i, course in enumerate(self.courses)}
+        return sum(1 << bits[course] for course in first)
+
+    def count(self, first=None):
+        """Count the valid schedules without building them.
+
+        Args:
+            first (iterable, optional): Only count schedules whose first
+                semester is exactly this set of courses.
+
+        Returns:
+            int: The number of valid schedules.
+        """
+        if first is None:
+            return self._count(0, 0)
+        chosen = self._first_mask(first)
+        if chosen not in set(self._choices(0, 0)):
+            return 0
+        return self._count(1, chosen)
+
+    def enumerate(self, first=None):
+        """Generate the valid schedules one at a time.
+
+        Args:
+            first (iterable, optional): Only generate schedules whose first
+                semester is exactly this set of courses.
+
+        Yields:
+            list: A schedule with one set of course ids per semester.
+        """
+        if first is not None:
+            chosen = self._first_mask(first)
+            if self.count(first) == 0:
+                return
+            stack = [(1, chosen, [chosen])]
+        else:
+            stack = [(0, 0, [])]
+
+        while stack:
+            semester, done, path = stack.pop()
+            if semester == self.num_semesters:
+                yield [self._to_set(mask) for mask in path]
+                continue
+            children = [chosen for chosen in self._choices(semester, done)
+                        if self._count(semester + 1, done | chosen) > 0]
+            for chosen in reversed(children):
+                stack.append((semester + 1, done | chosen, path + [chosen]))
+
+
+def _count_first(task):
+    space, first = task
+    return space.count(first)
+
+
+def count_parallel(space, processes=None):
+    """Count the schedules in a space, splitting work by first semester.
+
+    Args:
+        space (ScheduleSpace): The schedules to count.
+        processes (int, optional): The number of worker processes.
+            Defaults to the number of CPUs.
+
+    Returns:
+        int: The number of valid schedules.
+    """
+    tasks = [(space, first) for first in space.first_choices()]
+    with multiprocessing.Pool(processes) as pool:
+        return sum(pool.imap_unordered(_count_first, tasks))
@@ -0,0 +1,175 @@
+"""Downstream impact queries: what a course unlocks or breaks.
+
+A ReachabilityIndex stores, for every course, one int whose set bits
+are the integer ids (from the CatalogIndex) of every course that
+depends on it directly or indirectly. Together these rows form a
+packed-bit reachability matrix, so asking what a course (or set of
+courses) leads to is a few bitwise operations instead of a search.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import catalog_utils
+
+
+def _bits(mask):
+    """Yield the positions of the set bits of a mask."""
+    while mask:
+        low = mask & -mask
+        yield low.bit_length() - 1
+        mask ^= low
+
+
+class ReachabilityIndex:
+    """The transitive dependents of every course, as packed bit rows.
+
+    Attributes:
+        index (CatalogIndex): The index the rows are numbered by.
+        downstream (list): For each integer id, a mask of every course
+            that requires it directly or indirectly.
+    """
+
+    def __init__(self, index, analysis):
+        """Build the matrix from a catalog's index and analysis.
+
+        Args:
+            index (CatalogIndex): The integer-indexed catalog.
+            analysis (CourseAnalysis): Supplies the topological order.
+        """
+        self.index = index
+        downstream = [0] * len(index)
+        # Dependents come later in topological order, so walk it backwards
+        for i in reversed(analysis.order):
+            mask = 0
+            for dependent in index.dependents[i]:
+                mask |= (1 << dependent) | downstream[dependent]
+            downstream[i] = mask
+        self.downstream = downstream
+
+    def mask_of(self, courses):
+        """Convert course ids into a mask, ignoring unknown courses."""
+        mask = 0
+        for course in courses:
+            course_id = self.index.ids.get(course)
+            if course_id is not None:
+                mask |= 1 << course_id
+        return mask
+
+    def to_set(self, mask):
+        """Convert a mask back into a set of course ids."""
+        return {self.index.courses[i] for i in _bits(mask)}
+
+    def downstream_mask(self, courses):
+        """Get the mask of everything downstream of some courses.
+
+        Raises:
+            KeyError: If a course is not in the catalog.
+        """
+        mask = 0
+        for course in courses:
+            mask |= self.downstream[self.index.ids[course]]
+        return mask
+
+
+def get_reachability(catalog):
+    """Get the ReachabilityIndex for a catalog.
+
+    It is built once per Catalog version and then reused.
+
+    Args:
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        ReachabilityIndex: The reachability matrix of the catalog.
+    """
+    if not isinstance(catalog, catalog_utils.Catalog):
+        return ReachabilityIndex(catalog_utils.get_index(catalog),
+                                 catalog_utils.get_analysis(catalog))
+
+    result = catalog.cache.get("reachability")
+    if result is None:
+        result = ReachabilityIndex(catalog_utils.get_index(catalog),
+                                   catalog_utils.get_analysis(catalog))
+        catalog.cache["reachability"] = result
+    return result
+
+
+def _as_courses(courses):
+    """Accept a single course id or an iterable of them."""
+    return (courses,) if isinstance(courses, str) else courses
+
+
+def downstream(courses, catalog):
+    """Get every course that depends on a course or set of courses.
+
+    This is what taking the courses opens up, eventually.
+
+    Args:
+        courses (str or iterable): A course id or several of them.
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        set: The ids of every course that requires one of the courses,
+            directly or indirectly.
+
+    Raises:
+        KeyError: If a course is not in the catalog.
+    """
+    reach = get_reachability(catalog)
+    return reach.to_set(reach.downstream_mask(_as_courses(courses)))
+
+
+def what_if_remove(schedule, course, catalog):
+    """Find the scheduled courses affected by dropping a course.
+
+    Courses that list the dropped course as a prerequisite would be
+    reported by check_prerequisites straight away; the courses that
+    depend on those are included as well, since their prerequisites
+    can no longer be met properly either. Nothing else in the schedule
+    is revalidated.
+
+    Args:
+        schedule (list): The course schedule.
+        course (str): The course that would be dropped.
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        set: The scheduled courses that depend on the dropped course.
+
+    Raises:
+        KeyError: If the course is not in the catalog.
+    """
+    reach = get_reachability(catalog)
+    scheduled = reach.mask_of(set().union(*schedule)) if schedule else 0
+    return reach.to_set(reach.downstream_mask((course,)) & scheduled)
+
+
+def what_if_add(schedule, course, catalog):
+    """Find the courses that adding a course to a schedule would open up.
+
+    A course opens up if it requires the added course and every one of
+    its other prerequisites is already in the schedule.
+
+    Args:
+        schedule (list): The course schedule.
+        course (str): The course that would be added.
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        set: The unscheduled courses that become takeable.
+
+    Raises:
+        KeyError: If the course is not in the catalog.
+    """
+    reach = get_reachability(catalog)
+    index = reach.index
+    scheduled = reach.mask_of(set().union(*schedule)) if schedule else 0
+    done = scheduled | (1 << index.ids[course])
+    opened = set()
+    for dependent in index.dependents[index.ids[course]]:
+        if scheduled >> dependent & 1 or dependent in index.blocked:
+            continue
+        if all(done >> req & 1 for req in index.prerequisites[dependent]):
+            opened.add(index.courses[dependent])
+    return opened
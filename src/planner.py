@@ -0,0 +1,149 @@
+"""Automatic degree planning.
+
+Given the courses a student wants to take, plan_schedule fills in a
+schedule that satisfies every prerequisite while staying under the
+per-semester credit and course limits. Any prerequisites needed to
+reach the target courses are added automatically.
+
+Courses are placed one semester at a time. Among the courses whose
+prerequisites are already done, the ones at the head of the longest
+remaining prerequisite chain (the critical path) are placed first,
+since delaying them delays graduation.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import catalog_utils
+
+
+def required_courses(targets, catalog, completed=()):
+    """Find every course that must be taken to take the targets.
+
+    Prerequisites of completed courses are assumed to be satisfied.
+
+    Args:
+        targets (iterable): The ids of the courses the student wants.
+        catalog (dict): The dictionary containing course information.
+        completed (iterable, optional): Ids of courses already done.
+
+    Returns:
+        set: The targets and their prerequisites, minus completed courses.
+
+    Raises:
+        KeyError: If a course is not in the catalog.
+    """
+    completed = set(completed)
+    required = set()
+    stack = [course for course in targets if course not in completed]
+    while stack:
+        course = stack.pop()
+        if course in required:
+            continue
+        required.add(course)
+        for req in catalog[course]["prerequisites"]:
+            if req not in completed and req not in required:
+                stack.append(req)
+    return required
+
+
+def _limit(limit, semester):
+    """Return the limit for a semester from an int or a per-semester list."""
+    if isinstance(limit, int):
+        return limit
+    return limit[semester]
+
+
+def plan_schedule(targets, catalog, completed=(), num_semesters=8, max_credits=18,
+                  max_courses=5):
+    """Plan a schedule that includes the target courses.
+
+    The result is in the same format used by schedule_utils: a list of
+    sets where entry 0 holds the completed (AP/Transfer) courses and
+    entries 1 through num_semesters hold the planned semesters.
+
+    A course counts against the credit limit with its maximum credits.
+
+    Args:
+        targets (iterable): The ids of the courses the student wants.
+        catalog (dict): The dictionary containing course information.
+        completed (iterable, optional): Ids of courses already done.
+        num_semesters (int, optional): Semesters to plan. Defaults to 8.
+        max_credits (int or list, optional): The credit limit, either for
+            every semester or as a list with one entry per semester.
+            Defaults to 18.
+        max_courses (int or list, optional): The course limit, in the
+            same form as max_credits. Defaults to 5.
+
+    Returns:
+        list: The planned schedule, with num_semesters + 1 entries.
+
+    Raises:
+        KeyError: If a course is not in the catalog.
+        ValueError: If the courses cannot fit in the available semesters.
+    """
+    completed = set(completed)
+    required = required_courses(targets, catalog, completed)
+    index = catalog_utils.get_index(catalog)
+    ids = [index.ids[course] for course in required]
+    in_plan = set(ids)
+
+    # Count the prerequisites each course is still waiting on
+    waiting = {}
+    for i in ids:
+        if i in index.blocked:
+            raise ValueError(f"{index.courses[i]} has a prerequisite outside the catalog")
+        waiting[i] = sum(1 for req in index.prerequisites[i] if req in in_plan)
+
+    # Length of the longest chain of planned courses that depend on each one
+    height = {}
+    order = [i for i in ids if waiting[i] == 0]
+    remaining = dict(waiting)
+    for i in order:
+        for dependent in index.dependents[i]:
+            if dependent in in_plan:
+                remaining[dependent] -= 1
+                if remaining[dependent] == 0:
+                    order.append(dependent)
+    if len(order) != len(ids):
+        raise ValueError("The prerequisites of the target courses contain a cycle")
+    for i in reversed(order):
+        height[i] = max((height[d] + 1 for d in index.dependents[i] if d in in_plan), default=0)
+
+    schedule = [completed] + [set() for _ in range(num_semesters)]
+    ready = [i for i in ids if waiting[i] == 0]
+    unplaced = len(ids)
+    for sem in range(1, num_semesters + 1):
+        credit_limit = _limit(max_credits, sem - 1)
+        course_limit = _limit(max_courses, sem - 1)
+        ready.sort(key=lambda i: (-height[i], -index.max_credits[i], index.courses[i]))
+
+        placed = []
+        deferred = []
+        credits = 0
+        for i in ready:
+            if len(placed) < course_limit and credits + index.max_credits[i] <= credit_limit:
+                placed.append(i)
+                credits += index.max_credits[i]
+            else:
+                deferred.append(i)
+
+        # Courses unlocked this semester can only be taken next semester
+        ready = deferred
+        for i in placed:
+            schedule[sem].add(index.courses[i])
+            for dependent in index.dependents[i]:
+                if dependent in in_plan:
+                    waiting[dependent] -= 1
+                    if waiting[dependent] == 0:
+                        ready.append(dependent)
+        unplaced -= len(placed)
+
+    if unplaced:
+        largest_limit = max((_limit(max_credits, sem) for sem in range(num_semesters)),
+                            default=0)
+        too_big = [index.courses[i] for i in ids if index.max_credits[i] > largest_limit]
+        if too_big:
+            raise ValueError("Courses exceed the credit limit: " + ", ".join(sorted(too_big)))
+        raise ValueError(f"The target courses need more than {num_semesters} semesters")
+    return schedule
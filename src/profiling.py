@@ -0,0 +1,259 @@
+"""Opt-in timing of the catalog and schedule functions and GUI callbacks.
+
+When profiling is enabled, every registered function is replaced by a
+wrapper that records how many times it was called, how long the calls
+took and how large their inputs were, and a cProfile profiler runs on
+the main thread. Disabling puts the original functions back, so there
+is no cost at all while profiling is off.
+
+Profiling can be switched on from the GUI or by setting the
+COURSE_SCHEDULER_PROFILE environment variable before starting it.
+
+Only calls made through a module or class attribute are seen, e.g.
+catalog_utils.check_prerequisites(...) or self.update_available().
+References saved before profiling was enabled (such as Tk command
+callbacks) keep calling the original function.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import collections
+import cProfile
+import functools
+import inspect
+import json
+import math
+import os
+import threading
+import time
+
+import catalog_utils
+import schedule_utils
+
+ENV_VAR = "COURSE_SCHEDULER_PROFILE"
+
+# Latencies kept per function for computing percentiles
+MAX_SAMPLES = 10000
+
+
+def input_size(args):
+    """Measure the size of a call's arguments.
+
+    Schedules count their courses and other lists, tuples and sets
+    their length. Catalogs (and any other dict) are not counted: they
+    are the same for every call, so their size would hide how the cost
+    depends on the schedule or courses passed in. Anything else counts
+    as zero. The largest argument wins.
+
+    Args:
+        args (tuple): The positional arguments of a call.
+
+    Returns:
+        int: The size of the largest argument.
+    """
+    size = 0
+    for arg in args:
+        if isinstance(arg, list) and arg and isinstance(arg[0], (set, frozenset, list)):
+            size = max(size, sum(len(semester) for semester in arg))
+        elif isinstance(arg, (list, tuple, set, frozenset)):
+            size = max(size, len(arg))
+    return size
+
+
+class CallStats:
+    """Timings for one instrumented function.
+
+    Attributes:
+        count (int): The number of calls.
+        total (float): The total time spent in the function, in seconds.
+        total_size (int): The sum of the input sizes of every call.
+        max_size (int): The largest input size seen.
+        samples (deque): The durations of the most recent calls.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.total_size = 0
+        self.max_size = 0
+        self.samples = collections.deque(maxlen=MAX_SAMPLES)
+
+    def add(self, seconds, size):
+        self.count += 1
+        self.total += seconds
+        self.total_size += size
+        self.max_size = max(self.max_size, size)
+        self.samples.append(seconds)
+
+    def percentile(self, pct):
+        """Get a latency percentile over the recent calls, in seconds."""
+        if not self.samples:
+            return 0.0
+        ordered = sorted(self.samples)
+        rank = math.ceil(pct / 100 * len(ordered)) - 1
+        return ordered[max(0, rank)]
+
+    def to_dict(self):
+        return {
+            "count": self.count,
+            "total": self.total,
+            "mean": self.total / self.count if self.count else 0.0,
+            "p99": self.percentile(99),
+            "max": max(self.samples, default=0.0),
+            "mean_size": self.total_size / self.count if self.count else 0.0,
+            "max_size": self.max_size,
+        }
+
+
+class Profiler:
+    """Swaps timing wrappers in and out for a set of functions.
+
+    Attributes:
+        stats (dict): Maps each label to its CallStats.
+        targets (list): The (owner, attribute name, label, size function)
+            tuples to instrument.
+    """
+
+    def __init__(self):
+        self.stats = {}
+        self.targets = []
+        self.originals = []
+        self.profile = None
+        self.lock = threading.Lock()
+
+    @property
+    def enabled(self):
+        """bool: True while the wrappers are installed."""
+        return bool(self.originals)
+
+    def register(self, owner, names=None, prefix="", size=input_size):
+        """Add functions of a module or methods of a class to instrument.
+
+        Args:
+            owner (module or class): Where the functions are looked up.
+            names (iterable, optional): The attribute names. Defaults to
+                every public function defined in a module.
+            prefix (str, optional): Put in front of each name in the
+                results. Defaults to the module name and a dot.
+            size (function, optional): Measures a call's input from its
+                positional arguments. Defaults to input_size.
+        """
+        if names is None:
+            names = [
+                name for name, value in vars(owner).items()
+                if not name.startswith("_") and callable(value)
+                and not inspect.isclass(value)
+                and getattr(value, "__module__", None) == owner.__name__
+            ]
+        if not prefix:
+            prefix = owner.__name__ + "."
+        was_enabled = self.enabled
+        self.disable()
+        self.targets.extend((owner, name, prefix + name, size) for name in names)
+        if was_enabled:
+            self.enable()
+
+    def _wrap(self, func, label, size):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(label, time.perf_counter() - start, size(args))
+        return wrapper
+
+    def record(self, label, seconds, size=0):
+        """Add one call to the statistics for a label."""
+        with self.lock:
+            stats = self.stats.get(label)
+            if stats is None:
+                stats = self.stats[label] = CallStats()
+            stats.add(seconds, size)
+
+    def enable(self):
+        """Install the wrappers and start the cProfile profiler."""
+        if self.enabled:
+            return
+        for owner, name, label, size in self.targets:
+            original = vars(owner)[name]
+            self.originals.append((owner, name, original))
+            setattr(owner, name, self._wrap(original, label, size))
+        if self.profile is None:
+            self.profile = cProfile.Profile()
+        self.profile.enable()
+
+    def disable(self):
+        """Put the original functions back and pause the profiler."""
+        if not self.enabled:
+            return
+        for owner, name, original in reversed(self.originals):
+            setattr(owner, name, original)
+        self.originals = []
+        self.profile.disable()
+
+    def reset(self):
+        """Throw away everything recorded so far."""
+        with self.lock:
+            self.stats = {}
+        if self.profile is not None:
+            self.profile.disable()
+            self.profile = cProfile.Profile()
+            if self.enabled:
+                self.profile.enable()
+
+    def report(self):
+        """Summarize the recorded calls.
+
+        Returns:
+            list: One dict per label, with the label under "name" and
+                the fields of CallStats.to_dict. The slowest in total
+                come first.
+        """
+        with self.lock:
+            rows = [dict(name=label, **stats.to_dict()) for label, stats in self.stats.items()]
+        rows.sort(key=lambda row: row["total"], reverse=True)
+        return rows
+
+    def export_json(self, filename):
+        """Save the report as a JSON file.
+
+        Args:
+            filename (str): The filename for the JSON file.
+        """
+        with open(filename, "w") as file:
+            json.dump(self.report(), file, indent=4)
+
+    def export_pstats(self, filename):
+        """Save the cProfile results, readable with the pstats module.
+
+        Args:
+            filename (str): The filename for the stats file.
+
+        Raises:
+            ValueError: If profiling has never been enabled.
+        """
+        if self.profile is None:
+            raise ValueError("profiling has not been enabled")
+        # dump_stats stops the profiler, so restart it if it was running
+        self.profile.dump_stats(filename)
+        if self.enabled:
+            self.profile.enable()
+
+
+default_profiler = Profiler()
+default_profiler.register(catalog_utils)
+default_profiler.register(schedule_utils)
+
+
+def enable_from_env():
+    """Enable the default profiler if the environment variable is set.
+
+    Returns:
+        bool: True if profiling was enabled.
+    """
+    if os.environ.get(ENV_VAR, "") not in ("", "0"):
+        default_profiler.enable()
+        return True
+    return False
@@ -0,0 +1,263 @@
+"""A SQLite database of many students' schedules.
+
+Answering a question like "who has CS 345 in semester 5?" from loose
+schedule files means reading every file. A ScheduleStore keeps the
+schedules in one SQLite database instead, as one (student, semester,
+course) row per course taken, with an index on course and semester so
+such questions are a single indexed lookup.
+
+Semesters are numbered from 0 as in the schedule lists, so semester 0
+is the AP/Transfer column.
+
+Examples:
+    python3 src/schedule_store.py students.db import schedules/
+    python3 src/schedule_store.py students.db who "CS 345" --semester 5
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import argparse
+import itertools
+import os
+import sqlite3
+import sys
+
+import schedule_utils
+
+# Schedules written per transaction by the bulk methods
+BATCH_SIZE = 500
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS students (
+    name TEXT PRIMARY KEY,
+    num_semesters INTEGER NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS placements (
+    student TEXT NOT NULL,
+    semester INTEGER NOT NULL,
+    course TEXT NOT NULL,
+    PRIMARY KEY (student, semester, course)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS placements_by_course
+    ON placements (course, semester, student);
+"""
+
+
+def _rows(student, schedule):
+    for sem_num, semester in enumerate(schedule):
+        for course in semester:
+            yield student, sem_num, course
+
+
+class ScheduleStore:
+    """Students' schedules stored in a SQLite database.
+
+    Can be used as a context manager, which closes the database.
+    """
+
+    def __init__(self, filename=":memory:"):
+        """Open a store, creating the database if needed.
+
+        Args:
+            filename (str, optional): The database file. Defaults to an
+                in-memory database.
+        """
+        self.connection = sqlite3.connect(filename)
+        with self.connection:
+            self.connection.executescript(SCHEMA)
+
+    def close(self):
+        self.connection.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def _write(self, student, schedule):
+        """Replace one student's rows (inside the caller's transaction)."""
+        db = self.connection
+        db.execute("DELETE FROM placements WHERE student = ?", (student,))
+        db.execute(
+            "INSERT OR REPLACE INTO students (name, num_semesters) VALUES (?, ?)",
+            (student, len(schedule)),
+        )
+        db.executemany(
+            "INSERT OR IGNORE INTO placements (student, semester, course) VALUES (?, ?, ?)",
+            _rows(student, schedule),
+        )
+
+    def save_schedule(self, student, schedule):
+        """Store a student's schedule, replacing any earlier one.
+
+        Args:
+            student (str): The student's name or id.
+            schedule (list): The course schedule.
+        """
+        with self.connection:
+            self._write(student, schedule)
+
+    def save_many(self, schedules, batch_size=BATCH_SIZE):
+        """Store many schedules, batch_size per transaction.
+
+        Args:
+            schedules (iterable): (student, schedule) pairs.
+            batch_size (int, optional): Defaults to BATCH_SIZE.
+
+        Returns:
+            int: The number of schedules stored.
+        """
+        count = 0
+        schedules = iter(schedules)
+        while True:
+            batch = list(itertools.islice(schedules, batch_size))
+            if not batch:
+                return count
+            with self.connection:
+                for student, schedule in batch:
+                    self._write(student, schedule)
+            count += len(batch)
+
+    def import_files(self, paths, batch_size=BATCH_SIZE):
+        """Store schedule JSON files, named after their files.
+
+        Each student is named after the file without its .json
+        extension, so plans/jdoe.json is stored as "jdoe".
+
+        Args:
+            paths (iterable): Schedule files, or directories whose
+                *.json files are all imported.
+            batch_size (int, optional): Defaults to BATCH_SIZE.
+
+        Returns:
+            int: The number of schedules stored.
+        """
+        def schedules():
+            for path in paths:
+                if os.path.isdir(path):
+                    names = sorted(name for name in os.listdir(path) if name.endswith(".json"))
+                    filenames = [os.path.join(path, name) for name in names]
+                else:
+                    filenames = [path]
+                for filename in filenames:
+                    student = os.path.splitext(os.path.basename(filename))[0]
+                    yield student, schedule_utils.load_schedule(filename)
+
+        return self.save_many(schedules(), batch_size)
+
+    def load_schedule(self, student):
+        """Get a student's schedule.
+
+        Args:
+            student (str): The student's name or id.
+
+        Returns:
+            list: A list of sets representing the course schedule.
+
+        Raises:
+            KeyError: If the student is not in the store.
+        """
+        row = self.connection.execute(
+            "SELECT num_semesters FROM students WHERE name = ?", (student,)
+        ).fetchone()
+        if row is None:
+            raise KeyError(student)
+        schedule = [set() for _ in range(row[0])]
+        for sem_num, course in self.connection.execute(
+            "SELECT semester, course FROM placements WHERE student = ?", (student,)
+        ):
+            schedule[sem_num].add(course)
+        return schedule
+
+    def delete(self, student):
+        """Remove a student's schedule. Unknown students are ignored.
+
+        Args:
+            student (str): The student's name or id.
+        """
+        with self.connection:
+            self.connection.execute("DELETE FROM placements WHERE student = ?", (student,))
+            self.connection.execute("DELETE FROM students WHERE name = ?", (student,))
+
+    def students(self):
+        """Get every student in the store.
+
+        Returns:
+            list: The students' names, sorted.
+        """
+        return [row[0] for row in self.connection.execute(
+            "SELECT name FROM students ORDER BY name"
+        )]
+
+    def who_takes(self, course, semester=None):
+        """Find the students taking a course.
+
+        Args:
+            course (str): The course id.
+            semester (int, optional): Only count this semester. Defaults
+                to any semester.
+
+        Returns:
+            list: The students' names, sorted.
+        """
+        if semester is None:
+            cursor = self.connection.execute(
+                "SELECT DISTINCT student FROM placements WHERE course = ? ORDER BY student",
+                (course,),
+            )
+        else:
+            cursor = self.connection.execute(
+                "SELECT student FROM placements WHERE course = ? AND semester = ?"
+                " ORDER BY student",
+                (course, semester),
+            )
+        return [row[0] for row in cursor]
+
+    def course_counts(self, semester=None):
+        """Count the students taking each course.
+
+        Args:
+            semester (int, optional): Only count this semester. Defaults
+                to any semester.
+
+        Returns:
+            dict: Maps each course id to its number of students.
+        """
+        if semester is None:
+            cursor = self.connection.execute(
+                "SELECT course, COUNT(DISTINCT student) FROM placements GROUP BY course"
+            )
+        else:
+            cursor = self.connection.execute(
+                "SELECT course, COUNT(*) FROM placements WHERE semester = ? GROUP BY course",
+                (semester,),
+            )
+        return dict(cursor.fetchall())
+
+
+def main(argv=None, out=sys.stdout):
+    parser = argparse.ArgumentParser(description="Store and query many schedules.")
+    parser.add_argument("database", help="the SQLite database file")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    import_cmd = commands.add_parser("import", help="store schedule JSON files")
+    import_cmd.add_argument("paths", nargs="+", help="schedule files or directories")
+
+    who = commands.add_parser("who", help="list the students taking a course")
+    who.add_argument("course")
+    who.add_argument("-s", "--semester", type=int)
+
+    args = parser.parse_args(argv)
+    with ScheduleStore(args.database) as store:
+        if args.command == "import":
+            out.write(f"Imported {store.import_files(args.paths)} schedules\n")
+        else:
+            for student in store.who_takes(args.course, args.semester):
+                out.write(student + "\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,203 @@
+"""Full-text search over course ids, names and descriptions.
+
+A SearchIndex is an inverted index: for every word it stores the
+courses that contain it and where. Queries are a list of terms that
+must all match, where each term is one of:
+
+* a word, e.g. ``networks``
+* a prefix ending in ``*``, e.g. ``comput*``
+* a quoted phrase, e.g. ``"data structures"``
+
+Results are ranked by how rare the matched words are and how often
+they appear, with matches in the course id or name counting extra.
+
+The index for a Catalog is cached with it (see get_search_index), so it
+is also saved in the compiled catalog cache and not rebuilt on launch.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import bisect
+import math
+import re
+
+import catalog_utils
+
+_WORD = re.compile(r"[a-z0-9]+")
+_TERM = re.compile(r'"([^"]*)"|(\S+)')
+
+# Matches in the id or name count this many times a description match
+TITLE_WEIGHT = 3
+
+# Keeps phrases from matching across the end of one field
+_FIELD_GAP = 1000
+
+
+def tokenize(text):
+    """Split text into lowercase words.
+
+    Args:
+        text (str): The text to split. None is treated as empty.
+
+    Returns:
+        list: The words, in order.
+    """
+    return _WORD.findall(text.lower()) if text else []
+
+
+class SearchIndex:
+    """An inverted index over the courses of a catalog.
+
+    Attributes:
+        courses (list): The course ids, by document number.
+        postings (dict): Maps each word to a dict of document number ->
+            (weight, tuple of positions).
+        vocabulary (list): All indexed words, sorted, for prefix lookups.
+    """
+
+    def __init__(self, catalog):
+        """Index every course in a catalog.
+
+        Args:
+            catalog (dict): The dictionary containing course information.
+        """
+        self.courses = sorted(catalog)
+        postings = {}
+        for doc, course_id in enumerate(self.courses):
+            entry = catalog[course_id]
+            fields = (
+                (tokenize(course_id) + tokenize(entry["name"]), TITLE_WEIGHT),
+                (tokenize(entry["description"]), 1),
+            )
+            for field_num, (words, weight) in enumerate(fields):
+                for position, word in enumerate(words, field_num * _FIELD_GAP):
+                    docs = postings.setdefault(word, {})
+                    posting = docs.get(doc)
+                    if posting is None:
+                        docs[doc] = posting = [0, []]
+                    posting[0] += weight
+                    posting[1].append(position)
+
+        # Freeze each posting into a (weight, positions) tuple
+        for docs in postings.values():
+            for doc, (weight, positions) in docs.items():
+                docs[doc] = (weight, tuple(positions))
+        self.postings = postings
+        self.vocabulary = sorted(postings)
+
+    def _expand(self, prefix):
+        """Return every indexed word that starts with a prefix."""
+        start = bisect.bisect_left(self.vocabulary, prefix)
+        end = bisect.bisect_left(self.vocabulary, prefix + "\uffff")
+        return self.vocabulary[start:end]
+
+    def _idf(self, word):
+        return math.log(1 + len(self.courses) / len(self.postings[word]))
+
+    def _match_word(self, words):
+        """Score the documents containing any of several words."""
+        scores = {}
+        for word in words:
+            idf = self._idf(word)
+            for doc, (weight, _) in self.postings[word].items():
+                scores[doc] = scores.get(doc, 0) + idf * weight / (weight + 1.2)
+        return scores
+
+    def _match_phrase(self, words):
+        """Score the documents containing a sequence of words."""
+        if not words or any(word not in self.postings for word in words):
+            return {}
+        lists = [self.postings[word] for word in words]
+        first = min(lists, key=len)
+        candidates = [doc for doc in first if all(doc in docs for docs in lists)]
+
+        scores = {}
+        for doc in candidates:
+            starts = set(lists[0][doc][1])
+            for offset, docs in enumerate(lists[1:], 1):
+                starts &= {position - offset for position in docs[doc][1]}
+            if starts:
+                hits = len(starts)
+                scores[doc] = sum(self._idf(word) for word in words) * hits / (hits + 1.2)
+        return scores
+
+    def search(self, query, limit=20):
+        """Find the courses matching every term of a query.
+
+        Args:
+            query (str): The query text.
+            limit (int, optional): The most results to return. Defaults
+                to 20; None returns every match.
+
+        Returns:
+            list: (course id, score) pairs, best match first.
+        """
+        total = None
+        for phrase, term in _TERM.findall(query):
+            if phrase:
+                scores = self._match_phrase(tokenize(phrase))
+            elif term.endswith("*"):
+                words = tokenize(term[:-1])
+                if len(words) != 1:
+                    continue
+                scores = self._match_word(self._expand(words[0]))
+            else:
+                words = tokenize(term)
+                if not words:
+                    continue
+                # "CS-240" is treated like the phrase "cs 240"
+                if len(words) == 1:
+                    scores = self._match_word(w for w in words if w in self.postings)
+                else:
+                    scores = self._match_phrase(words)
+
+            if total is None:
+                total = scores
+            else:
+                total = {doc: total[doc] + score for doc, score in scores.items()
+                         if doc in total}
+            if not total:
+                return []
+
+        if total is None:
+            return []
+        ranked = sorted(total.items(), key=lambda item: (-item[1], item[0]))
+        if limit is not None:
+            ranked = ranked[:limit]
+        return [(self.courses[doc], score) for doc, score in ranked]
+
+
+def get_search_index(catalog):
+    """Get the SearchIndex for a catalog.
+
+    It is built once per Catalog version and then reused.
+
+    Args:
+        catalog (dict): The dictionary containing course information.
+
+    Returns:
+        SearchIndex: The search index of the catalog.
+    """
+    if not isinstance(catalog, catalog_utils.Catalog):
+        return SearchIndex(catalog)
+
+    index = catalog.cache.get("search")
+    if index is None:
+        index = SearchIndex(catalog)
+        catalog.cache["search"] = index
+    return index
+
+
+def search_courses(query, catalog, limit=20):
+    """Search a catalog's course ids, names and descriptions.
+
+    Args:
+        query (str): The query text (see the module documentation).
+        catalog (dict): The dictionary containing course information.
+        limit (int, optional): The most results to return. Defaults to 20.
+
+    Returns:
+        list: The matching course ids, best match first.
+    """
+    return [course for course, _ in get_search_index(catalog).search(query, limit)]
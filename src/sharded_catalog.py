@@ -0,0 +1,362 @@
+"""Catalogs split into department files that are loaded on demand.
+
+A large catalog can be kept as one JSON file per department, listed in
+a manifest. The manifest records every shard's file, the ids of its
+courses, a hash of its contents and its cross-shard prerequisites, so
+a ShardedCatalog knows which courses exist without reading any shard.
+A shard is read the first time one of its courses is looked up.
+
+Looking up a course, its dependencies or the credits of a schedule
+only reads the shards those courses are in. Anything that needs the
+whole catalog (values(), items(), the CatalogIndex and everything
+built on it) reads every shard.
+
+Manifests are built with build_manifest, which checks the shards
+together with validate_catalog, or from the command line:
+
+    python3 src/sharded_catalog.py all.manifest.json cs_catalog.json japn_catalog.json
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import sys
+
+import catalog_utils
+
+MANIFEST_SUFFIX = ".manifest.json"
+MANIFEST_VERSION = 1
+
+
+def is_manifest(filename):
+    """Check whether a filename names a shard manifest.
+
+    Args:
+        filename (str): The filename.
+
+    Returns:
+        bool: True if the name ends in .manifest.json.
+    """
+    return os.fspath(filename).endswith(MANIFEST_SUFFIX)
+
+
+def _shard_name(filename):
+    """Name a shard after its file, e.g. cs_catalog.json -> cs."""
+    name = os.path.basename(os.fspath(filename))
+    for suffix in ("_catalog.json", ".json"):
+        if name.endswith(suffix):
+            return name[:-len(suffix)]
+    return name
+
+
+def build_manifest(shard_files, manifest_filename):
+    """Check a set of shard files and write a manifest for them.
+
+    Args:
+        shard_files (list): The shard filenames.
+        manifest_filename (str): Where to write the manifest. Shard
+            paths are stored relative to its directory.
+
+    Returns:
+        dict: The manifest that was written.
+
+    Raises:
+        CatalogError: If the combined catalog fails validation.
+        ValueError: If a course appears in more than one shard, or two
+            shards have the same name.
+    """
+    base_dir = os.path.dirname(os.path.abspath(manifest_filename))
+    merged = {}
+    shard_of = {}
+    shards = {}
+    for filename in shard_files:
+        name = _shard_name(filename)
+        if name in shards:
+            raise ValueError(f"Two shards are named {name!r}")
+        with open(filename, "rb") as file:
+            data = file.read()
+        raw = json.loads(data)
+        for course in raw:
+            if course in shard_of:
+                raise ValueError(f"{course} is in both {shard_of[course]} and {name}")
+            shard_of[course] = name
+        merged.update(raw)
+        shards[name] = {
+            "file": os.path.relpath(os.path.abspath(filename), base_dir),
+            "sha256": hashlib.sha256(data).hexdigest(),
+            "courses": list(raw),
+        }
+
+    catalog_utils.ensure_valid(merged)
+
+    for name, shard in shards.items():
+        external = {}
+        for course in shard["courses"]:
+            outside = [req for req in merged[course]["prerequisites"] if shard_of[req] != name]
+            if outside:
+                external[course] = outside
+        shard["external"] = external
+        shard["requires"] = sorted({shard_of[req] for reqs in external.values() for req in reqs})
+
+    manifest = {"version": MANIFEST_VERSION, "shards": shards}
+    with open(manifest_filename, "w") as file:
+        json.dump(manifest, file, indent=4)
+    return manifest
+
+
+def load_manifest(filename):
+    """Open a sharded catalog without reading any of its shards.
+
+    Args:
+        filename (str): The filename of the manifest.
+
+    Returns:
+        ShardedCatalog: The catalog.
+
+    Raises:
+        ValueError: If the manifest is from an unknown version.
+    """
+    with open(filename) as file:
+        manifest = json.load(file)
+    if manifest.get("version") != MANIFEST_VERSION:
+        raise ValueError(f"{filename} is not a version {MANIFEST_VERSION} manifest")
+    return ShardedCatalog(manifest, os.path.dirname(os.path.abspath(filename)))
+
+
+class ShardedCatalog(catalog_utils.Catalog):
+    """A Catalog whose courses are read from their shard when first used.
+
+    Until every shard has been read, membership, iteration and len()
+    are answered from the manifest. Changing the catalog reads every
+    shard first, after which it behaves like any other Catalog.
+
+    Pickling reads every shard and gives a plain Catalog.
+
+    Attributes:
+        shards (dict): The manifest entry for each shard.
+        shard_of (dict): Maps each course id to the name of its shard.
+        pending (set): The names of the shards not read yet.
+    """
+
+    def __init__(self, manifest, base_dir):
+        """Create a catalog from a manifest.
+
+        Args:
+            manifest (dict): A manifest from build_manifest.
+            base_dir (str): The directory shard paths are relative to.
+        """
+        super().__init__()
+        self.base_dir = base_dir
+        self.shards = manifest["shards"]
+        self.shard_of = {
+            course: name for name, shard in self.shards.items() for course in shard["courses"]
+        }
+        self.pending = set(self.shards)
+
+    def read_shard(self, name):
+        """Read one shard without merging it in.
+
+        Args:
+            name (str): The shard name.
+
+        Returns:
+            Catalog: The shard's courses.
+
+        Raises:
+            ValueError: If the shard file no longer matches the manifest.
+        """
+        shard = self.shards[name]
+        with open(os.path.join(self.base_dir, shard["file"]), "rb") as file:
+            data = file.read()
+        if hashlib.sha256(data).hexdigest() != shard["sha256"]:
+            raise ValueError(
+                f"Shard {shard['file']} has changed since the manifest was built"
+            )
+        return catalog_utils.json_to_catalog(json.loads(data))
+
+    def read_shards(self, names):
+        """Read the named shards that have not been merged in yet.
+
+        This does not change the catalog, so it can run on a worker
+        thread while the catalog is in use. Hand the result to
+        merge_shards on the thread that owns the catalog.
+
+        Args:
+            names (iterable): Shard names.
+
+        Returns:
+            dict: Maps each shard name read to its courses.
+        """
+        return {name: self.read_shard(name) for name in names if name in self.pending}
+
+    def merge_shards(self, shards):
+        """Merge in shards from read_shards, skipping any already merged.
+
+        Args:
+            shards (dict): Maps shard names to their courses.
+        """
+        for name, courses in shards.items():
+            if name in self.pending:
+                # The logical contents are unchanged, so the cache stays valid
+                dict.update(self, courses)
+                self.pending.discard(name)
+
+    def _load_shard(self, name):
+        """Read one shard and merge it in."""
+        self.merge_shards({name: self.read_shard(name)})
+
+    def load_shards(self, names):
+        """Read the named shards if they have not been read already.
+
+        Args:
+            names (iterable): Shard names.
+        """
+        self.merge_shards(self.read_shards(names))
+
+    def load_all(self):
+        """Read every remaining shard."""
+        self.load_shards(sorted(self.pending))
+
+    def shards_for(self, courses, closure=False):
+        """Find the shards some courses are in.
+
+        Args:
+            courses (iterable): Course ids. Unknown ids are ignored.
+            closure (bool, optional): Also include every shard their
+                prerequisites might come from, following the cross-shard
+                edges in the manifest. Defaults to False.
+
+        Returns:
+            set: Shard names.
+        """
+        names = {self.shard_of[course] for course in courses if course in self.shard_of}
+        if closure:
+            stack = list(names)
+            while stack:
+                for required in self.shards[stack.pop()]["requires"]:
+                    if required not in names:
+                        names.add(required)
+                        stack.append(required)
+        return names
+
+    def preload(self, courses, closure=False):
+        """Read the shards some courses are in.
+
+        Args:
+            courses (iterable): Course ids. Unknown ids are ignored.
+            closure (bool, optional): See shards_for. Defaults to False.
+        """
+        self.load_shards(self.shards_for(courses, closure))
+
+    def __missing__(self, key):
+        name = self.shard_of.get(key)
+        if name not in self.pending:
+            raise KeyError(key)
+        self._load_shard(name)
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        if not self.pending:
+            return super().get(key, default)
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        if self.pending:
+            return key in self.shard_of
+        return super().__contains__(key)
+
+    def __iter__(self):
+        if self.pending:
+            return iter(self.shard_of)
+        return super().__iter__()
+
+    def __len__(self):
+        if self.pending:
+            return len(self.shard_of)
+        return super().__len__()
+
+    def keys(self):
+        if self.pending:
+            return self.shard_of.keys()
+        return super().keys()
+
+    def values(self):
+        self.load_all()
+        return super().values()
+
+    def items(self):
+        self.load_all()
+        return super().items()
+
+    def __eq__(self, other):
+        self.load_all()
+        if isinstance(other, ShardedCatalog):
+            other.load_all()
+        return super().__eq__(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def copy(self):
+        self.load_all()
+        return super().copy()
+
+    # Changes read everything first so the manifest is no longer needed
+
+    def __setitem__(self, key, value):
+        self.load_all()
+        super().__setitem__(key, value)
+
+    def __delitem__(self, key):
+        self.load_all()
+        super().__delitem__(key)
+
+    def __ior__(self, other):
+        self.load_all()
+        return super().__ior__(other)
+
+    def clear(self):
+        self.load_all()
+        super().clear()
+
+    def pop(self, *args):
+        self.load_all()
+        return super().pop(*args)
+
+    def popitem(self):
+        self.load_all()
+        return super().popitem()
+
+    def update(self, *args, **kwargs):
+        self.load_all()
+        super().update(*args, **kwargs)
+
+    def __reduce__(self):
+        self.load_all()
+        return (catalog_utils.Catalog, (dict(self),), self.cache)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build a sharded catalog manifest.")
+    parser.add_argument("manifest", help="the manifest to write (*" + MANIFEST_SUFFIX + ")")
+    parser.add_argument("shards", nargs="+", help="catalog JSON files, one per department")
+    args = parser.parse_args(argv)
+    if not is_manifest(args.manifest):
+        parser.error("the manifest filename must end in " + MANIFEST_SUFFIX)
+    try:
+        build_manifest(args.shards, args.manifest)
+    except ValueError as error:
+        print(error, file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
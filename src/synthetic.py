@@ -0,0 +1,108 @@
+"""Seeded random catalogs and schedules for testing and benchmarks.
+
+The example catalogs only have a few dozen courses, which is too small
+to show how the catalog functions scale. generate_catalog builds a
+random prerequisite graph of any size in the same JSON format as the
+example catalogs. The same seed always gives the same catalog.
+
+Courses are split into layers. Every prerequisite of a course comes
+from an earlier layer, and at least one comes from the layer just
+before it, so the graph is always acyclic and its longest prerequisite
+chain is the number of layers.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import json
+import random
+
+# Words used to fill in course descriptions
+WORDS = (
+    "algorithms analysis applications computing concepts data design "
+    "development language methods models practice principles problems "
+    "programming projects structures systems techniques theory tools "
+    "introduction advanced topics including laboratory seminar survey"
+).split()
+
+CREDIT_CHOICES = ("3", "3", "3", "4", "1", "1-3")
+
+
+def course_name(i, num_courses):
+    """Get the course id of the i'th synthetic course.
+
+    Ids are zero padded so that sorting them keeps their numeric order.
+    """
+    return f"SYN {i:0{len(str(num_courses - 1))}d}"
+
+
+def generate_catalog(num_courses, depth=8, fan_in=3, seed=0):
+    """Generate a random acyclic catalog.
+
+    Args:
+        num_courses (int): The number of courses.
+        depth (int, optional): The number of layers, which is the
+            length of the longest prerequisite chain. Defaults to 8.
+        fan_in (int, optional): The largest number of prerequisites a
+            course can have. Defaults to 3.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        dict: A catalog in the JSON format read by load_catalog.
+    """
+    rng = random.Random(seed)
+    depth = max(1, min(depth, num_courses))
+    # Layer k holds courses starts[k] through starts[k + 1] - 1
+    starts = [layer * num_courses // depth for layer in range(depth + 1)]
+
+    catalog = {}
+    for layer in range(depth):
+        for i in range(starts[layer], starts[layer + 1]):
+            prereqs = set()
+            if layer > 0 and fan_in > 0:
+                prereqs.add(rng.randrange(starts[layer - 1], starts[layer]))
+                for _ in range(rng.randrange(fan_in)):
+                    prereqs.add(rng.randrange(starts[layer]))
+            catalog[course_name(i, num_courses)] = {
+                "name": f"Synthetic Course {i}",
+                "credits": rng.choice(CREDIT_CHOICES),
+                "description": " ".join(rng.choices(WORDS, k=rng.randint(10, 40))).capitalize() + ".",
+                "prerequisites": [course_name(req, num_courses) for req in sorted(prereqs)],
+            }
+    return catalog
+
+
+def generate_schedule(catalog, num_semesters=9, per_semester=5, seed=0):
+    """Pick a random schedule from a catalog.
+
+    Courses are placed in order of their ids, so for a generated
+    catalog prerequisites tend to come before the courses that need
+    them, although not every prerequisite is included.
+
+    Args:
+        catalog (dict): The catalog to pick courses from.
+        num_semesters (int, optional): Defaults to 9.
+        per_semester (int, optional): Courses per semester. Defaults to 5.
+        seed (int, optional): The random seed. Defaults to 0.
+
+    Returns:
+        list: A list of sets representing the course schedule.
+    """
+    rng = random.Random(seed)
+    count = min(len(catalog), num_semesters * per_semester)
+    courses = sorted(rng.sample(sorted(catalog), count))
+    return [
+        set(courses[sem * per_semester:(sem + 1) * per_semester])
+        for sem in range(num_semesters)
+    ]
+
+
+def write_catalog(catalog, filename):
+    """Save a generated catalog as a JSON file.
+
+    Args:
+        catalog (dict): A catalog from generate_catalog.
+        filename (str): The filename for the JSON file.
+    """
+    with open(filename, "w") as file:
+        json.dump(catalog, file, indent=4)
@@ -0,0 +1,230 @@
+"""Incremental schedule validation with reasons.
+
+check_prerequisites and get_duplicates look at the whole schedule on
+every call and only say which courses have a problem. A
+ScheduleValidator is kept up to date as the schedule is edited
+instead, and records why each course fails: which prerequisite is not
+scheduled, or is scheduled too late.
+
+A course has unmet prerequisites when one of them is not scheduled in
+a semester before the first semester the course is scheduled in, which
+is the same rule used by catalog_utils.check_prerequisites.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+
+import catalog_utils
+
+
+def describe_violation(violation):
+    """Describe a prerequisite violation in a sentence.
+
+    Args:
+        violation (dict): A violation as stored in
+            ScheduleValidator.violations.
+
+    Returns:
+        str: A readable description of the violation.
+    """
+    course = violation["course"]
+    req = violation["prerequisite"]
+    reason = violation["reason"]
+    if reason == "unknown":
+        return f"{course} requires {req}, which is not in the catalog"
+    if reason == "missing":
+        return f"{course} requires {req}, which is not scheduled"
+    if violation["prerequisite_semester"] == violation["semester"]:
+        return f"{course} requires {req}, which is taken in the same semester"
+    return f"{course} requires {req}, which is not taken until a later semester"
+
+
+class ScheduleValidator:
+    """Keeps the problems with a schedule current as it is edited.
+
+    The validator records the semesters every course is scheduled in.
+    Placing, removing or moving a course only rechecks that course and
+    the courses that list it as a prerequisite, so reading the current
+    problems never requires a pass over the schedule.
+
+    Attributes:
+        duplicates (set): The courses scheduled more than once.
+        violations (dict): Maps each course with unmet prerequisites to
+            a list of violations. Each violation is a dict with
+            "course", "prerequisite", "reason" ("missing", "order" or
+            "unknown"), "semester" (the first semester of the course)
+            and "prerequisite_semester" (None unless the reason is
+            "order").
+
+    Courses that are not in the catalog are counted as duplicates but
+    are otherwise ignored, so unlike check_prerequisites, a prerequisite
+    outside the catalog is always reported as "unknown".
+    """
+
+    def __init__(self, catalog, schedule=None):
+        """Create a validator for a catalog.
+
+        Args:
+            catalog (dict): The dictionary containing course information.
+            schedule (list, optional): The starting schedule. Defaults to
+                an empty schedule.
+        """
+        self.catalog = catalog
+        self.index = catalog_utils.get_index(catalog)
+        self.set_schedule(schedule or [])
+
+    def set_schedule(self, schedule):
+        """Replace the tracked schedule, rechecking everything.
+
+        Args:
+            schedule (list): The course schedule.
+        """
+        self.placements = {}
+        for sem_num, semester in enumerate(schedule):
+            for course in semester:
+                self.placements.setdefault(course, []).append(sem_num)
+        self.duplicates = {
+            course for course, sems in self.placements.items() if len(sems) > 1
+        }
+
+        index = self.index
+        self.first = [-1] * len(index)
+        for course, sems in self.placements.items():
+            course_id = index.ids.get(course)
+            if course_id is not None:
+                self.first[course_id] = min(sems)
+
+        self.violations = {}
+        for course_id, first in enumerate(self.first):
+            if first != -1:
+                self._recheck(course_id)
+
+    def _recheck(self, course_id):
+        """Recompute the violations of one course."""
+        index = self.index
+        course = index.courses[course_id]
+        self.violations.pop(course, None)
+        sem = self.first[course_id]
+        if sem == -1:
+            return
+
+        problems = []
+        if course_id in index.blocked:
+            for req in self.catalog[course]["prerequisites"]:
+                if req not in index.ids:
+                    problems.append(self._violation(course, req, "unknown", sem))
+        for req in index.prerequisites[course_id]:
+            req_sem = self.first[req]
+            if req_sem == -1:
+                problems.append(
+                    self._violation(course, index.courses[req], "missing", sem)
+                )
+            elif req_sem >= sem:
+                problems.append(
+                    self._violation(course, index.courses[req], "order", sem, req_sem)
+                )
+        if problems:
+            self.violations[course] = problems
+
+    @staticmethod
+    def _violation(course, req, reason, sem, req_sem=None):
+        return {
+            "course": course,
+            "prerequisite": req,
+            "reason": reason,
+            "semester": sem,
+            "prerequisite_semester": req_sem,
+        }
+
+    def _set_first(self, course_id, first):
+        """Record a course's new first semester and recheck its dependents."""
+        if first == self.first[course_id]:
+            return
+        self.first[course_id] = first
+        self._recheck(course_id)
+
+        # Only the courses that require this one can change
+        for dependent in self.index.dependents[course_id]:
+            self._recheck(dependent)
+
+    def add(self, course, semester):
+        """Record that a course has been placed in a semester.
+
+        Args:
+            course (str): The course id.
+            semester (int): The semester the course was placed in.
+        """
+        sems = self.placements.setdefault(course, [])
+        sems.append(semester)
+        if len(sems) > 1:
+            self.duplicates.add(course)
+        course_id = self.index.ids.get(course)
+        if course_id is not None:
+            self._set_first(course_id, min(sems))
+
+    def remove(self, course, semester):
+        """Record that a course has been removed from a semester.
+
+        Args:
+            course (str): The course id.
+            semester (int): The semester the course was removed from.
+        """
+        sems = self.placements.get(course)
+        if not sems or semester not in sems:
+            return
+        sems.remove(semester)
+        if len(sems) < 2:
+            self.duplicates.discard(course)
+        if not sems:
+            del self.placements[course]
+        course_id = self.index.ids.get(course)
+        if course_id is not None:
+            self._set_first(course_id, min(sems) if sems else -1)
+
+    def move(self, course, old_semester, new_semester):
+        """Record that a course has moved from one semester to another.
+
+        Args:
+            course (str): The course id.
+            old_semester (int): The semester the course was in.
+            new_semester (int): The semester the course is now in.
+        """
+        self.remove(course, old_semester)
+        self.add(course, new_semester)
+
+    def reindex(self, index, courses):
+        """Switch to a rebuilt index after some courses were edited.
+
+        The new index must number the courses the same way, i.e. no
+        courses were added or removed. Only the edited courses are
+        rechecked.
+
+        Args:
+            index (CatalogIndex): The rebuilt index.
+            courses (iterable): The ids of the edited courses.
+        """
+        self.index = index
+        for course in courses:
+            self._recheck(index.ids[course])
+
+    @property
+    def unmet(self):
+        """set: The courses with unmet prerequisites."""
+        return set(self.violations)
+
+    @property
+    def valid(self):
+        """bool: True if the schedule has no duplicates or unmet prerequisites."""
+        return not self.duplicates and not self.violations
+
+    def reasons(self):
+        """Describe every prerequisite violation.
+
+        Returns:
+            list: One sentence per violation, ordered by course.
+        """
+        return [
+            describe_violation(violation)
+            for course in sorted(self.violations)
+            for violation in self.violations[course]
+        ]
@@ -0,0 +1,63 @@
+"""Unit tests for analysis.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import catalog_utils
+
+
+def test_depth_and_height():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    result = catalog_utils.get_analysis(catalog)
+    ids = result.index.ids
+
+    assert result.depth[ids["ALGEBRA"]] == 0
+    assert result.depth[ids["CS 149"]] == 1
+    assert result.depth[ids["CS 240"]] == 3
+    assert result.depth[ids["CS 432"]] == 5
+    assert result.depth[ids["CS 458"]] == 6
+    assert result.height[ids["CS 432"]] == 0
+    assert result.height[ids["CS 240"]] == 3
+    assert result.height[ids["ALGEBRA"]] == 6
+    assert catalog_utils.get_analysis(catalog) is result
+
+
+def test_slack_and_critical_courses():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    result = catalog_utils.get_analysis(catalog)
+    assert result.slack("CS 240", 8) == 2
+    assert result.slack("CS 432", 6) == 1
+    assert result.slack("STATS", 2) == 0
+    assert result.critical_courses(6) == {
+        "ALGEBRA", "CS 149", "CS 159", "CS 227", "CS 240", "CS 261", "CS 361", "CS 457",
+        "CS 458"
+    }
+
+
+def test_critical_path():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    result = catalog_utils.get_analysis(catalog)
+    assert result.critical_path("CS 240") == [
+        "ALGEBRA", "CS 149", "CS 159", "CS 240", "CS 361", "CS 457", "CS 458"
+    ]
+    assert result.critical_path("STATS") == ["STATS", "CS 457", "CS 458"]
+
+
+def test_candidates():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    result = catalog_utils.get_analysis(catalog)
+    assert result.candidates(-1) == []
+    assert result.candidates(0) == [0]
+    assert result.candidates(1) == [0, 1]
+    assert result.candidates(9) == [0, 1, 2]
+
+
+def test_available_classes_skips_deep_courses():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    plain = dict(catalog)
+    in_order = [{"ALGEBRA"}, {"CS 149"}, {"CS 159", "CS 227"}, {"CS 240"}, set(), set()]
+    out_of_order = [{"CS 361"}, set(), set()]
+    for schedule in (in_order, out_of_order):
+        for sem in range(len(schedule)):
+            assert catalog_utils.available_classes(schedule, sem, catalog) == \
+                catalog_utils.available_classes(schedule, sem, plain)
@@ -0,0 +1,28 @@
+"""Unit tests for autocomplete.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import autocomplete
+import catalog_utils
+
+
+def test_complete():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    completer = autocomplete.CourseCompleter(catalog)
+    assert completer.complete("cs 24") == ["CS 240"]
+    assert completer.complete("cs2") == ["CS 227", "CS 240", "CS 261", "CS 280"]
+    assert completer.complete("CS 4", limit=3) == ["CS 412", "CS 430", "CS 432"]
+    assert completer.complete("xyz") == []
+    assert len(completer.complete("")) == 20
+
+
+def test_complete_allowed():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    completer = autocomplete.CourseCompleter(catalog)
+    assert completer.complete("cs2", allowed={"CS 240", "CS 280", "CALC"}) == ["CS 240", "CS 280"]
+    assert completer.complete("c", limit=2, allowed={"CS 499C", "CALC", "CS 101"}) == [
+        "CALC", "CS 101"
+    ]
+    many = set(catalog) - {"CS 101"}
+    assert completer.complete("cs 1", allowed=many) == ["CS 149", "CS 159"]
@@ -0,0 +1,74 @@
+"""Unit tests for availability.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import random
+
+import availability
+import catalog_utils
+
+
+def assert_matches(engine, schedule, catalog):
+    for sem in range(len(schedule)):
+        assert engine.available(sem) == catalog_utils.available_classes(schedule, sem, catalog)
+
+
+def test_initial_schedule():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    schedule = [{"JAPN 101"}, set(), set()]
+    engine = availability.AvailabilityEngine(catalog, schedule)
+    assert engine.available(0) == set()
+    assert engine.available(1) == {"JAPN 102"}
+    assert engine.available(2) == {"JAPN 102"}
+
+
+def test_add_remove_move():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    engine = availability.AvailabilityEngine(catalog)
+    assert engine.available(0) == {"JAPN 101"}
+
+    engine.add("JAPN 101", 0)
+    engine.add("JAPN 102", 1)
+    assert engine.available(1) == set()
+    assert engine.available(2) == {"JAPN 231"}
+
+    engine.move("JAPN 102", 1, 2)
+    assert engine.available(2) == set()
+    assert engine.available(3) == {"JAPN 231"}
+
+    engine.remove("JAPN 101", 0)
+    assert engine.available(0) == {"JAPN 101"}
+    assert engine.available(5) == {"JAPN 101", "JAPN 231"}
+
+    # Unknown courses are ignored
+    engine.add("NOT A COURSE", 0)
+    engine.remove("NOT A COURSE", 0)
+
+
+def test_random_edits_match_available_classes():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    rng = random.Random(240)
+    schedule = [set() for _ in range(9)]
+    engine = availability.AvailabilityEngine(catalog, schedule)
+    courses = sorted(catalog)
+
+    for _ in range(200):
+        sem = rng.randrange(9)
+        if schedule[sem] and rng.random() < 0.4:
+            course = rng.choice(sorted(schedule[sem]))
+            schedule[sem].remove(course)
+            engine.remove(course, sem)
+        else:
+            course = rng.choice(courses)
+            if course not in schedule[sem]:
+                schedule[sem].add(course)
+                engine.add(course, sem)
+        assert_matches(engine, schedule, catalog)
+
+
+def test_available_by_semester():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    schedule = [{"ALGEBRA"}, {"CS 149"}, {"CS 159"}, set()]
+    engine = availability.AvailabilityEngine(catalog, schedule)
+    assert engine.available_by_semester(4) == catalog_utils.available_by_semester(schedule, catalog)
@@ -0,0 +1,40 @@
+"""Unit tests for batch.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import batch
+import catalog_utils
+import schedule_utils
+
+
+def test_check_schedule():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    assert batch.check_schedule([{"JAPN 101"}, {"JAPN 102"}], catalog) == {
+        "duplicates": [], "unmet": [], "valid": True
+    }
+    assert batch.check_schedule([{"JAPN 102"}, {"JAPN 102"}], catalog) == {
+        "duplicates": ["JAPN 102"], "unmet": ["JAPN 102"], "valid": False
+    }
+
+
+def test_validate_schedules(tmp_path, monkeypatch):
+    monkeypatch.setenv("COURSE_SCHEDULER_CACHE", str(tmp_path / "cache"))
+    good = tmp_path / "good.json"
+    schedule_utils.save_schedule([{"JAPN 101"}, {"JAPN 102"}, {"JAPN 231"}], str(good))
+    unknown = tmp_path / "unknown.json"
+    schedule_utils.save_schedule([{"CS 149"}], str(unknown))
+    schedules = [str(good), [{"JAPN 231"}, set()], str(unknown), str(tmp_path / "missing.json")]
+
+    serial = list(batch.validate_schedules(schedules, "japn_catalog.json", processes=1))
+    parallel = list(batch.validate_schedules(schedules, "japn_catalog.json", processes=2,
+                                             chunksize=1))
+    parallel.sort(key=lambda result: result["index"])
+    assert parallel == serial
+
+    assert serial[0] == {"index": 0, "source": str(good), "duplicates": [], "unmet": [],
+                         "valid": True}
+    assert serial[1]["source"] is None
+    assert serial[1]["unmet"] == ["JAPN 231"]
+    assert serial[2]["error"].startswith("KeyError")
+    assert serial[3]["error"].startswith("FileNotFoundError")
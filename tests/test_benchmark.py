@@ -0,0 +1,99 @@
+"""Unit tests for benchmark.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import io
+import json
+
+import benchmark
+import catalog_utils
+import synthetic
+
+
+def test_run_benchmarks():
+    seen = []
+    results = benchmark.run_benchmarks(
+        sizes=[50, 200], repeat=1, progress=lambda *args: seen.append(args)
+    )
+    assert sorted(results["results"]) == ["200", "50"]
+    for timings in results["results"].values():
+        assert set(timings) == set(benchmark.BENCHMARKS)
+        assert all(seconds >= 0 for seconds in timings.values())
+    assert len(seen) == 2 * len(benchmark.BENCHMARKS)
+    assert results["meta"]["seed"] == 0
+
+
+def test_deepest_course(tmp_path):
+    # Found from the analysis, not from how the generator names courses
+    filename = tmp_path / "catalog.json"
+    synthetic.write_catalog(synthetic.generate_catalog(500), filename)
+    ctx = benchmark.build_context(filename)
+    depth = catalog_utils.get_analysis(ctx["catalog"]).depth
+    index = catalog_utils.get_index(ctx["catalog"])
+    assert depth[index.ids[ctx["deepest"]]] == max(depth)
+
+
+def test_cold_and_warm(tmp_path, monkeypatch):
+    filename = tmp_path / "catalog.json"
+    synthetic.write_catalog(synthetic.generate_catalog(50), filename)
+    ctx = benchmark.build_context(filename)
+    catalog = ctx["catalog"]
+    versions = []
+
+    def probe(ctx):
+        return lambda: versions.append(catalog.version)
+
+    # Cold runs each see a fresh catalog version
+    monkeypatch.setitem(benchmark.BENCHMARKS, "probe", (probe, benchmark.COLD))
+    benchmark.time_benchmark("probe", ctx, 3)
+    assert len(set(versions)) == 3
+
+    # Warm runs follow an untimed run and share its caches
+    versions.clear()
+    monkeypatch.setitem(benchmark.BENCHMARKS, "probe", (probe, benchmark.WARM))
+    benchmark.time_benchmark("probe", ctx, 3)
+    assert len(versions) == 4 and len(set(versions)) == 1
+
+
+def test_warm_total_credits_uses_index(tmp_path):
+    filename = tmp_path / "catalog.json"
+    synthetic.write_catalog(synthetic.generate_catalog(50), filename)
+    ctx = benchmark.build_context(filename)
+    benchmark.time_benchmark("total_credits", ctx, 1)
+    assert "index" not in ctx["catalog"].cache
+    benchmark.time_benchmark("total_credits_warm", ctx, 1)
+    assert "index" in ctx["catalog"].cache
+
+
+def test_compare_results():
+    baseline = {"results": {"100": {"a": 0.010, "b": 0.010, "tiny": 0.0001}}}
+    current = {"results": {
+        "100": {"a": 0.011, "b": 0.030, "tiny": 0.0009, "new": 1.0},
+        "1000": {"a": 5.0},
+    }}
+    regressions = benchmark.compare_results(baseline, current)
+    assert [(item["size"], item["benchmark"]) for item in regressions] == [(100, "b")]
+    assert abs(regressions[0]["ratio"] - 3.0) < 1e-9
+
+
+def test_main(tmp_path):
+    base = tmp_path / "base.json"
+    out = io.StringIO()
+    status = benchmark.main(
+        ["run", "--sizes", "30", "--repeat", "1", "--only", "get_duplicates",
+         "-o", str(base)],
+        out,
+    )
+    assert status == 0
+    saved = json.loads(base.read_text())
+    assert list(saved["results"]["30"]) == ["get_duplicates"]
+
+    slower = {"meta": saved["meta"], "results": {"30": {"get_duplicates": 10.0}}}
+    (tmp_path / "slow.json").write_text(json.dumps(slower))
+    assert benchmark.main(["compare", str(base), str(tmp_path / "slow.json")], out) == 1
+    assert "REGRESSION" in out.getvalue()
+
+    catalog_file = tmp_path / "catalog.json"
+    assert benchmark.main(["generate", "40", str(catalog_file)], out) == 0
+    assert len(json.loads(catalog_file.read_text())) == 40
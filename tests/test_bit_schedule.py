@@ -0,0 +1,67 @@
+"""Unit tests for bit_schedule.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import random
+
+import pytest
+
+import catalog_utils
+import schedule_utils
+from bit_schedule import BitSchedule
+
+
+def random_schedule(courses, rng):
+    return [set(rng.sample(courses, rng.randrange(5))) for _ in range(9)]
+
+
+def test_round_trip():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    index = catalog_utils.get_index(catalog)
+    rng = random.Random(149)
+    courses = sorted(catalog)
+    for _ in range(50):
+        schedule = random_schedule(courses, rng)
+        bits = BitSchedule.from_schedule(schedule, index)
+        assert bits.to_schedule() == schedule
+        assert bits.to_json() == schedule_utils.schedule_to_json(schedule)
+        assert BitSchedule.from_json(bits.to_json(), index) == bits
+        assert bits.duplicates() == schedule_utils.get_duplicates(schedule)
+        assert bits.count() == sum(len(semester) for semester in schedule)
+
+
+def test_set_operations():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    index = catalog_utils.get_index(catalog)
+    first = BitSchedule.from_schedule([{"JAPN 101"}, {"JAPN 102"}], index)
+    second = BitSchedule.from_schedule([{"JAPN 101"}, set(), {"JAPN 231"}], index)
+
+    assert (first | second).to_schedule() == [{"JAPN 101"}, {"JAPN 102"}, {"JAPN 231"}]
+    assert (first & second).to_schedule() == [{"JAPN 101"}, set(), set()]
+    assert (first - second).to_schedule() == [set(), {"JAPN 102"}, set()]
+    assert "JAPN 102" in first
+    assert "JAPN 231" not in first
+    assert "NOT A COURSE" not in first
+
+
+def test_edits_and_hashing():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    index = catalog_utils.get_index(catalog)
+    empty = BitSchedule(index, [0, 0])
+    bits = empty.with_course("JAPN 101", 0).with_course("JAPN 101", 3)
+    assert len(bits) == 4
+    assert bits.duplicates() == {"JAPN 101"}
+    assert bits.without_course("JAPN 101", 3).masks == (1, 0, 0, 0)
+    assert empty.masks == (0, 0)
+
+    same = BitSchedule.from_schedule([{"JAPN 101"}, set(), set(), {"JAPN 101"}], index)
+    assert bits == same
+    assert len({bits, same}) == 1
+
+
+def test_unknown_course():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    index = catalog_utils.get_index(catalog)
+    with pytest.raises(KeyError):
+        BitSchedule.from_schedule([{"NOT A COURSE"}], index)
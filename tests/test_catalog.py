@@ -4,6 +4,8 @@ Author:
 Version:
 """
 
+import pytest
+
 import catalog_utils
 
 
@@ -239,3 +241,187 @@ Prerequisites:
 
 Dependencies:"""
     assert actual == expect
+
+
+def test_all_dependencies():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    closures = catalog_utils.all_dependencies(catalog)
+    assert closures == {
+        "JAPN 101": set(),
+        "JAPN 102": {"JAPN 101"},
+        "JAPN 231": {"JAPN 101", "JAPN 102"}
+    }
+
+    # Diamond shaped prerequisites are only counted once
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    closures = catalog_utils.all_dependencies(catalog)
+    assert closures["CS 432"] == {"CS 327", "CS 361", "CS 240", "CS 261", "CS 227",
+                                  "CS 159", "CS 149", "CALC", "ALGEBRA"}
+    for course in catalog:
+        assert closures[course] == catalog_utils.get_dependencies(course, catalog)
+
+
+def test_dependency_cache_invalidation():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    assert catalog_utils.get_dependencies("JAPN 231", catalog) == {"JAPN 101", "JAPN 102"}
+
+    catalog["JAPN 102"] = {
+        "name": "Elementary Japanese II",
+        "credits": (4,),
+        "description": "",
+        "prerequisites": set()
+    }
+    assert catalog_utils.get_dependencies("JAPN 231", catalog) == {"JAPN 102"}
+
+
+def test_get_dependencies_dangling():
+    catalog = catalog_utils.json_to_catalog({
+        "A": {"name": "", "credits": "3", "description": "", "prerequisites": ["GONE"]},
+    })
+    assert catalog_utils.get_dependencies("A", catalog) == {"GONE"}
+    # GONE now has a closure in the cache, but it is still not a course
+    with pytest.raises(KeyError):
+        catalog_utils.get_dependencies("GONE", catalog)
+
+
+def test_get_dependencies_cycle():
+    catalog = catalog_utils.json_to_catalog({
+        "A": {"name": "", "credits": "3", "description": "", "prerequisites": ["B"]},
+        "B": {"name": "", "credits": "3", "description": "", "prerequisites": ["A"]}
+    })
+    with pytest.raises(ValueError):
+        catalog_utils.get_dependencies("A", catalog)
+
+
+def test_available_by_semester():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    schedule = [{"JAPN 101"}, set(), {"JAPN 102"}, set()]
+    assert catalog_utils.available_by_semester(schedule, catalog) == [
+        set(), set(), set(), {"JAPN 231"}
+    ]
+
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    schedule = [{"ALGEBRA", "CALC"}, {"CS 149"}, {"CS 159", "CS 227"}, {"CS 240"}, set()]
+    by_semester = catalog_utils.available_by_semester(schedule, catalog)
+    for sem in range(len(schedule)):
+        assert by_semester[sem] == catalog_utils.available_classes(schedule, sem, catalog)
+
+
+def test_course_record():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    course = catalog["JAPN 231"]
+    assert isinstance(course, catalog_utils.Course)
+    assert course["credits"] == (3, 4)
+    assert course.get("prerequisites") == {"JAPN 102"}
+    assert course.get("missing") is None
+    assert list(course) == ["name", "credits", "description", "prerequisites"]
+    assert dict(course)["name"] == "Intermediate Japanese I"
+
+    # Identical credit strings share a tuple
+    assert catalog["JAPN 101"]["credits"] is catalog["JAPN 102"]["credits"]
+
+    # Fields the scheduler does not know about are kept
+    catalog = catalog_utils.json_to_catalog({
+        "A": {"name": "", "credits": "3", "description": "", "prerequisites": [], "level": 100}
+    })
+    assert catalog["A"]["level"] == 100
+    assert len(catalog["A"]) == 5
+
+    # Entries without a name or description get empty strings
+    catalog = catalog_utils.json_to_catalog({"A": {"credits": "3", "prerequisites": []}})
+    assert catalog["A"]["name"] == catalog["A"]["description"] == ""
+
+
+def test_format_course_info_critical_path():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    actual = catalog_utils.format_course_info("JAPN 102", catalog, width=80, critical_path=True)
+    expect = """Name: Elementary Japanese II
+
+Description: The fundamentals of Japanese through listening, speaking, reading,
+and writing. Practice in pronunciation and development of comprehension.
+
+Credits: 4
+
+Prerequisites: JAPN 101
+
+Dependencies: JAPN 101
+
+Critical Path: JAPN 101, JAPN 102, JAPN 231"""
+    assert actual == expect
+
+
+def test_validate_catalog():
+    assert catalog_utils.validate_catalog(catalog_utils.load_catalog("cs_catalog.json")) == {
+        "malformed_fields": [], "cycles": [], "dangling": [], "malformed_credits": []
+    }
+
+    report = catalog_utils.validate_catalog({
+        "A": {"name": "", "credits": "3", "description": "", "prerequisites": ["C"]},
+        "B": {"name": "", "credits": "3", "description": "", "prerequisites": ["A"]},
+        "C": {"name": "", "credits": "3", "description": "", "prerequisites": ["B", "GONE"]},
+        "D": {"name": "", "credits": "1-2-3", "description": "", "prerequisites": ["D"]},
+        "E": {"name": "", "credits": "three", "description": "", "prerequisites": ["A"]}
+    })
+    assert report == {
+        "malformed_fields": [],
+        "cycles": [["A", "B", "C"], ["D"]],
+        "dangling": [{"course": "C", "prerequisite": "GONE"}],
+        "malformed_credits": [{"course": "D", "credits": "1-2-3"},
+                              {"course": "E", "credits": "three"}]
+    }
+
+
+def test_validate_catalog_fields():
+    report = catalog_utils.validate_catalog({
+        "A": {"credits": "3", "description": None, "prerequisites": ["B"]},
+        "B": {"name": 3, "credits": "3", "description": "", "prerequisites": "A"},
+        "C": {"name": "", "description": "", "prerequisites": []},
+        "D": ["not", "an", "entry"]
+    })
+    assert report["malformed_fields"] == [
+        {"course": "A", "field": "name", "problem": "missing"},
+        {"course": "B", "field": "name", "problem": "wrong type"},
+        {"course": "B", "field": "prerequisites", "problem": "wrong type"},
+        {"course": "C", "field": "credits", "problem": "missing"},
+        {"course": "D", "field": None, "problem": "wrong type"},
+    ]
+    assert report["malformed_credits"] == []
+    assert report["dangling"] == []
+
+    with pytest.raises(catalog_utils.CatalogError) as error:
+        catalog_utils.ensure_valid({"A": {"credits": "3", "description": ""}})
+    assert str(error.value) == \
+        "Invalid catalog: malformed fields: A has no name; A has no prerequisites"
+
+
+def test_validate_deep_catalog():
+    # A long chain would overflow the recursion limit of a recursive search
+    json_dict = {f"C{i}": {"name": "", "credits": "3", "description": "",
+                           "prerequisites": [f"C{i - 1}"] if i else []}
+                 for i in range(5000)}
+    assert catalog_utils.validate_catalog(json_dict)["cycles"] == []
+    json_dict["C0"]["prerequisites"] = ["C4999"]
+    assert len(catalog_utils.validate_catalog(json_dict)["cycles"][0]) == 5000
+
+
+def test_load_invalid_catalog(tmp_path):
+    path = tmp_path / "bad.json"
+    path.write_text('{"A": {"name": "", "credits": "3", "description": "", '
+                    '"prerequisites": ["A"]}}')
+    with pytest.raises(catalog_utils.CatalogError) as error:
+        catalog_utils.load_catalog(str(path))
+    assert error.value.report["cycles"] == [["A"]]
+
+
+def test_format_course_info_null_description():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    actual = catalog_utils.format_course_info("CS 499A", catalog, width=80)
+    assert actual == """Name: Honors
+
+Description:
+
+Credits: 1
+
+Prerequisites: CS 159
+
+Dependencies: ALGEBRA, CS 149, CS 159"""
@@ -0,0 +1,93 @@
+"""Unit tests for catalog_cache.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import os
+import shutil
+
+import pytest
+
+import catalog_cache
+import catalog_utils
+import search
+
+
+def test_load_compiled_catalog(tmp_path):
+    source = tmp_path / "japn_catalog.json"
+    shutil.copy("japn_catalog.json", source)
+    cache_dir = tmp_path / "cache"
+
+    cold = catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    assert cold == catalog_utils.load_catalog("japn_catalog.json")
+    assert len(os.listdir(cache_dir)) == 1
+
+    warm = catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    assert warm == cold
+    assert isinstance(warm, catalog_utils.Catalog)
+    assert warm.version != cold.version
+    assert "index" in warm.cache and "closures" in warm.cache
+    assert catalog_utils.get_dependencies("JAPN 231", warm) == {"JAPN 101", "JAPN 102"}
+
+
+def test_changed_source_replaces_cache(tmp_path):
+    source = tmp_path / "catalog.json"
+    shutil.copy("japn_catalog.json", source)
+    cache_dir = tmp_path / "cache"
+    catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    first = os.listdir(cache_dir)
+
+    shutil.copy("cs_catalog.json", source)
+    catalog = catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    assert "CS 149" in catalog
+    second = os.listdir(cache_dir)
+    assert len(second) == 1 and second != first
+
+
+def test_corrupt_cache_is_rebuilt(tmp_path):
+    source = tmp_path / "catalog.json"
+    shutil.copy("japn_catalog.json", source)
+    cache_dir = tmp_path / "cache"
+    catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+
+    (compiled,) = os.listdir(cache_dir)
+    (cache_dir / compiled).write_bytes(b"not a pickle")
+    catalog = catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    assert catalog == catalog_utils.load_catalog("japn_catalog.json")
+
+
+def test_warm_load_restores_derived_data(tmp_path, monkeypatch):
+    source = tmp_path / "catalog.json"
+    shutil.copy("cs_catalog.json", source)
+    cache_dir = tmp_path / "cache"
+    cold = catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+
+    def fail(data):
+        raise AssertionError("the catalog was recompiled")
+    monkeypatch.setattr(catalog_cache, "compile_catalog", fail)
+    warm = catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    assert warm == cold
+    assert vars(warm.cache["index"]) == vars(cold.cache["index"])
+    assert warm.cache["analysis"].index is warm.cache["index"]
+    assert catalog_utils.get_analysis(warm).depth == catalog_utils.get_analysis(cold).depth
+    assert search.search_courses("data structures", warm) == \
+        search.search_courses("data structures", cold)
+    assert catalog_utils.sorted_dependencies("CS 240", warm) == \
+        catalog_utils.sorted_dependencies("CS 240", cold)
+
+
+@pytest.mark.skipif(os.name != "posix", reason="needs POSIX permissions")
+def test_writable_cache_file_is_ignored(tmp_path, monkeypatch):
+    source = tmp_path / "catalog.json"
+    shutil.copy("japn_catalog.json", source)
+    cache_dir = tmp_path / "cache"
+    catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    (compiled,) = os.listdir(cache_dir)
+    os.chmod(cache_dir / compiled, 0o666)
+
+    recompiled = []
+    compile_catalog = catalog_cache.compile_catalog
+    monkeypatch.setattr(catalog_cache, "compile_catalog",
+                        lambda data: recompiled.append(data) or compile_catalog(data))
+    catalog_cache.load_compiled_catalog(str(source), str(cache_dir))
+    assert recompiled
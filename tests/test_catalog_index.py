@@ -0,0 +1,95 @@
+"""Unit tests for catalog_index.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import random
+
+import pytest
+
+import catalog_index
+import catalog_utils
+
+
+def random_schedule(catalog, rng):
+    schedule = [set() for _ in range(9)]
+    for course in rng.sample(sorted(catalog), 20):
+        schedule[rng.randrange(9)].add(course)
+    return schedule
+
+
+def test_index_layout():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    index = catalog_index.CatalogIndex(catalog)
+    assert index.courses == ["JAPN 101", "JAPN 102", "JAPN 231"]
+    assert index.ids["JAPN 102"] == 1
+    assert index.prerequisites == [(), (0,), (1,)]
+    assert index.dependents == [(1,), (2,), ()]
+    assert index.min_credits == [4, 4, 3]
+    assert index.max_credits == [4, 4, 4]
+
+
+def test_index_matches_catalog_utils():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    plain = dict(catalog)
+    index = catalog_utils.get_index(catalog)
+    rng = random.Random(149)
+
+    for _ in range(50):
+        schedule = random_schedule(catalog, rng)
+        assert index.total_credits(schedule) == catalog_utils.total_credits(schedule, plain)
+        assert index.check_prerequisites(schedule) == catalog_utils.check_prerequisites(schedule, plain)
+        for sem in range(9):
+            assert index.available_classes(schedule, sem) == catalog_utils.available_classes(schedule, sem, plain)
+
+
+def test_missing_prerequisite_is_blocked():
+    catalog = catalog_utils.json_to_catalog({
+        "A": {"name": "", "credits": "3", "description": "", "prerequisites": ["GONE"]},
+        "B": {"name": "", "credits": "3", "description": "", "prerequisites": []}
+    })
+    index = catalog_utils.get_index(catalog)
+    assert index.blocked == {0}
+    assert index.missing == {0: ("GONE",)}
+    assert index.available_classes([set(), set()], 1) == {"B"}
+    assert index.check_prerequisites([{"B"}, {"A"}]) == {"A"}
+
+    # Scheduling the missing id meets the prerequisite, as with a plain dict
+    plain = dict(catalog)
+    schedule = [{"GONE"}, set(), set()]
+    for sem in range(3):
+        assert index.available_classes(schedule, sem) == \
+            catalog_utils.available_classes(schedule, sem, plain)
+    assert index.available_by_semester(schedule) == [{"B"}, {"A", "B"}, {"A", "B"}]
+    assert index.missing_ready([set(), {"GONE"}]) == {0: 2}
+
+
+def test_total_credits_uses_built_index():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    schedule = [{"JAPN 101"}, {"JAPN 102"}]
+    assert catalog_utils.total_credits(schedule, catalog) == (8, 8)
+    assert "index" not in catalog.cache
+    catalog_utils.get_index(catalog)
+    assert catalog_utils.total_credits(schedule, catalog) == (8, 8)
+    with pytest.raises(KeyError):
+        catalog_utils.total_credits([{"NOPE"}], catalog)
+
+
+def test_duplicated_prerequisite():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    index = catalog_utils.get_index(catalog)
+    schedule = [{"JAPN 101"}, {"JAPN 101"}, set()]
+    # The index uses the first placement; the plain-dict loop counts both
+    assert index.available_classes(schedule, 2) == {"JAPN 102"}
+    assert index.available_by_semester(schedule)[2] == {"JAPN 102"}
+    assert catalog_utils.available_classes(schedule, 2, dict(catalog)) == set()
+
+
+def test_index_is_cached():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    index = catalog_utils.get_index(catalog)
+    assert catalog_utils.get_index(catalog) is index
+
+    del catalog["JAPN 231"]
+    assert catalog_utils.get_index(catalog) is not index
+    assert len(catalog_utils.get_index(catalog)) == 2
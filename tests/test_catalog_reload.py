@@ -0,0 +1,113 @@
+"""Unit tests for catalog_reload.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import json
+import shutil
+
+import pytest
+
+import availability
+import catalog_reload
+import catalog_utils
+import validator
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    filename = tmp_path / "catalog.json"
+    shutil.copy("cs_catalog.json", filename)
+    return filename
+
+
+def edit(filename, change):
+    raw = json.loads(filename.read_text())
+    change(raw)
+    filename.write_text(json.dumps(raw))
+
+
+def assert_matches_fresh(catalog, filename):
+    fresh = catalog_utils.load_catalog(filename)
+    assert catalog == fresh
+    assert catalog_utils.all_dependencies(catalog) == catalog_utils.all_dependencies(fresh)
+
+
+def test_diff_catalogs():
+    old = {"A": {"prerequisites": []}, "B": {"prerequisites": ["A"]}, "C": {"prerequisites": []}}
+    new = {"A": {"prerequisites": []}, "B": {"prerequisites": []}, "D": {"prerequisites": []}}
+    assert catalog_reload.diff_catalogs(old, new) == {
+        "added": {"D"}, "removed": {"C"}, "changed": {"B"},
+    }
+
+
+def test_edit_keeps_unaffected_closures(catalog_file):
+    catalog = catalog_utils.load_catalog(catalog_file)
+    catalog_utils.all_dependencies(catalog)
+    kept = catalog.cache["closures"]["CS 159"]
+    version = catalog.version
+
+    edit(catalog_file, lambda raw: raw["CS 227"].update(prerequisites=["ALGEBRA"]))
+    diff = catalog_reload.reload_catalog(catalog, catalog_file)
+    assert diff["changed"] == {"CS 227"}
+    assert "CS 240" in diff["affected"]
+    assert "CS 159" not in diff["affected"]
+    assert catalog.cache["closures"]["CS 159"] is kept
+    assert "CS 240" not in catalog.cache["closures"]
+    assert catalog.version != version
+    assert_matches_fresh(catalog, catalog_file)
+
+
+def test_add_and_remove(catalog_file):
+    catalog = catalog_utils.load_catalog(catalog_file)
+    catalog_utils.all_dependencies(catalog)
+
+    def change(raw):
+        del raw["CS 499C"]
+        raw["CS 500"] = {
+            "name": "New", "credits": "3", "description": "", "prerequisites": ["CS 240"],
+        }
+    edit(catalog_file, change)
+    diff = catalog_reload.reload_catalog(catalog, catalog_file)
+    assert diff["added"] == {"CS 500"}
+    assert diff["removed"] == {"CS 499C"}
+    assert_matches_fresh(catalog, catalog_file)
+
+
+def test_no_changes(catalog_file):
+    catalog = catalog_utils.load_catalog(catalog_file)
+    version = catalog.version
+    diff = catalog_reload.reload_catalog(catalog, catalog_file)
+    assert diff["affected"] == set()
+    assert catalog.version == version
+
+
+def test_invalid_file_leaves_catalog(catalog_file):
+    catalog = catalog_utils.load_catalog(catalog_file)
+    edit(catalog_file, lambda raw: raw["CS 149"].update(prerequisites=["NOPE"]))
+    with pytest.raises(catalog_utils.CatalogError):
+        catalog_reload.reload_catalog(catalog, catalog_file)
+    assert catalog == catalog_utils.load_catalog("cs_catalog.json")
+
+
+def test_reindex(catalog_file):
+    catalog = catalog_utils.load_catalog(catalog_file)
+    schedule = [{"CS 149"}, {"CS 159", "CS 227"}, {"CS 240"}, set()]
+    engine = availability.AvailabilityEngine(catalog, schedule)
+    checker = validator.ScheduleValidator(catalog, schedule)
+    assert "CS 240" in checker.unmet
+
+    def change(raw):
+        raw["CS 240"]["prerequisites"] = ["CS 159", "CS 227"]
+        raw["CS 261"]["prerequisites"] = ["CS 149"]
+    edit(catalog_file, change)
+    diff = catalog_reload.reload_catalog(catalog, catalog_file)
+    index = catalog_utils.get_index(catalog)
+    engine.reindex(index, diff["changed"])
+    checker.reindex(index, diff["changed"])
+
+    assert checker.unmet == catalog_utils.check_prerequisites(schedule, catalog)
+    assert "CS 240" not in checker.unmet
+    fresh = availability.AvailabilityEngine(catalog, schedule)
+    for sem in range(len(schedule)):
+        assert engine.available(sem) == fresh.available(sem)
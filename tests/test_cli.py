@@ -0,0 +1,98 @@
+"""Unit tests for cli.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import io
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+import cli
+import schedule_utils
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("COURSE_SCHEDULER_CACHE", str(tmp_path / "cache"))
+
+
+def run(argv, stdin=""):
+    out = io.StringIO()
+    status = cli.main(["--catalog", "japn_catalog.json"] + argv, out, io.StringIO(stdin))
+    return status, [json.loads(line) for line in out.getvalue().splitlines()]
+
+
+def test_check_files_and_directories(tmp_path):
+    plans = tmp_path / "plans"
+    plans.mkdir()
+    schedule_utils.save_schedule([{"JAPN 101"}, {"JAPN 102"}], str(plans / "a.json"))
+    schedule_utils.save_schedule([{"JAPN 102"}, set()], str(plans / "b.json"))
+    (plans / "notes.txt").write_text("ignored")
+
+    status, records = run(["check", str(plans)])
+    assert status == 1
+    assert records == [
+        {"source": str(plans / "a.json"), "duplicates": [], "unmet": [], "valid": True},
+        {"source": str(plans / "b.json"), "duplicates": [], "unmet": ["JAPN 102"],
+         "valid": False},
+    ]
+
+    status, records = run(["check", "--jobs", "2", str(plans / "a.json")])
+    assert status == 0
+    assert records[0]["valid"]
+
+
+def test_check_stdin():
+    stdin = '[["JAPN 101"], ["JAPN 102"]]\n\nnot json\n[["JAPN 231"]]\n'
+    status, records = run(["check"], stdin)
+    assert status == 1
+    assert [record["source"] for record in records] == ["<stdin>:1", "<stdin>:3", "<stdin>:4"]
+    assert "error" in records[1]
+    assert records[2]["unmet"] == ["JAPN 231"]
+
+
+def test_credits_and_available():
+    status, records = run(["credits"], '[["JAPN 101"], ["JAPN 231"]]\n[["CS 149"]]\n')
+    assert status == 1
+    assert records[0] == {"source": "<stdin>:1", "min": 7, "max": 8}
+    assert records[1]["error"].startswith("KeyError")
+
+    status, records = run(["available", "-s", "1"], '[["JAPN 101"], []]\n')
+    assert status == 0
+    assert records == [{"source": "<stdin>:1", "semester": 1, "available": ["JAPN 102"]}]
+
+    # Semesters outside the schedule are reported, not wrapped around
+    for semester in ("2", "-1"):
+        status, records = run(["available", "-s", semester], '[["JAPN 101"], []]\n')
+        assert status == 1
+        assert records[0]["source"] == "<stdin>:1"
+        assert records[0]["error"].startswith("ValueError")
+
+
+def test_bad_catalog_file(tmp_path):
+    (tmp_path / "bad.json").write_text("not json")
+    for catalog in (tmp_path / "missing.json", tmp_path / "bad.json"):
+        out = io.StringIO()
+        status = cli.main(["--catalog", str(catalog), "credits"], out, io.StringIO())
+        assert status == 2
+        record = json.loads(out.getvalue())
+        assert record["source"] == str(catalog)
+        assert "error" in record
+
+
+def test_info():
+    status, records = run(["info", "--width", "80", "JAPN 101", "NOPE"])
+    assert status == 1
+    assert records[0]["info"].startswith("Name: Elementary Japanese I")
+    assert records[1] == {"course": "NOPE", "error": "Unknown course"}
+
+
+def test_does_not_import_tkinter():
+    src = os.path.join(os.path.dirname(__file__), "..", "src")
+    code = "import sys, cli; assert 'tkinter' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True,
+                   env=dict(os.environ, PYTHONPATH=src))
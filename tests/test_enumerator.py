@@ -0,0 +1,70 @@
+"""Unit tests for enumerator.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import itertools
+
+import pytest
+
+import catalog_utils
+import enumerator
+import schedule_utils
+
+
+def brute_force(courses, catalog, num_semesters, completed=set(), max_courses=None):
+    count = 0
+    for placement in itertools.product(range(num_semesters), repeat=len(courses)):
+        schedule = [set() for _ in range(num_semesters)]
+        for course, sem in zip(courses, placement):
+            schedule[sem].add(course)
+        if max_courses is not None and max(len(sem) for sem in schedule) > max_courses:
+            continue
+        if not catalog_utils.check_prerequisites([set(completed)] + schedule, catalog):
+            count += 1
+    return count
+
+
+def test_count_matches_brute_force():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    courses = ["CS 149", "CS 159", "CS 227", "CS 240", "CALC", "CS 261"]
+    space = enumerator.ScheduleSpace(courses, catalog, 5, completed={"ALGEBRA"})
+    assert space.count() == brute_force(courses, catalog, 5, {"ALGEBRA"})
+
+    space = enumerator.ScheduleSpace(courses, catalog, 5, completed={"ALGEBRA"}, max_courses=2)
+    assert space.count() == brute_force(courses, catalog, 5, {"ALGEBRA"}, max_courses=2)
+
+
+def test_enumerate():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    space = enumerator.ScheduleSpace(["JAPN 101", "JAPN 102", "JAPN 231"], catalog, 4)
+    schedules = list(space.enumerate())
+    assert len(schedules) == space.count() == 4
+    assert [{"JAPN 101"}, {"JAPN 102"}, {"JAPN 231"}, set()] in schedules
+    for schedule in schedules:
+        assert catalog_utils.check_prerequisites(schedule, catalog) == set()
+        assert schedule_utils.get_duplicates(schedule) == set()
+
+
+def test_constraints():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    courses = ["STATS", "CALC", "CS 101"]
+    assert enumerator.ScheduleSpace(courses, catalog, 2).count() == 8
+    assert enumerator.ScheduleSpace(courses, catalog, 2, max_courses=2).count() == 6
+    assert enumerator.ScheduleSpace(courses, catalog, 2, max_credits=4).count() == 0
+    pinned = enumerator.ScheduleSpace(courses, catalog, 2, pinned={"CS 101": 1})
+    assert pinned.count() == 4
+    assert all("CS 101" in schedule[1] for schedule in pinned.enumerate())
+
+    with pytest.raises(ValueError):
+        enumerator.ScheduleSpace(["CS 159"], catalog, 2)
+
+
+def test_split_by_first_semester():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    courses = ["ALGEBRA", "CS 149", "CS 159", "CS 227", "STATS"]
+    space = enumerator.ScheduleSpace(courses, catalog, 4, max_courses=3)
+    firsts = space.first_choices()
+    assert sum(space.count(first) for first in firsts) == space.count()
+    assert sum(len(list(space.enumerate(first))) for first in firsts) == space.count()
+    assert enumerator.count_parallel(space, processes=2) == space.count()
@@ -0,0 +1,43 @@
+"""Unit tests for impact.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import catalog_utils
+import impact
+
+
+def test_downstream_matches_dependencies():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    for course in catalog:
+        expected = {other for other in catalog
+                    if course in catalog_utils.get_dependencies(other, catalog)}
+        assert impact.downstream(course, catalog) == expected
+
+    assert impact.downstream({"CS 457", "CS 327"}, catalog) == {
+        "CS 458", "CS 412", "CS 432", "CS 445", "CS 452"
+    }
+    assert impact.downstream([], catalog) == set()
+
+
+def test_what_if_remove():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    schedule = [{"ALGEBRA", "CALC"}, {"CS 149"}, {"CS 159", "CS 227"}, {"CS 240", "CS 101"},
+                {"CS 349"}]
+    assert impact.what_if_remove(schedule, "CS 227", catalog) == {"CS 240", "CS 349"}
+    assert impact.what_if_remove(schedule, "CS 101", catalog) == set()
+    assert impact.what_if_remove(schedule, "CS 349", catalog) == set()
+
+
+def test_what_if_add():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    schedule = [{"ALGEBRA", "CALC"}, {"CS 149"}, {"CS 159"}]
+    assert impact.what_if_add(schedule, "CS 227", catalog) == {"CS 240", "CS 261"}
+    assert impact.what_if_add([], "STATS", catalog) == set()
+
+
+def test_reachability_is_cached():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    reach = impact.get_reachability(catalog)
+    assert impact.get_reachability(catalog) is reach
+    assert reach.downstream == [0b110, 0b100, 0]
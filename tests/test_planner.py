@@ -0,0 +1,67 @@
+"""Unit tests for planner.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import pytest
+
+import catalog_utils
+import planner
+import schedule_utils
+
+
+def test_required_courses():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    assert planner.required_courses({"CS 240"}, catalog) == {
+        "CS 240", "CALC", "CS 159", "CS 227", "CS 149", "ALGEBRA"
+    }
+    assert planner.required_courses({"CS 240"}, catalog, {"CS 159", "CS 227"}) == {
+        "CS 240", "CALC"
+    }
+
+
+def test_plan_schedule():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    targets = {"CS 432", "CS 458", "CS 412", "CS 345", "CS 347"}
+    plan = planner.plan_schedule(targets, catalog, completed={"ALGEBRA"})
+
+    assert len(plan) == 9
+    assert plan[0] == {"ALGEBRA"}
+    assert catalog_utils.check_prerequisites(plan, catalog) == set()
+    assert schedule_utils.get_duplicates(plan) == set()
+    planned = set().union(*plan[1:])
+    assert targets <= planned
+    assert planned == planner.required_courses(targets, catalog, {"ALGEBRA"})
+    for semester in plan[1:]:
+        assert len(semester) <= 5
+        assert catalog_utils.total_credits([semester], catalog)[1] <= 18
+
+
+def test_plan_follows_critical_path():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    plan = planner.plan_schedule({"JAPN 231"}, catalog, num_semesters=3)
+    assert plan == [set(), {"JAPN 101"}, {"JAPN 102"}, {"JAPN 231"}]
+
+    # A one-course-per-semester plan has to start with the longest chain
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    plan = planner.plan_schedule({"CS 240", "STATS"}, catalog, completed={"ALGEBRA"},
+                                 num_semesters=6, max_courses=1)
+    assert plan[1] == {"CS 149"}
+
+
+def test_per_semester_limits():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    plan = planner.plan_schedule({"STATS", "CALC", "CS 101"}, catalog, num_semesters=3,
+                                 max_courses=[0, 1, 5])
+    assert plan[1] == set()
+    assert len(plan[2]) == 1
+
+
+def test_plan_errors():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    with pytest.raises(ValueError):
+        planner.plan_schedule({"JAPN 231"}, catalog, num_semesters=2)
+    with pytest.raises(ValueError):
+        planner.plan_schedule({"JAPN 101"}, catalog, max_credits=3)
+    with pytest.raises(KeyError):
+        planner.plan_schedule({"CS 149"}, catalog)
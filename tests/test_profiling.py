@@ -0,0 +1,138 @@
+"""Unit tests for profiling.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import json
+import pstats
+
+import pytest
+
+import catalog_utils
+import profiling
+import schedule_utils
+
+
+def test_input_size():
+    assert profiling.input_size(([{"A", "B"}, {"C"}], {"x": 1})) == 3
+    assert profiling.input_size(("A", 5)) == 0
+    assert profiling.input_size(({"a": 1, "b": 2, "c": 3, "d": 4},)) == 0
+    assert profiling.input_size((["A", "B"], {"a": 1, "b": 2, "c": 3})) == 2
+
+
+def test_size_ignores_catalog():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    profiler = profiling.Profiler()
+    profiler.register(catalog_utils, ["total_credits"])
+    # Count semesters instead of courses
+    profiler.register(schedule_utils, ["get_duplicates"], size=lambda args: len(args[0]))
+    schedule = [{"CS 149"}, {"CS 159", "CS 227"}]
+    profiler.enable()
+    try:
+        catalog_utils.total_credits(schedule, catalog)
+        schedule_utils.get_duplicates(schedule)
+    finally:
+        profiler.disable()
+    rows = {row["name"]: row for row in profiler.report()}
+    assert rows["catalog_utils.total_credits"]["max_size"] == 3
+    assert rows["schedule_utils.get_duplicates"]["max_size"] == 2
+
+
+def test_enable_disable():
+    profiler = profiling.Profiler()
+    profiler.register(schedule_utils)
+    original = schedule_utils.get_duplicates
+    schedule = [{"A"}, {"A", "B"}]
+
+    profiler.enable()
+    try:
+        assert schedule_utils.get_duplicates is not original
+        assert schedule_utils.get_duplicates(schedule) == {"A"}
+        schedule_utils.get_duplicates(schedule)
+    finally:
+        profiler.disable()
+    assert schedule_utils.get_duplicates is original
+
+    # Nothing is recorded while disabled
+    schedule_utils.get_duplicates(schedule)
+    rows = {row["name"]: row for row in profiler.report()}
+    assert rows["schedule_utils.get_duplicates"]["count"] == 2
+    assert rows["schedule_utils.get_duplicates"]["max_size"] == 3
+    assert rows["schedule_utils.get_duplicates"]["p99"] > 0
+
+
+def test_register_methods():
+    class Widget:
+        def update(self, items):
+            return len(items)
+
+    profiler = profiling.Profiler()
+    profiler.register(Widget, ["update"], prefix="Widget.")
+    profiler.enable()
+    try:
+        assert Widget().update([1, 2]) == 2
+    finally:
+        profiler.disable()
+    assert profiler.report()[0]["name"] == "Widget.update"
+
+
+def test_enable_after_binding():
+    class Widget:
+        def selected(self, name):
+            return name
+
+    widget = Widget()
+    # Like the GUI's trace callbacks: bound before profiling is switched on
+    saved = widget.selected
+
+    def looked_up(*args):
+        return widget.selected(*args)
+
+    profiler = profiling.Profiler()
+    profiler.register(Widget, ["selected"], prefix="Widget.")
+    profiler.enable()
+    try:
+        assert looked_up("var_1_0") == "var_1_0"
+        assert saved("var_1_0") == "var_1_0"
+    finally:
+        profiler.disable()
+    assert [(row["name"], row["count"]) for row in profiler.report()] == [("Widget.selected", 1)]
+
+
+def test_default_profiler_covers_modules():
+    names = {label for _, _, label, _ in profiling.default_profiler.targets}
+    assert "catalog_utils.check_prerequisites" in names
+    assert "catalog_utils.parse_credits" in names
+    assert "schedule_utils.load_schedule" in names
+    assert "catalog_utils.Catalog" not in names
+
+
+def test_exports(tmp_path):
+    profiler = profiling.Profiler()
+    with pytest.raises(ValueError):
+        profiler.export_pstats(tmp_path / "none.prof")
+
+    profiler.register(catalog_utils, ["load_catalog"])
+    profiler.enable()
+    try:
+        catalog_utils.load_catalog("japn_catalog.json")
+        profiler.export_pstats(str(tmp_path / "out.prof"))
+        assert profiler.enabled
+    finally:
+        profiler.disable()
+    profiler.export_json(tmp_path / "out.json")
+
+    report = json.loads((tmp_path / "out.json").read_text())
+    assert report[0]["name"] == "catalog_utils.load_catalog"
+    assert report[0]["count"] == 1
+    stats = pstats.Stats(str(tmp_path / "out.prof"))
+    assert any(func[2] == "load_catalog" for func in stats.stats)
+
+    profiler.reset()
+    assert profiler.report() == []
+
+
+def test_enable_from_env(monkeypatch):
+    monkeypatch.setenv(profiling.ENV_VAR, "0")
+    assert not profiling.enable_from_env()
+    assert not profiling.default_profiler.enabled
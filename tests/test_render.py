@@ -0,0 +1,36 @@
+"""Unit tests for render.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import catalog_utils
+import render
+
+
+def test_render_cache():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    cache = render.RenderCache(maxsize=2)
+
+    page = cache.render("JAPN 231", catalog)
+    assert page == catalog_utils.format_course_info("JAPN 231", catalog)
+    assert cache.render("JAPN 231", catalog) is page
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    assert cache.render("JAPN 231", catalog, width=80) != page
+    cache.render("JAPN 101", catalog)
+    assert len(cache) == 2
+    cache.render("JAPN 231", catalog)
+    assert cache.misses == 4
+
+    # A changed catalog has a new version, so old pages are not reused
+    del catalog["JAPN 101"]
+    catalog["JAPN 102"] = dict(catalog["JAPN 102"], prerequisites=set())
+    assert cache.render("JAPN 231", catalog).endswith("Dependencies: JAPN 102")
+
+
+def test_render_all():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    expected = {course: catalog_utils.format_course_info(course, catalog, 60)
+                for course in catalog}
+    assert render.render_all(catalog, 60, processes=1) == expected
+    assert render.render_all(catalog, 60, processes=2, chunksize=4) == expected
@@ -0,0 +1,73 @@
+"""Unit tests for schedule_store.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import io
+
+import pytest
+
+import schedule_utils
+from schedule_store import ScheduleStore, main
+
+
+def test_save_and_load():
+    with ScheduleStore() as store:
+        schedule = [{"CS 149"}, {"CS 159", "MATH 231"}, set(), set()]
+        store.save_schedule("ann", schedule)
+        assert store.load_schedule("ann") == schedule
+
+        # Saving again replaces the old schedule
+        store.save_schedule("ann", [set(), {"CS 149"}])
+        assert store.load_schedule("ann") == [set(), {"CS 149"}]
+
+        with pytest.raises(KeyError):
+            store.load_schedule("nobody")
+        store.delete("ann")
+        store.delete("nobody")
+        assert store.students() == []
+
+
+def test_queries():
+    with ScheduleStore() as store:
+        count = store.save_many([
+            ("ann", [{"CS 149"}, {"CS 159"}]),
+            ("bob", [set(), {"CS 149"}]),
+            ("cal", [{"CS 149"}, {"CS 149"}]),
+        ], batch_size=2)
+        assert count == 3
+        assert store.students() == ["ann", "bob", "cal"]
+        assert store.who_takes("CS 149") == ["ann", "bob", "cal"]
+        assert store.who_takes("CS 149", semester=1) == ["bob", "cal"]
+        assert store.who_takes("CS 999") == []
+        assert store.course_counts() == {"CS 149": 3, "CS 159": 1}
+        assert store.course_counts(semester=1) == {"CS 149": 2, "CS 159": 1}
+
+
+def test_failed_batch_is_rolled_back():
+    with ScheduleStore() as store:
+        with pytest.raises(TypeError):
+            store.save_many([("ann", [{"CS 149"}]), ("bob", None)])
+        assert store.students() == []
+
+
+def test_import_files_and_main(tmp_path):
+    plans = tmp_path / "plans"
+    plans.mkdir()
+    schedule_utils.save_schedule([{"CS 149"}, set(), {"CS 345"}], plans / "ann.json")
+    schedule_utils.save_schedule([set(), set(), {"CS 345"}], plans / "bob.json")
+    (plans / "notes.txt").write_text("not a schedule")
+    extra = tmp_path / "cal.json"
+    schedule_utils.save_schedule([{"CS 345"}], extra)
+
+    database = str(tmp_path / "students.db")
+    out = io.StringIO()
+    assert main([database, "import", str(plans), str(extra)], out) == 0
+    assert out.getvalue() == "Imported 3 schedules\n"
+
+    with ScheduleStore(database) as store:
+        assert store.load_schedule("ann") == [{"CS 149"}, set(), {"CS 345"}]
+
+    out = io.StringIO()
+    main([database, "who", "CS 345", "-s", "2"], out)
+    assert out.getvalue() == "ann\nbob\n"
@@ -0,0 +1,54 @@
+"""Unit tests for search.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import pickle
+
+import catalog_utils
+import search
+
+
+def test_tokenize():
+    assert search.tokenize("Data Structures, I/O & CS 240!") == [
+        "data", "structures", "i", "o", "cs", "240"
+    ]
+    assert search.tokenize(None) == []
+
+
+def test_keyword_search():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    assert search.search_courses("japanese", catalog) == ["JAPN 101", "JAPN 102", "JAPN 231"]
+    # Name matches rank above description matches
+    assert search.search_courses("intermediate", catalog) == ["JAPN 231"]
+    assert search.search_courses("grammar reading", catalog) == ["JAPN 231"]
+    assert search.search_courses("grammar pronunciation", catalog) == []
+    assert search.search_courses("", catalog) == []
+
+
+def test_phrase_and_prefix_search():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    assert search.search_courses('"development of comprehension"', catalog) == ["JAPN 102"]
+    assert search.search_courses('"comprehension of development"', catalog) == []
+    assert search.search_courses("pronun*", catalog) == ["JAPN 102"]
+    assert search.search_courses("JAPN-102", catalog) == ["JAPN 102"]
+    assert set(search.search_courses("japn 10*", catalog)) == {"JAPN 101", "JAPN 102"}
+
+
+def test_ranking_and_limit():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    results = search.get_search_index(catalog).search("programming", limit=3)
+    assert len(results) == 3
+    # Courses with the word in their name come first
+    assert {course for course, _ in results} == {"CS 149", "CS 159", "CS 430"}
+    assert results[0][1] >= results[1][1] >= results[2][1]
+
+
+def test_index_is_cached_and_serializable():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    index = search.get_search_index(catalog)
+    assert search.get_search_index(catalog) is index
+
+    restored = pickle.loads(pickle.dumps(catalog))
+    assert "search" in restored.cache
+    assert search.search_courses("elementary", restored) == ["JAPN 101", "JAPN 102"]
@@ -0,0 +1,158 @@
+"""Unit tests for sharded_catalog.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import io
+import json
+import pickle
+
+import pytest
+
+import catalog_utils
+import cli
+import sharded_catalog
+
+
+@pytest.fixture
+def manifest(tmp_path):
+    """Split the CS catalog into CS and math shards, plus a Japanese shard."""
+    with open("cs_catalog.json") as file:
+        cs_raw = json.load(file)
+    with open("japn_catalog.json") as file:
+        japn_raw = json.load(file)
+    cs = {course: entry for course, entry in cs_raw.items() if course.startswith("CS")}
+    math = {course: entry for course, entry in cs_raw.items() if course not in cs}
+    for name, raw in (("cs", cs), ("math", math), ("japn", japn_raw)):
+        (tmp_path / f"{name}_catalog.json").write_text(json.dumps(raw))
+
+    filename = tmp_path / "all.manifest.json"
+    sharded_catalog.build_manifest(
+        [tmp_path / f"{name}_catalog.json" for name in ("cs", "math", "japn")], filename
+    )
+    return filename
+
+
+def merged_catalog():
+    with open("cs_catalog.json") as file:
+        raw = json.load(file)
+    with open("japn_catalog.json") as file:
+        raw.update(json.load(file))
+    return catalog_utils.json_to_catalog(raw)
+
+
+def test_build_manifest(manifest):
+    shards = json.loads(manifest.read_text())["shards"]
+    assert sorted(shards) == ["cs", "japn", "math"]
+    assert shards["cs"]["file"] == "cs_catalog.json"
+    assert shards["cs"]["requires"] == ["math"]
+    assert shards["cs"]["external"]["CS 240"] == ["CALC"]
+    assert shards["japn"]["requires"] == []
+    assert shards["math"]["external"] == {}
+
+
+def test_lazy_loading(manifest):
+    catalog = sharded_catalog.load_manifest(manifest)
+    merged = merged_catalog()
+    assert catalog.pending == {"cs", "math", "japn"}
+    assert len(catalog) == len(merged)
+    assert "JAPN 102" in catalog and "NOPE" not in catalog
+    assert sorted(catalog) == sorted(merged)
+    assert catalog.pending == {"cs", "math", "japn"}
+
+    assert catalog_utils.total_credits([{"JAPN 101"}, {"JAPN 102"}], catalog) == (8, 8)
+    assert catalog.pending == {"cs", "math"}
+
+    # A closure reads the shards it reaches, and no others
+    catalog = sharded_catalog.load_manifest(manifest)
+    expected = catalog_utils.get_dependencies("CS 240", merged)
+    assert catalog_utils.get_dependencies("CS 240", catalog) == expected
+    assert catalog.pending == {"japn"}
+    assert catalog.get("NOPE") is None
+    with pytest.raises(KeyError):
+        catalog["NOPE"]
+
+    assert catalog == merged
+    assert not catalog.pending
+
+
+def test_whole_catalog_functions(manifest):
+    catalog = sharded_catalog.load_manifest(manifest)
+    merged = merged_catalog()
+    schedule = [{"CS 149", "ALGEBRA"}, {"CS 159"}, set()]
+    assert catalog_utils.check_prerequisites(schedule, catalog) == \
+        catalog_utils.check_prerequisites(schedule, merged)
+    assert not catalog.pending
+    assert catalog_utils.available_classes(schedule, 2, catalog) == \
+        catalog_utils.available_classes(schedule, 2, merged)
+
+
+def test_shards_for_and_preload(manifest):
+    catalog = sharded_catalog.load_manifest(manifest)
+    assert catalog.shards_for(["CS 240", "NOPE"]) == {"cs"}
+    assert catalog.shards_for(["CS 240"], closure=True) == {"cs", "math"}
+    catalog.preload(["JAPN 231"])
+    assert catalog.pending == {"cs", "math"}
+
+
+def test_read_then_merge(manifest):
+    catalog = sharded_catalog.load_manifest(manifest)
+    shards = catalog.read_shards(catalog.shards_for(["JAPN 231", "CS 149"]))
+    assert sorted(shards) == ["cs", "japn"]
+    assert catalog.pending == {"cs", "math", "japn"}
+
+    # A shard loaded in the meantime is not merged twice
+    catalog["JAPN 101"]
+    version = catalog.version
+    catalog.merge_shards(shards)
+    assert catalog.pending == {"math"}
+    assert catalog.version == version
+    assert catalog["CS 149"] == merged_catalog()["CS 149"]
+
+
+def test_changes_and_pickling(manifest):
+    catalog = sharded_catalog.load_manifest(manifest)
+    version = catalog.version
+    del catalog["JAPN 231"]
+    assert not catalog.pending
+    assert catalog.version != version
+    assert "JAPN 231" not in catalog
+    assert len(catalog) == len(merged_catalog()) - 1
+
+    catalog = sharded_catalog.load_manifest(manifest)
+    copy = pickle.loads(pickle.dumps(catalog))
+    assert type(copy) is catalog_utils.Catalog
+    assert copy == merged_catalog()
+
+
+def test_modified_shard(manifest, tmp_path):
+    (tmp_path / "japn_catalog.json").write_text("{}")
+    catalog = sharded_catalog.load_manifest(manifest)
+    with pytest.raises(ValueError):
+        catalog["JAPN 101"]
+
+
+def test_invalid_shards(tmp_path):
+    (tmp_path / "a.json").write_text(json.dumps(
+        {"A 1": {"name": "", "credits": "3", "description": "", "prerequisites": ["B 1"]}}
+    ))
+    (tmp_path / "b.json").write_text(json.dumps(
+        {"B 1": {"name": "", "credits": "3", "description": "", "prerequisites": ["A 1"]}}
+    ))
+    (tmp_path / "c.json").write_text(json.dumps(
+        {"A 1": {"name": "", "credits": "3", "description": "", "prerequisites": []}}
+    ))
+    with pytest.raises(catalog_utils.CatalogError):
+        sharded_catalog.build_manifest([tmp_path / "a.json", tmp_path / "b.json"],
+                                       tmp_path / "x.manifest.json")
+    with pytest.raises(ValueError):
+        sharded_catalog.build_manifest([tmp_path / "a.json", tmp_path / "c.json"],
+                                       tmp_path / "x.manifest.json")
+
+
+def test_cli(manifest):
+    out = io.StringIO()
+    status = cli.main(["--catalog", str(manifest), "credits"], out,
+                      io.StringIO('[["JAPN 101"], ["CS 149"]]\n'))
+    assert status == 0
+    assert json.loads(out.getvalue()) == {"source": "<stdin>:1", "min": 7, "max": 7}
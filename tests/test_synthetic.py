@@ -0,0 +1,42 @@
+"""Unit tests for synthetic.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import catalog_utils
+import synthetic
+
+
+def test_generate_catalog_is_valid(tmp_path):
+    raw = synthetic.generate_catalog(500, depth=6, fan_in=4, seed=3)
+    assert len(raw) == 500
+    filename = tmp_path / "synthetic.json"
+    synthetic.write_catalog(raw, filename)
+
+    # load_catalog rejects cycles, dangling prerequisites and bad credits
+    catalog = catalog_utils.load_catalog(filename)
+    analysis = catalog_utils.get_analysis(catalog)
+    assert max(analysis.depth) == 5
+    assert all(len(course["prerequisites"]) <= 4 for course in catalog.values())
+
+
+def test_generate_is_seeded():
+    assert synthetic.generate_catalog(50, seed=1) == synthetic.generate_catalog(50, seed=1)
+    assert synthetic.generate_catalog(50, seed=1) != synthetic.generate_catalog(50, seed=2)
+
+
+def test_small_catalog():
+    raw = synthetic.generate_catalog(3, depth=8)
+    assert sorted(raw) == ["SYN 0", "SYN 1", "SYN 2"]
+    assert raw["SYN 0"]["prerequisites"] == []
+    assert "SYN 1" in raw["SYN 2"]["prerequisites"]
+
+
+def test_generate_schedule():
+    catalog = catalog_utils.json_to_catalog(synthetic.generate_catalog(200))
+    schedule = synthetic.generate_schedule(catalog, num_semesters=4, per_semester=3, seed=5)
+    assert len(schedule) == 4
+    assert all(len(semester) == 3 for semester in schedule)
+    courses = [course for semester in schedule for course in sorted(semester)]
+    assert courses == sorted(courses)
+    assert synthetic.generate_schedule(catalog, seed=5) == synthetic.generate_schedule(catalog, seed=5)
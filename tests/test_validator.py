@@ -0,0 +1,82 @@
+"""Unit tests for validator.
+
+Author: Aiden Aquino
+Version: 10/18/26
+"""
+import random
+
+import catalog_utils
+import schedule_utils
+import validator
+
+
+def test_reasons():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    schedule = [{"JAPN 102", "JAPN 231"}, {"JAPN 101"}, set(), set()]
+    checker = validator.ScheduleValidator(catalog, schedule)
+    assert checker.unmet == {"JAPN 102", "JAPN 231"}
+    assert checker.violations["JAPN 102"] == [{
+        "course": "JAPN 102",
+        "prerequisite": "JAPN 101",
+        "reason": "order",
+        "semester": 0,
+        "prerequisite_semester": 1,
+    }]
+    assert checker.reasons() == [
+        "JAPN 102 requires JAPN 101, which is not taken until a later semester",
+        "JAPN 231 requires JAPN 102, which is taken in the same semester",
+    ]
+
+    checker.remove("JAPN 102", 0)
+    assert checker.reasons() == ["JAPN 231 requires JAPN 102, which is not scheduled"]
+    checker.add("JAPN 102", 2)
+    assert checker.reasons() == [
+        "JAPN 231 requires JAPN 102, which is not taken until a later semester"
+    ]
+    checker.move("JAPN 231", 0, 3)
+    assert checker.valid
+
+
+def test_duplicates():
+    catalog = catalog_utils.load_catalog("japn_catalog.json")
+    checker = validator.ScheduleValidator(catalog)
+    checker.add("JAPN 101", 0)
+    checker.add("JAPN 101", 1)
+    checker.add("NOT A COURSE", 0)
+    checker.add("NOT A COURSE", 2)
+    assert checker.duplicates == {"JAPN 101", "NOT A COURSE"}
+    assert checker.unmet == set()
+
+    checker.remove("JAPN 101", 0)
+    checker.remove("NOT A COURSE", 2)
+    assert checker.valid
+
+
+def test_unknown_prerequisite():
+    catalog = {
+        "A": {"credits": (3,), "prerequisites": ["MISSING"]},
+    }
+    checker = validator.ScheduleValidator(catalog, [{"A"}])
+    assert checker.reasons() == ["A requires MISSING, which is not in the catalog"]
+
+
+def test_random_edits_match_full_checks():
+    catalog = catalog_utils.load_catalog("cs_catalog.json")
+    rng = random.Random(361)
+    schedule = [set() for _ in range(9)]
+    checker = validator.ScheduleValidator(catalog, schedule)
+    courses = sorted(catalog)
+
+    for _ in range(200):
+        sem = rng.randrange(9)
+        if schedule[sem] and rng.random() < 0.4:
+            course = rng.choice(sorted(schedule[sem]))
+            schedule[sem].remove(course)
+            checker.remove(course, sem)
+        else:
+            course = rng.choice(courses)
+            if course not in schedule[sem]:
+                schedule[sem].add(course)
+                checker.add(course, sem)
+        assert checker.unmet == catalog_utils.check_prerequisites(schedule, catalog)
+        assert checker.duplicates == schedule_utils.get_duplicates(schedule)